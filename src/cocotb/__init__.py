@@ -5,23 +5,36 @@
 # SPDX-License-Identifier: BSD-3-Clause
 from __future__ import annotations
 
-from logging import Logger
-from types import SimpleNamespace
-
-from cocotb._decorators import Param, parametrize, skipif, test, xfail
-from cocotb._test_manager import create_task, end_test, pass_test, start, start_soon
-from cocotb.handle import SimHandleBase
-
-from ._version import __version__ as _version
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from types import SimpleNamespace
+
+    from cocotb._decorators import Param, parametrize, skipif, test, xfail
+    from cocotb._driver import StimulusDriver, drive_on
+    from cocotb._sampler import Sampler, sample_on
+    from cocotb._test_manager import (
+        create_task,
+        end_test,
+        pass_test,
+        start,
+        start_soon,
+    )
+    from cocotb.handle import SimHandleBase
 
 __all__ = (
     "RANDOM_SEED",
     "SIM_NAME",
     "SIM_VERSION",
     "Param",
+    "Sampler",
+    "StimulusDriver",
     "__version__",
     "argv",
     "create_task",
+    "drive_on",
     "end_test",
     "is_simulation",
     "log",
@@ -29,6 +42,7 @@ __all__ = (
     "parametrize",
     "pass_test",
     "plusargs",
+    "sample_on",
     "skipif",
     "start",
     "start_soon",
@@ -37,23 +51,49 @@ __all__ = (
     "xfail",
 )
 
-# Set __module__ on re-exports
-for thing in [
-    test,
-    parametrize,
-    Param,
-    skipif,
-    xfail,
-    start_soon,
-    start,
-    create_task,
-    pass_test,
-    end_test,
-]:
+# Re-exports are only imported when first used, so importing cocotb is fast.
+_lazy_exports: dict[str, str] = {
+    "test": "cocotb._decorators",
+    "parametrize": "cocotb._decorators",
+    "Param": "cocotb._decorators",
+    "skipif": "cocotb._decorators",
+    "xfail": "cocotb._decorators",
+    "start_soon": "cocotb._test_manager",
+    "start": "cocotb._test_manager",
+    "create_task": "cocotb._test_manager",
+    "pass_test": "cocotb._test_manager",
+    "end_test": "cocotb._test_manager",
+    "Sampler": "cocotb._sampler",
+    "sample_on": "cocotb._sampler",
+    "StimulusDriver": "cocotb._driver",
+    "drive_on": "cocotb._driver",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name == "__version__":
+        # importlib.metadata is slow to import, so the version is only looked up when it's used.
+        from cocotb._version import __version__  # noqa: PLC0415
+
+        globals()[name] = __version__
+        return __version__
+
+    try:
+        module_name = _lazy_exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    thing = getattr(importlib.import_module(module_name), name)
+    # Set __module__ on re-exports
     thing.__module__ = __name__
+    globals()[name] = thing
+    return thing
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_exports, "__version__"})
 
 
-__version__: str = _version
+__version__: str
 """The version of cocotb."""
 
 
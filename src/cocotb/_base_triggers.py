@@ -12,6 +12,7 @@ import logging
 import sys
 import warnings
 from abc import abstractmethod
+from collections import deque
 from collections.abc import Generator
 from contextlib import AbstractAsyncContextManager
 from functools import cached_property
@@ -303,27 +304,64 @@ class _InternalEvent(Trigger):
         return self._repr_func()
 
 
-class _Lock(Trigger):
-    """Unique instance used by the Lock object.
+class _AcquireWaiters(deque["_Acquire"]):
+    """FIFO of :class:`_Acquire` Triggers waiting on a Lock or Semaphore.
 
-    One created for each attempt to acquire the Lock so that the scheduler
+    Removing a waiter only marks it as no longer waiting so removal is O(1);
+    stale entries are skipped by :meth:`pop_next` and compacted away when they
+    make up more than half of the queue.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.num_waiting: int = 0
+
+    def add(self, acquire: _Acquire) -> None:
+        acquire._waiting = True
+        self.num_waiting += 1
+        self.append(acquire)
+
+    def discard(self, acquire: _Acquire) -> None:
+        if acquire._waiting:
+            acquire._waiting = False
+            self.num_waiting -= 1
+            if len(self) > 2 * self.num_waiting + 8:
+                live = [a for a in self if a._waiting]
+                self.clear()
+                self.extend(live)
+
+    def pop_next(self) -> _Acquire | None:
+        while self:
+            acquire = self.popleft()
+            if acquire._waiting:
+                acquire._waiting = False
+                self.num_waiting -= 1
+                return acquire
+        return None
+
+
+class _Acquire(Trigger):
+    """Unique instance used by the Lock and Semaphore objects.
+
+    One created for each attempt to acquire the Lock or Semaphore so that the scheduler
     can maintain a unique mapping of triggers to tasks.
     """
 
-    def __init__(self, parent: Lock) -> None:
+    def __init__(self, parent: Lock | Semaphore) -> None:
         super().__init__()
         self._parent = parent
+        self._waiting: bool = False
 
     def _prime(self) -> None:
-        self._parent._prime_lock(self)
+        self._parent._prime_acquire(self)
 
     def _unprime(self) -> None:
-        self._parent._unprime_lock(self)
+        self._parent._waiters.discard(self)
 
     def __await__(self) -> Generator[Self, None, Self]:
         if self._parent._is_used(self):
             raise RuntimeError(
-                "Lock.acquire() result can only be used by one task at a time"
+                f"{type(self._parent).__qualname__}.acquire() result can only be used by one task at a time"
             )
         return (yield from super().__await__())
 
@@ -336,6 +374,7 @@ class Lock(AbstractAsyncContextManager[None]):
 
     Guarantees fair scheduling.
     Lock acquisition is given in order of attempted lock acquisition.
+    On :meth:`release` ownership is handed directly to the next waiting Task.
 
     Usage:
         By directly calling :meth:`acquire` and :meth:`release`.
@@ -363,10 +402,14 @@ class Lock(AbstractAsyncContextManager[None]):
 
         The lock can be used as an asynchronous context manager in an
         :keyword:`async with` statement
+
+    .. versionchanged:: 2.1
+
+        Entering an unlocked Lock with :keyword:`async with` no longer yields to the scheduler.
     """
 
     def __init__(self, name: str | None = None) -> None:
-        self._pending_primed: list[_Lock] = []
+        self._waiters = _AcquireWaiters()
         self._name: str | None = None
         if name is not None:
             warnings.warn(
@@ -375,7 +418,7 @@ class Lock(AbstractAsyncContextManager[None]):
                 stacklevel=2,
             )
             self._name = name
-        self._current_acquired: _Lock | None = None
+        self._current_acquired: _Acquire | None = None
 
     @property
     @deprecated("The 'name' field will be removed in a future release.")
@@ -400,40 +443,34 @@ class Lock(AbstractAsyncContextManager[None]):
         """
         return self._current_acquired is not None
 
-    def _acquire_and_fire(self, lock: _Lock) -> None:
+    def _acquire_and_fire(self, lock: _Acquire) -> None:
         self._current_acquired = lock
         lock._react()
 
-    def _prime_lock(self, lock: _Lock) -> None:
+    def _prime_acquire(self, lock: _Acquire) -> None:
         if self._current_acquired is None:
             self._acquire_and_fire(lock)
         else:
-            self._pending_primed.append(lock)
+            self._waiters.add(lock)
 
-    def _unprime_lock(self, lock: _Lock) -> None:
-        if lock in self._pending_primed:
-            self._pending_primed.remove(lock)
-
-    def _is_used(self, lock: _Lock) -> bool:
-        return lock is self._current_acquired or lock in self._pending_primed
+    def _is_used(self, lock: _Acquire) -> bool:
+        return lock is self._current_acquired or lock._waiting
 
     def acquire(self) -> Trigger:
         """Produce a trigger which fires when the lock is acquired."""
-        return _Lock(self)
+        return _Acquire(self)
 
     def release(self) -> None:
         """Release the lock."""
         if self._current_acquired is None:
             raise RuntimeError(f"Attempt to release an unacquired Lock {self!s}")
 
-        self._current_acquired = None
-
-        # nobody waiting for this lock
-        if not self._pending_primed:
-            return
-
-        lock = self._pending_primed.pop(0)
-        self._acquire_and_fire(lock)
+        lock = self._waiters.pop_next()
+        if lock is None:
+            # nobody waiting for this lock
+            self._current_acquired = None
+        else:
+            self._acquire_and_fire(lock)
 
     def __repr__(self) -> str:
         if self._name is None:
@@ -443,17 +480,123 @@ class Lock(AbstractAsyncContextManager[None]):
         return fmt.format(
             type(self).__qualname__,
             self._name,
-            len(self._pending_primed),
+            self._waiters.num_waiting,
             pointer_str(self),
         )
 
     async def __aenter__(self) -> None:
-        await self.acquire()
+        if self._current_acquired is None:
+            # Uncontended, take the lock without going through the scheduler.
+            self._current_acquired = _Acquire(self)
+        else:
+            await self.acquire()
+
+    async def __aexit__(self, *args: object) -> None:
+        self.release()
+
+
+class Semaphore(AbstractAsyncContextManager[None]):
+    """A counting semaphore.
+
+    Manages an internal counter which is decremented by each acquisition and incremented by each :meth:`release`.
+    When the counter is zero, acquisition blocks until another Task calls :meth:`release`.
+
+    Guarantees fair scheduling.
+    Acquisition is given in order of attempted acquisition.
+    On :meth:`release` the permit is handed directly to the next waiting Task.
+
+    Args:
+        value: The initial value of the internal counter.
+
+    Raises:
+        ValueError: If *value* is less than ``0``.
+
+    Usage:
+        .. code-block:: python
+
+            # allow at most 4 outstanding bus transactions
+            outstanding = Semaphore(4)
+
+
+            async def issue(txn):
+                async with outstanding:
+                    await drive(txn)
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, value: int = 1) -> None:
+        if value < 0:
+            raise ValueError(f"Semaphore initial value must be >= 0, not {value!r}")
+        self._value: int = value
+        self._waiters = _AcquireWaiters()
+
+    def locked(self) -> bool:
+        """Return ``True`` if the semaphore cannot be acquired immediately."""
+        return self._value == 0
+
+    def _prime_acquire(self, acquire: _Acquire) -> None:
+        # Permits are handed directly to waiters on release,
+        # so a non-zero value implies there are no waiters.
+        if self._value > 0:
+            self._value -= 1
+            acquire._react()
+        else:
+            self._waiters.add(acquire)
+
+    def _is_used(self, acquire: _Acquire) -> bool:
+        return acquire._waiting
+
+    def acquire(self) -> Trigger:
+        """Produce a trigger which fires when the semaphore is acquired."""
+        return _Acquire(self)
+
+    def release(self) -> None:
+        """Release the semaphore, waking the next waiting Task if there is one."""
+        acquire = self._waiters.pop_next()
+        if acquire is None:
+            self._value += 1
+        else:
+            acquire._react()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} [value={self._value}, {self._waiters.num_waiting} waiting] at {pointer_str(self)}>"
+
+    async def __aenter__(self) -> None:
+        if self._value > 0:
+            # Uncontended, take a permit without going through the scheduler.
+            self._value -= 1
+        else:
+            await self.acquire()
 
     async def __aexit__(self, *args: object) -> None:
         self.release()
 
 
+class BoundedSemaphore(Semaphore):
+    """A :class:`Semaphore` which raises :exc:`ValueError` if released more times than it was acquired.
+
+    Args:
+        value: The initial, and maximum, value of the internal counter.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, value: int = 1) -> None:
+        super().__init__(value)
+        self._bound_value: int = value
+
+    def release(self) -> None:
+        """Release the semaphore, waking the next waiting Task if there is one.
+
+        Raises:
+            ValueError: If this would increase the internal counter above its initial value.
+        """
+        if self._value >= self._bound_value:
+            raise ValueError(f"{type(self).__qualname__} released too many times")
+        super().release()
+
+
 class NullTrigger(Trigger):
     """Trigger that fires immediately.
 
@@ -6,12 +6,14 @@
 from __future__ import annotations
 
 import inspect
+import math
+import random
 import sys
-from collections.abc import Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Coroutine, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from itertools import product
-from typing import Any, Callable, cast, overload
+from typing import TYPE_CHECKING, Any, Callable, cast, overload
 
 from cocotb._base_triggers import Trigger
 from cocotb.simtime import TimeUnit
@@ -19,7 +21,8 @@ from cocotb.simtime import TimeUnit
 if sys.version_info >= (3, 10):
     from typing import TypeAlias
 
-import pytest
+if TYPE_CHECKING:
+    import pytest
 
 
 class Test:
@@ -64,6 +67,9 @@ class Test:
         stage:
             Order tests logically into stages.
             Tests from earlier stages are run before tests from later stages.
+
+        checkpoint:
+            Run this test before all others and start the others from the state of the simulation it leaves.
     """
 
     # TODO Replace with dataclass in Python 3.7+
@@ -85,6 +91,7 @@ class Test:
         ],
         skip: bool,
         stage: int,
+        checkpoint: bool = False,
     ) -> None:
         self.func = func
         self.args = args
@@ -97,6 +104,7 @@ class Test:
         self.expect_error = expect_error
         self.skip = skip
         self.stage = stage
+        self.checkpoint = checkpoint
 
     @property
     def fullname(self) -> str:
@@ -154,6 +162,8 @@ class TestGenerator:
         ] = set()
         self.skip = False
         self.stage = 0
+        self.checkpoint = False
+        self.sample: int | None = None
         self.name = self.func.__qualname__
         self.module = self.func.__module__
         self.doc = self.func.__doc__
@@ -166,6 +176,51 @@ class TestGenerator:
         ] = []
 
     def generate_tests(self) -> Iterable[Test]:
+        for _, test in self._generate_tests():
+            yield test
+
+    def _sample_indexes(self, sizes: Sequence[int], seed: int) -> list[tuple[int, ...]]:
+        """Pick :attr:`sample` combinations of options with the given numbers of values, in the order they are generated in."""
+        assert self.sample is not None
+        total = math.prod(sizes)
+        # Seeded by the test so each process running the regression with the same seed picks the same tests.
+        rng = random.Random(f"{seed}/{self.module}.{self.name}")
+        if total <= sys.maxsize:
+            combinations = rng.sample(range(total), min(self.sample, total))
+        else:
+            # random.sample() can't index a range this large, and picking
+            # so few of so many combinations rarely draws one twice
+            picked: set[int] = set()
+            while len(picked) < self.sample:
+                picked.add(rng.randrange(total))
+            combinations = list(picked)
+        result: list[tuple[int, ...]] = []
+        for combination in sorted(combinations):
+            # the last option changes fastest, as in itertools.product
+            rest = combination
+            selected_options: list[int] = []
+            for size in reversed(sizes):
+                rest, select_idx = divmod(rest, size)
+                selected_options.append(select_idx)
+            result.append(tuple(reversed(selected_options)))
+        return result
+
+    def _generate_tests(
+        self,
+        *,
+        indexes: Iterable[tuple[int, ...]] | None = None,
+        include: Callable[[str], bool] | None = None,
+        seed: int = 0,
+    ) -> Iterator[tuple[tuple[int, ...], Test]]:
+        """Generate tests along with the index of the value of each option they were given.
+
+        Args:
+            indexes: Generate only the tests given these option value indexes,
+                instead of every combination or a random :attr:`sample` of them.
+            include: Generate only the tests whose full names this returns ``True`` for.
+                Names are made before the tests, so tests left out cost little.
+            seed: The :envvar:`COCOTB_RANDOM_SEED` of the regression, which picks the :attr:`sample`.
+        """
         option_reprs: dict[str, list[str]] = {}
 
         for name, values in self.options:
@@ -182,51 +237,92 @@ class TestGenerator:
                 for n, vs in transformed.items():
                     option_reprs[n] = _reprs(vs)
 
-        # this value is a list of ranges of the same length as each set of values in self.options for passing to itertools.product
-        option_indexes = [range(len(option[1])) for option in self.options]
-
-        # go through the cartesian product of all values of all options
-        for selected_options in product(*option_indexes):
-            test_kwargs: dict[str, object] = {}
-            test_name_pieces: list[str] = [self.name]
-            for option_idx, select_idx in enumerate(selected_options):
-                option_name, option_values = self.options[option_idx]
-                selected_value = option_values[select_idx]
-
+        # the name piece and keyword arguments given by each value of each option,
+        # so each test only joins those of the values it was given
+        option_pieces: list[list[str]] = []
+        option_kwargs: list[list[dict[str, object]]] = []
+        for option_name, option_values in self.options:
+            pieces: list[str] = []
+            kwargs: list[dict[str, object]] = []
+            for select_idx, selected_value in enumerate(option_values):
                 if isinstance(option_name, str):
                     # single params per option
-                    selected_value = (
-                        selected_value.value
-                        if isinstance(selected_value, Param)
-                        else selected_value
-                    )
-                    selected_value = cast("Sequence[object]", selected_value)
-                    test_kwargs[option_name] = selected_value
-                    test_name_pieces.append(
+                    pieces.append(
                         f"/{option_name}={option_reprs[option_name][select_idx]}"
                     )
+                    kwargs.append(
+                        {
+                            option_name: selected_value.value
+                            if isinstance(selected_value, Param)
+                            else selected_value
+                        }
+                    )
                 else:
                     # multiple params per option
                     selected_value = cast("Sequence[object]", selected_value)
-                    for n, vn in zip(option_name, selected_value):
-                        v = vn.value if isinstance(vn, Param) else vn
-                        test_kwargs[n] = v
-                        test_name_pieces.append(f"/{n}={option_reprs[n][select_idx]}")
-
-            parametrized_test_name = "".join(test_name_pieces)
-
-            yield Test(
-                func=self.func,
-                args=(),
-                kwargs=test_kwargs,
-                name=parametrized_test_name,
-                module=self.module,
-                doc=self.doc,
-                timeout=self.timeout,
-                expect_fail=self.expect_fail,
-                expect_error=tuple(self.expect_error),
-                skip=self.skip,
-                stage=self.stage,
+                    pieces.append(
+                        "".join(
+                            f"/{n}={option_reprs[n][select_idx]}"
+                            for n, _ in zip(option_name, selected_value)
+                        )
+                    )
+                    kwargs.append(
+                        {
+                            n: vn.value if isinstance(vn, Param) else vn
+                            for n, vn in zip(option_name, selected_value)
+                        }
+                    )
+            option_pieces.append(pieces)
+            option_kwargs.append(kwargs)
+
+        combinations: Iterable[tuple[tuple[int, ...], Sequence[str]]]
+        if indexes is None and self.sample is None:
+            # go through the cartesian product of all values of all options
+            combinations = zip(
+                product(*(range(len(pieces)) for pieces in option_pieces)),
+                product(*option_pieces),
+            )
+        else:
+            if indexes is None:
+                indexes = self._sample_indexes([len(p) for p in option_pieces], seed)
+            combinations = (
+                (
+                    selected_options,
+                    [
+                        option_pieces[option_idx][select_idx]
+                        for option_idx, select_idx in enumerate(selected_options)
+                    ],
+                )
+                for selected_options in indexes
+            )
+
+        fullname = f"{self.module}.{self.name}"
+        for selected_options, name_pieces in combinations:
+            name_suffix = "".join(name_pieces)
+            if include is not None and not include(fullname + name_suffix):
+                continue
+            parametrized_test_name = self.name + name_suffix
+
+            test_kwargs: dict[str, object] = {}
+            for option_idx, select_idx in enumerate(selected_options):
+                test_kwargs.update(option_kwargs[option_idx][select_idx])
+
+            yield (
+                tuple(selected_options),
+                Test(
+                    func=self.func,
+                    args=(),
+                    kwargs=test_kwargs,
+                    name=parametrized_test_name,
+                    module=self.module,
+                    doc=self.doc,
+                    timeout=self.timeout,
+                    expect_fail=self.expect_fail,
+                    expect_error=tuple(self.expect_error),
+                    skip=self.skip,
+                    stage=self.stage,
+                    checkpoint=self.checkpoint,
+                ),
             )
 
 
@@ -276,6 +372,8 @@ def test(
     skip: bool = False,
     stage: int = 0,
     name: str | None = None,
+    checkpoint: bool = False,
+    sample: int | None = None,
 ) -> Callable[[TestFuncType | TestGenerator], TestGenerator]: ...
 
 
@@ -289,6 +387,8 @@ def test(
     skip: bool | None = None,
     stage: int | None = None,
     name: str | None = None,
+    checkpoint: bool | None = None,
+    sample: int | None = None,
 ) -> TestGenerator | Callable[[TestFuncType | TestGenerator], TestGenerator]:
     r"""
     Decorator to register a Callable which returns a Coroutine as a test.
@@ -362,6 +462,31 @@ def test(
 
             .. versionadded:: 2.0
 
+        checkpoint:
+            Run this test first, regardless of its *stage*, and start all other tests from the state of the simulation when it finishes,
+            instead of from time zero.
+            This is useful for a reset or configuration sequence that every test would otherwise repeat.
+
+            The state of the design and the simulation time are saved when this test passes
+            and restored before each other test starts.
+            If the simulator can't save its state, a warning is logged,
+            and the other tests run one after another after this test as if it wasn't a checkpoint.
+            Tasks started by this test, such as clocks, are not part of the saved state and must be restarted by each test.
+            If this test fails, all other tests are skipped.
+            Only one test in a regression may be a checkpoint.
+
+            Only Verilator models built with ``--savable`` can save their state.
+
+            .. versionadded:: 2.1
+
+        sample:
+            Run only this many of the tests generated by :deco:`cocotb.parametrize`, picked at random.
+            Tests are picked without generating all combinations of the parameters,
+            so a small sample of a large parameter space is cheap.
+            The same tests are picked for the same :envvar:`COCOTB_RANDOM_SEED`.
+
+            .. versionadded:: 2.1
+
     Returns:
         The test function to which the decorator is applied.
 
@@ -402,6 +527,9 @@ def test(
     elif obj is not None:
         return TestGenerator(obj)
 
+    if sample is not None and sample < 1:
+        raise ValueError(f"sample must be at least 1, got {sample}")
+
     def wrapper(obj: TestFuncType | TestGenerator) -> TestGenerator:
         if not isinstance(obj, TestGenerator):
             obj = TestGenerator(obj)
@@ -421,6 +549,10 @@ def test(
             obj.stage = stage
         if name is not None:
             obj.name = name
+        if checkpoint is not None:
+            obj.checkpoint = checkpoint
+        if sample is not None:
+            obj.sample = sample
         return obj
 
     return wrapper
@@ -510,6 +642,10 @@ def parametrize(
     See :class:`Param` to customize the
     generated test name while still passing the original values to the test.
 
+    Tests are generated when the regression starts, not when the test function is decorated.
+    Only the tests matching :envvar:`COCOTB_TEST_FILTER` are generated,
+    and the *sample* argument of :deco:`cocotb.test` runs only some of them, picked at random.
+
 
     Args:
         options_by_tuple:
@@ -595,14 +731,16 @@ def skipif(
     return decorator
 
 
-_single_exception_types = (
-    type,
-    *(
-        (pytest.RaisesExc, pytest.RaisesGroup)
-        if hasattr(pytest, "RaisesExc") and hasattr(pytest, "RaisesGroup")
-        else ()
-    ),
-)
+def _single_exception_types() -> tuple[type[Any], ...]:
+    # pytest is slow to import, and RaisesExc and RaisesGroup objects can only exist if it was already imported.
+    pytest_module = sys.modules.get("pytest")
+    if (
+        pytest_module is not None
+        and hasattr(pytest_module, "RaisesExc")
+        and hasattr(pytest_module, "RaisesGroup")
+    ):
+        return (type, pytest_module.RaisesExc, pytest_module.RaisesGroup)
+    return (type,)
 
 
 def xfail(
@@ -652,7 +790,8 @@ def xfail(
             obj = TestGenerator(obj)
         if condition:
             if raises is not None:
-                if isinstance(raises, _single_exception_types):
+                single_exception_types = _single_exception_types()
+                if isinstance(raises, single_exception_types):
                     obj.expect_error.add(raises)
                 else:
                     try:
@@ -663,7 +802,7 @@ def xfail(
                         ) from None
                     else:
                         for exc in it:
-                            if not isinstance(exc, _single_exception_types):
+                            if not isinstance(exc, single_exception_types):
                                 raise TypeError(
                                     "Expected error types must be exception types"
                                 )
@@ -0,0 +1,166 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""On-disk list of the tests in each test module, reused across simulation runs.
+
+:meth:`.RegressionManager.discover_tests` saves the names of the tests it finds in a module,
+with the hashes of the source files of all local modules loaded while discovering them,
+to the file named by :envvar:`COCOTB_DISCOVERY_CACHE`.
+While none of those files change, later runs with :envvar:`COCOTB_TEST_FILTER` know which tests
+a module has without importing it, so they skip importing modules without a matching test,
+and generate only the matching tests of :deco:`cocotb.parametrize`\\ d test functions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import sysconfig
+import tempfile
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from cocotb_tools import _env
+
+_FORMAT_VERSION = 2
+
+_log = logging.getLogger("cocotb.regression")
+
+
+class CachedTest(NamedTuple):
+    """A test found in a test module."""
+
+    attr: str
+    """Name of the :class:`.Test` or :class:`.TestGenerator` in the module."""
+    indexes: tuple[int, ...] | None
+    """For a generated test, the index of the value of each option it was given."""
+    fullname: str
+    checkpoint: bool
+
+
+def _hash_file(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _installed_paths() -> list[Path]:
+    paths = sysconfig.get_paths()
+    return [
+        Path(paths[name]).resolve()
+        for name in ("stdlib", "platstdlib", "purelib", "platlib")
+        if name in paths
+    ]
+
+
+def local_files() -> list[str]:
+    """Return the source files of the loaded modules which aren't installed.
+
+    Tests can be defined or parametrized in those modules,
+    while modules in the standard library and site-packages don't change between runs.
+    All of them are returned, not only those a test module imports,
+    as a test module can use a module which something else imported first.
+    """
+    installed = _installed_paths()
+    files: dict[str, None] = {}
+    for module in list(sys.modules.values()):
+        file = getattr(module, "__file__", None)
+        if file is None:
+            continue
+        path = Path(file).resolve()
+        if not any(path.is_relative_to(directory) for directory in installed):
+            files[str(path)] = None
+    return list(files)
+
+
+class DiscoveryCache:
+    """The tests of each test module, valid while none of the local modules' files change.
+
+    A change to any file discovers the tests of every module again,
+    as it isn't known which of the loaded modules each test module depends on.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._files: dict[str, str] = {}
+        self._modules: dict[str, list[list[Any]]] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _log.warning("Ignoring unreadable discovery cache %s: %s", self.path, e)
+            return
+        if data.get("version") != _FORMAT_VERSION:
+            return
+        for path, digest in data["files"].items():
+            if _hash_file(path) != digest:
+                _log.debug("Discovering all tests again, %s changed", path)
+                return
+        self._files = data["files"]
+        self._modules = data["modules"]
+
+    def save(self) -> None:
+        for path in local_files():
+            if path not in self._files:
+                digest = _hash_file(path)
+                if digest is not None:
+                    self._files[path] = digest
+                    self._dirty = True
+        if not self._dirty:
+            return
+        data: dict[str, Any] = {
+            "version": _FORMAT_VERSION,
+            "files": self._files,
+            "modules": self._modules,
+        }
+        # Write to a temporary file and rename it so concurrent runs never see a partial cache.
+        fd, name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        tmp = Path(name)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            tmp.replace(self.path)
+        except BaseException:
+            tmp.unlink()
+            raise
+        self._dirty = False
+
+    def get(self, module_name: str) -> list[CachedTest] | None:
+        """Return the tests in the module *module_name*, or ``None`` if they aren't cached."""
+        tests = self._modules.get(module_name)
+        if tests is None:
+            return None
+        return [
+            CachedTest(
+                attr, None if indexes is None else tuple(indexes), fullname, checkpoint
+            )
+            for attr, indexes, fullname, checkpoint in tests
+        ]
+
+    def add(self, module_name: str, tests: list[CachedTest]) -> None:
+        """Record *tests* as all of the tests in the module *module_name*.
+
+        The files of the modules loaded by then are recorded by :meth:`save`.
+        """
+        self._modules[module_name] = [list(test) for test in tests]
+        self._dirty = True
+
+
+def from_env() -> DiscoveryCache | None:
+    """Return the cache named by :envvar:`COCOTB_DISCOVERY_CACHE`, or ``None`` if it isn't set."""
+    path = _env.get_str("COCOTB_DISCOVERY_CACHE")
+    if not path:
+        return None
+    cache = DiscoveryCache(Path(path).absolute())
+    cache.load()
+    return cache
@@ -0,0 +1,301 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Replaying of precomputed stimulus on clock edges without resuming Python."""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from typing import Any, Callable
+
+import cocotb
+import cocotb._event_loop
+import cocotb.simulator
+from cocotb._base_triggers import Trigger
+from cocotb._profiling import profiling_context
+from cocotb.handle import (
+    EnumObject,
+    IntegerObject,
+    LogicArrayObject,
+    LogicObject,
+    RealObject,
+    StringObject,
+    ValueObjectBase,
+    _GPISetAction,
+)
+from cocotb.task import Task
+from cocotb.triggers import Event, FallingEdge, ReadWrite, RisingEdge, ValueChange
+from cocotb.types import Logic, LogicArray
+
+__all__ = ("StimulusDriver", "drive_on")
+
+
+def _to_int(value: Any, handle: LogicArrayObject | IntegerObject | EnumObject) -> int:
+    # operator.index() accepts NumPy integers as well as int.
+    try:
+        res = operator.index(value)
+    except TypeError:
+        raise TypeError(
+            f"Unsupported type for value assignment to {handle._path}: {type(value)} ({value!r})"
+        ) from None
+    if not handle._min_val <= res <= handle._max_val:
+        raise ValueError(
+            f"Int value ({res!r}) out of range for assignment of {len(handle)!r}-bit signal ({handle._name!r})"
+        )
+    return res
+
+
+def _value_encoder(
+    handle: ValueObjectBase[Any, Any],
+) -> tuple[int, Callable[[Any], Any]]:
+    """Return how to write the value of *handle* natively and how to convert what :meth:`handle.set() <cocotb.handle.ValueObjectBase.set>` accepts into that."""
+    if isinstance(handle, LogicObject):
+
+        def encode_logic(value: Any) -> str:
+            if isinstance(value, LogicArray):
+                if len(value) != 1:
+                    raise ValueError(
+                        f"Cannot assign value of length {len(value)} to handle of length 1"
+                    )
+                return str(value)
+            return str(Logic(value))
+
+        return cocotb.simulator.FORMAT_BINSTR, encode_logic
+
+    elif isinstance(handle, LogicArrayObject):
+        n_bits = len(handle)
+
+        def encode_array(value: Any) -> str:
+            if isinstance(value, (LogicArray, Logic)):
+                value_ = str(value)
+            elif isinstance(value, str):
+                value_ = str(LogicArray(value))
+            else:
+                res = _to_int(value, handle)
+                if res < 0:
+                    res += 1 << n_bits
+                value_ = f"{res:0{n_bits}b}"
+            if len(value_) != n_bits:
+                raise ValueError(
+                    f"Cannot assign value of length {len(value_)} to handle of length {n_bits}"
+                )
+            return value_
+
+        return cocotb.simulator.FORMAT_BINSTR, encode_array
+
+    elif isinstance(handle, (IntegerObject, EnumObject)):
+        n_bits = len(handle)
+        if n_bits <= 32:
+            return cocotb.simulator.FORMAT_INT, lambda value: _to_int(value, handle)
+
+        def encode_wide_int(value: Any) -> str:
+            res = _to_int(value, handle)
+            if res < 0:
+                res += 1 << n_bits
+            return f"{res:0{n_bits}b}"
+
+        return cocotb.simulator.FORMAT_BINSTR, encode_wide_int
+
+    elif isinstance(handle, RealObject):
+        return cocotb.simulator.FORMAT_REAL, float
+
+    elif isinstance(handle, StringObject):
+
+        def encode_bytes(value: Any) -> bytes:
+            if not isinstance(value, (bytes, bytearray)):
+                raise TypeError(
+                    f"Unsupported type for string value assignment: {type(value)} ({value!r})"
+                )
+            return bytes(value)
+
+        return cocotb.simulator.FORMAT_STR, encode_bytes
+
+    raise TypeError(
+        f"Cannot drive {handle!r} of type {type(handle).__qualname__} natively"
+    )
+
+
+class StimulusDriver:
+    r"""Write rows of *stimulus* to *signals* after each *edge*, without resuming Python.
+
+    Each row of *stimulus* holds one value per signal, in the same order as *signals*,
+    of any type that the signal's :attr:`~cocotb.handle.ValueObjectBase.value` setter accepts.
+    *stimulus* can be any iterable of rows, including a generator or a 2-D NumPy array.
+
+    Rows are converted and handed to the GPI in chunks of *chunk_size*.
+    On each *edge* the GPI writes the next row in the ReadWrite phase,
+    just as if a coroutine had :keyword:`await`\ ed *edge* and then set each signal's value,
+    but without the cost of a :class:`~cocotb.task.Task` resumption per cycle.
+    Python is only called on to convert the next chunk when the buffered rows run out.
+
+    Args:
+        edge:
+            A :class:`~cocotb.triggers.RisingEdge`, :class:`~cocotb.triggers.FallingEdge`, or :class:`~cocotb.triggers.ValueChange` of the signal to drive on.
+            Several edges in one time step consume one row.
+        signals: The signals to drive.
+        stimulus: The rows of values to write.
+        chunk_size: The number of rows converted and buffered at once.
+
+    Raises:
+        TypeError: If a signal's type cannot be driven natively.
+        ValueError: If *chunk_size* is less than ``1``.
+
+    Usage:
+        .. code-block:: python
+
+            def stimulus():
+                for _ in range(100_000):
+                    yield (1, random.getrandbits(8))
+
+
+            driver = cocotb.drive_on(
+                RisingEdge(dut.clk), [dut.valid, dut.data], stimulus()
+            )
+            await driver.wait()
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(
+        self,
+        edge: RisingEdge | FallingEdge | ValueChange,
+        signals: Sequence[ValueObjectBase[Any, Any]],
+        stimulus: Iterable[Sequence[Any]],
+        *,
+        chunk_size: int = 1024,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be at least 1")
+        self._edge = edge
+        self._signals = tuple(signals)
+        self._rows = iter(stimulus)
+        self._chunk_size = chunk_size
+        self._encoders: list[Callable[[Any], Any]] = []
+        self._native = cocotb.simulator.driver_create(
+            edge.signal._handle,
+            type(edge)._edge_type,
+            _GPISetAction.DEPOSIT.value,
+        )
+        for signal in self._signals:
+            value_format, encoder = _value_encoder(signal)
+            self._native.add_signal(signal._handle, value_format)
+            self._encoders.append(encoder)
+        self._exhausted = False
+        self._exc: BaseException | None = None
+        self._done = Event()
+        self._task: Task[None] | None = None
+
+    @property
+    def signals(self) -> tuple[ValueObjectBase[Any, Any], ...]:
+        """The signals being driven."""
+        return self._signals
+
+    @property
+    def pending(self) -> int:
+        """The number of converted rows not yet written."""
+        return self._native.size()
+
+    def start(self) -> None:
+        """Convert the first chunk of stimulus and start driving.
+
+        Raises:
+            RuntimeError: If the driver has already been started.
+        """
+        if self._task is not None:
+            raise RuntimeError("Starting driver that has already been started.")
+        self._refill()
+        if self._exhausted and not self._native.size():
+            self._done.set()
+        else:
+            self._native.start(self._on_empty)
+
+        async def run() -> None:
+            try:
+                await self._done.wait()
+                if self._exc is not None:
+                    raise self._exc
+            finally:
+                # Also stop when the test ends without calling stop().
+                self._native.stop()
+
+        self._task = cocotb.start_soon(run())
+
+    def stop(self) -> None:
+        """Stop driving, leaving any remaining stimulus unwritten.
+
+        Raises:
+            RuntimeError: If the driver was never started.
+        """
+        if self._task is None:
+            raise RuntimeError("Stopping driver that was never started.")
+        # The task may not have run yet, in which case cancelling it runs nothing.
+        self._task.cancel()
+        self._task = None
+        self._native.stop()
+
+    def done(self) -> bool:
+        """Return ``True`` if all stimulus has been written."""
+        return self._done.is_set()
+
+    def wait(self) -> Trigger:
+        """Block until all stimulus has been written.
+
+        The returned :class:`~cocotb.triggers.Trigger` fires in the ReadWrite phase in which the last row is written.
+        """
+        return self._done.wait()
+
+    def _encode(self, row: Sequence[Any]) -> tuple[Any, ...]:
+        if len(row) != len(self._encoders):
+            raise ValueError(
+                f"Each row of stimulus must have {len(self._encoders)} values, got {row!r}"
+            )
+        return tuple(encode(value) for encode, value in zip(self._encoders, row))
+
+    def _refill(self) -> None:
+        rows = [self._encode(row) for row in islice(self._rows, self._chunk_size)]
+        if len(rows) < self._chunk_size:
+            self._exhausted = True
+        self._native.push(rows)
+
+    def _on_empty(self) -> None:
+        # Called by the GPI from the ReadWrite phase, like GPITrigger._react().
+        with profiling_context:
+            cocotb._gpi_triggers._current_gpi_trigger = ReadWrite()
+            try:
+                if not self._exhausted:
+                    self._refill()
+            except Exception as e:  # noqa: BLE001
+                # Fail the driver's Task so the test sees the error.
+                self._exc = e
+                self._exhausted = True
+            if self._exhausted and not self._native.size():
+                self._native.stop()
+                self._done.set()
+            cocotb._event_loop._inst.run()
+
+    def __repr__(self) -> str:
+        signals = ", ".join(s._path for s in self._signals)
+        return f"<{type(self).__qualname__} of [{signals}] on {self._edge!r}>"
+
+
+def drive_on(
+    edge: RisingEdge | FallingEdge | ValueChange,
+    signals: Sequence[ValueObjectBase[Any, Any]],
+    stimulus: Iterable[Sequence[Any]],
+    *,
+    chunk_size: int = 1024,
+) -> StimulusDriver:
+    """Create and start a :class:`StimulusDriver`.
+
+    See :class:`StimulusDriver` for a description of the arguments.
+
+    Returns:
+        The started :class:`StimulusDriver`, which can be :meth:`~StimulusDriver.wait`\\ ed on.
+
+    .. versionadded:: 2.1
+    """
+    driver = StimulusDriver(edge, signals, stimulus, chunk_size=chunk_size)
+    driver.start()
+    return driver
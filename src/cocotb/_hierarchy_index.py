@@ -0,0 +1,151 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""On-disk index of the design hierarchy, reused across simulation runs.
+
+Hierarchy can't change after elaboration, so the children of every scope discovered
+by :meth:`~cocotb.handle._HierarchyObjectBase._discover_all` in one run are saved
+to the file named by :envvar:`COCOTB_HIERARCHY_INDEX` when the simulation ends.
+Later runs of the same build create handle objects for those children from the index
+and only look up their GPI handles when first used.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import cocotb
+import cocotb._shutdown
+from cocotb_tools import _env
+
+_FORMAT_VERSION = 2
+
+_log = logging.getLogger("cocotb.hierarchy_index")
+
+
+class IndexEntry(NamedTuple):
+    """What is known about a child object before its GPI handle is looked up.
+
+    The fields are those returned by :meth:`~cocotb.simulator.sim_obj.get_info`.
+    """
+
+    name: str
+    type: int
+    type_string: str
+    def_name: str
+    def_file: str
+    const: bool
+    left: int
+    right: int
+    direction: int
+    signed: int
+
+
+class HierarchyIndex:
+    """The children of scopes, by the path of the scope.
+
+    The index is only used if it was written by the same simulator and version for the same toplevel.
+    Since only the build knows when the design changes,
+    whoever rebuilds the design must delete the index file, as :meth:`.Runner.build` does.
+    """
+
+    def __init__(self, path: Path, key: dict[str, str]) -> None:
+        self.path = path
+        self.key = key
+        self._scopes: dict[str, list[IndexEntry]] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _log.warning("Ignoring unreadable hierarchy index %s: %s", self.path, e)
+            return
+        if data.get("version") != _FORMAT_VERSION or data.get("key") != self.key:
+            _log.info("Ignoring hierarchy index %s of another build", self.path)
+            return
+        self._scopes = {
+            path: [IndexEntry(*entry) for entry in entries]
+            for path, entries in data["scopes"].items()
+        }
+        _log.info(
+            "Loaded hierarchy index of %d scopes from %s", len(self._scopes), self.path
+        )
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        data: dict[str, Any] = {
+            "version": _FORMAT_VERSION,
+            "key": self.key,
+            "scopes": self._scopes,
+        }
+        # Write to a temporary file and rename it so concurrent runs never see a partial index.
+        fd, name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        tmp = Path(name)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            tmp.replace(self.path)
+        except BaseException:
+            tmp.unlink()
+            raise
+        self._dirty = False
+
+    def get(self, path: str) -> list[IndexEntry] | None:
+        """Return the children of the scope at *path*, or ``None`` if the scope isn't indexed."""
+        return self._scopes.get(path)
+
+    def add(self, path: str, entries: list[IndexEntry]) -> None:
+        """Record *entries* as all of the children of the scope at *path*."""
+        self._scopes[path] = entries
+        self._dirty = True
+
+    def invalidate(self) -> None:
+        """Forget the index and delete its file, because it doesn't match the design."""
+        self._scopes.clear()
+        self._dirty = False
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+_index: HierarchyIndex | None = None
+"""The hierarchy index in use, or ``None`` if :envvar:`COCOTB_HIERARCHY_INDEX` isn't set."""
+
+
+def _init() -> None:
+    global _index
+    path = _env.get_str("COCOTB_HIERARCHY_INDEX")
+    if not path:
+        return
+    key = {
+        "toplevel": _env.get_str("COCOTB_TOPLEVEL"),
+        "simulator": cocotb.SIM_NAME,
+        "version": cocotb.SIM_VERSION,
+    }
+    _index = HierarchyIndex(Path(path).absolute(), key)
+    _index.load()
+    cocotb._shutdown.register(_index.save)
+
+
+def disable() -> None:
+    """Delete the index, which doesn't match the design, and discover objects from the simulator for the rest of the run."""
+    global _index
+    if _index is None:
+        return
+    _log.warning(
+        "The hierarchy index %s does not match the design and has been deleted",
+        _index.path,
+    )
+    _index.invalidate()
+    _index = None
@@ -16,6 +16,7 @@ from types import SimpleNamespace
 from typing import cast
 
 import cocotb
+import cocotb._hierarchy_index
 import cocotb._profiling
 import cocotb._shutdown
 import cocotb.handle
@@ -51,6 +52,7 @@ def init_package_from_simulation() -> None:
     cocotb.SIM_VERSION = cocotb.simulator.get_simulator_version().strip()
     _process_plusargs()
     _setup_random_seed()
+    cocotb._hierarchy_index._init()
     _setup_root_handle()
     _process_packages()
     _start_user_coverage()
@@ -6,8 +6,6 @@
 # Debug mode controlled by environment variables
 from __future__ import annotations
 
-import cProfile
-import pstats
 from contextlib import AbstractContextManager, nullcontext
 
 import cocotb._shutdown
@@ -17,6 +15,10 @@ profiling_context: AbstractContextManager[None, None]
 
 
 if _env.get_bool("COCOTB_ENABLE_PROFILING"):
+    # Only import the profiler when it's used, to keep startup fast.
+    import cProfile
+    import pstats
+
     _profile: cProfile.Profile
 
     def _init() -> None:
@@ -0,0 +1,263 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Sampling of signal values in the ReadOnly phase without resuming Python."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Sequence
+from functools import partial
+from typing import Any, Callable, Union
+
+import cocotb
+import cocotb._event_loop
+import cocotb.simulator
+from cocotb._profiling import profiling_context
+from cocotb.handle import (
+    EnumObject,
+    IntegerObject,
+    LogicArrayObject,
+    LogicObject,
+    RealObject,
+    StringObject,
+    ValueObjectBase,
+)
+from cocotb.task import Task
+from cocotb.triggers import Event, FallingEdge, ReadOnly, RisingEdge, ValueChange
+from cocotb.types import Logic, LogicArray
+from cocotb.types._indexing import do_indexing_changed_warning, indexing_changed
+
+if sys.version_info >= (3, 10):
+    from typing import TypeAlias
+
+__all__ = ("Sampler", "sample_on")
+
+Sample: TypeAlias = tuple[int, tuple[Any, ...]]
+"""A sample: the simulation time in steps and the values of the sampled signals."""
+
+_Decoder: TypeAlias = Union[Callable[[Any], Any], None]
+
+
+def _value_decoder(handle: ValueObjectBase[Any, Any]) -> tuple[int, _Decoder]:
+    """Return how to read the value of *handle* natively and how to turn the result into what :meth:`handle.get() <cocotb.handle.ValueObjectBase.get>` returns."""
+    if isinstance(handle, LogicObject):
+        return cocotb.simulator.FORMAT_BINSTR, Logic
+    elif isinstance(handle, LogicArrayObject):
+        warn_indexing = (
+            indexing_changed(handle.range) if do_indexing_changed_warning else False
+        )
+        return cocotb.simulator.FORMAT_BINSTR, partial(
+            LogicArray._from_handle, warn_indexing=warn_indexing
+        )
+    elif isinstance(handle, (IntegerObject, EnumObject)):
+        n_bits = len(handle)
+        max_val = handle._max_val
+        unsigned = handle._handle.get_signed() == 0
+
+        def to_int(res: int) -> int:
+            if res > max_val:
+                res -= 1 << n_bits
+            elif unsigned and res < 0:
+                res += 1 << n_bits
+            return res
+
+        if n_bits <= 32:
+            return cocotb.simulator.FORMAT_INT, to_int
+        return cocotb.simulator.FORMAT_BINSTR, lambda binstr: to_int(int(binstr, 2))
+    elif isinstance(handle, RealObject):
+        return cocotb.simulator.FORMAT_REAL, None
+    elif isinstance(handle, StringObject):
+        return cocotb.simulator.FORMAT_STR, None
+    raise TypeError(
+        f"Cannot sample {handle!r} of type {type(handle).__qualname__} natively"
+    )
+
+
+class Sampler:
+    r"""Record the values of *signals* in the ReadOnly phase after each *edge*, without resuming Python.
+
+    The values are recorded by the GPI into a native buffer holding *batch_size* samples.
+    When the buffer is full, or when :meth:`flush` is called, the buffered samples are passed to *sink* as a list of ``(time, values)`` tuples,
+    where *time* is the simulation time in steps,
+    and *values* is a tuple of the values of *signals* in the same order and of the same types as :attr:`~cocotb.handle.ValueObjectBase.value` returns.
+
+    This replaces the common passive monitor pattern of :keyword:`await`\ ing an edge and :class:`~cocotb.triggers.ReadOnly` every cycle,
+    which costs a :class:`~cocotb.task.Task` resumption per cycle, with one call of *sink* per batch.
+
+    Args:
+        edge:
+            A :class:`~cocotb.triggers.RisingEdge`, :class:`~cocotb.triggers.FallingEdge`, or :class:`~cocotb.triggers.ValueChange` of the signal to sample on.
+            Several edges in one time step produce one sample.
+        signals: The signals to sample.
+        sink:
+            Called with each batch of samples.
+            It is called from the ReadOnly phase when the buffer is full, so it must not write to any signals.
+        batch_size: The number of samples in the native buffer.
+        flush_on:
+            An :class:`~cocotb.triggers.Event` which flushes the buffered samples to *sink* when set.
+            The Event is cleared after each flush.
+        raw:
+            If ``True``, pass the values to *sink* in the format returned by the GPI
+            (:class:`str` for logic and wide integer values, :class:`int`, :class:`float`, or :class:`bytes`)
+            rather than converting them.
+
+    Raises:
+        TypeError: If a signal's type cannot be sampled natively.
+        ValueError: If *batch_size* is less than ``1``.
+
+    Usage:
+        .. code-block:: python
+
+            def check(samples):
+                for time, (valid, data) in samples:
+                    if valid:
+                        scoreboard.append(data)
+
+
+            sampler = cocotb.sample_on(
+                RisingEdge(dut.clk), [dut.valid, dut.data], check, batch_size=256
+            )
+            ...
+            sampler.stop()
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(
+        self,
+        edge: RisingEdge | FallingEdge | ValueChange,
+        signals: Sequence[ValueObjectBase[Any, Any]],
+        sink: Callable[[list[Sample]], object],
+        *,
+        batch_size: int = 1024,
+        flush_on: Event | None = None,
+        raw: bool = False,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1")
+        self._edge = edge
+        self._signals = tuple(signals)
+        self._sink = sink
+        self._batch_size = batch_size
+        self._flush_on = flush_on
+        self._raw = raw
+        self._decoders: list[_Decoder] = []
+        self._native = cocotb.simulator.sampler_create(
+            edge.signal._handle, type(edge)._edge_type, batch_size
+        )
+        for signal in self._signals:
+            value_format, decoder = _value_decoder(signal)
+            self._native.add_signal(signal._handle, value_format)
+            self._decoders.append(decoder)
+        self._task: Task[None] | None = None
+
+    @property
+    def signals(self) -> tuple[ValueObjectBase[Any, Any], ...]:
+        """The signals being sampled."""
+        return self._signals
+
+    @property
+    def pending(self) -> int:
+        """The number of samples recorded but not yet passed to the sink."""
+        return self._native.size()
+
+    def start(self) -> None:
+        """Start sampling.
+
+        Raises:
+            RuntimeError: If the sampler has already been started.
+        """
+        if self._task is not None:
+            raise RuntimeError("Starting sampler that has already been started.")
+        self._native.start(self._on_full)
+
+        flush_on = self._flush_on
+
+        async def run() -> None:
+            try:
+                if flush_on is None:
+                    # Sampling happens natively; wait forever on an Event that's never set.
+                    await Event().wait()
+                else:
+                    while True:
+                        await flush_on.wait()
+                        flush_on.clear()
+                        self.flush()
+            finally:
+                # Also stop when the test ends without calling stop().
+                self._stop_native()
+
+        self._task = cocotb.start_soon(run())
+
+    def stop(self) -> None:
+        """Stop sampling and pass any buffered samples to the sink.
+
+        Raises:
+            RuntimeError: If the sampler was never started.
+        """
+        if self._task is None:
+            raise RuntimeError("Stopping sampler that was never started.")
+        # The task may not have run yet, in which case cancelling it runs nothing.
+        self._task.cancel()
+        self._task = None
+        self._stop_native()
+
+    def _stop_native(self) -> None:
+        self._native.stop()
+        self.flush()
+
+    def flush(self) -> None:
+        """Pass all buffered samples to the sink now."""
+        samples = self._native.drain()
+        if not samples:
+            return
+        if self._raw:
+            self._sink([(s[0], s[1:]) for s in samples])
+            return
+        decoders = self._decoders
+        self._sink(
+            [
+                (
+                    s[0],
+                    tuple(v if d is None else d(v) for d, v in zip(decoders, s[1:])),
+                )
+                for s in samples
+            ]
+        )
+
+    def _on_full(self) -> None:
+        # Called by the GPI from the ReadOnly phase, like GPITrigger._react().
+        with profiling_context:
+            cocotb._gpi_triggers._current_gpi_trigger = ReadOnly()
+            self.flush()
+            cocotb._event_loop._inst.run()
+
+    def __repr__(self) -> str:
+        signals = ", ".join(s._path for s in self._signals)
+        return f"<{type(self).__qualname__} of [{signals}] on {self._edge!r}>"
+
+
+def sample_on(
+    edge: RisingEdge | FallingEdge | ValueChange,
+    signals: Sequence[ValueObjectBase[Any, Any]],
+    sink: Callable[[list[Sample]], object],
+    *,
+    batch_size: int = 1024,
+    flush_on: Event | None = None,
+    raw: bool = False,
+) -> Sampler:
+    """Create and start a :class:`Sampler`.
+
+    See :class:`Sampler` for a description of the arguments.
+
+    Returns:
+        The started :class:`Sampler`, which can be :meth:`~Sampler.stop`\\ ped.
+
+    .. versionadded:: 2.1
+    """
+    sampler = Sampler(
+        edge, signals, sink, batch_size=batch_size, flush_on=flush_on, raw=raw
+    )
+    sampler.start()
+    return sampler
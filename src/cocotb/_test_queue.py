@@ -0,0 +1,80 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests shared by simulator processes which each run the next test no other process has claimed.
+
+:meth:`.Runner.test` with *shards* points every process to the same empty directory with
+:envvar:`COCOTB_TEST_QUEUE`. A process claims a test by creating a file named after it,
+which only one process can do, so processes which finish their tests early take more of them.
+To keep a few long tests from running last, the tests are ordered longest first
+using the durations recorded in the results file named by :envvar:`COCOTB_TEST_DURATIONS`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+from pathlib import Path
+from xml.etree import ElementTree
+
+from cocotb_tools import _env
+
+_log = logging.getLogger("cocotb.regression")
+
+
+class TestQueue:
+    """Claims tests in a directory shared with the other simulator processes."""
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, path: Path, durations: dict[str, float]) -> None:
+        self.path = path
+        self.durations = durations
+
+    def duration(self, name: str) -> float:
+        """Return how long the test *name* took last time.
+
+        Tests without a recorded duration might be long, so they are assumed to be the longest.
+        """
+        return self.durations.get(name, math.inf)
+
+    def claim(self, name: str) -> bool:
+        """Claim the test *name* for this process.
+
+        Returns:
+            ``False`` if another process already claimed the test.
+        """
+        claim_file = self.path / hashlib.sha1(name.encode()).hexdigest()
+        try:
+            fd = os.open(claim_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+
+def load_durations(results_file: Path) -> dict[str, float]:
+    """Return the wall time of each test case in an xUnit *results_file*, by ``classname.name``."""
+    try:
+        root = ElementTree.parse(results_file).getroot()
+    except (OSError, ElementTree.ParseError) as e:
+        _log.info("Not ordering tests by duration, no usable results file: %s", e)
+        return {}
+    return {
+        f"{testcase.get('classname')}.{testcase.get('name')}": float(
+            testcase.get("time", 0)
+        )
+        for testcase in root.iter("testcase")
+    }
+
+
+def from_env() -> TestQueue | None:
+    """Return the queue named by :envvar:`COCOTB_TEST_QUEUE`, or ``None`` if it isn't set."""
+    path = _env.get_str("COCOTB_TEST_QUEUE")
+    if not path:
+        return None
+    durations_file = _env.get_str("COCOTB_TEST_DURATIONS")
+    durations = load_durations(Path(durations_file)) if durations_file else {}
+    return TestQueue(Path(path), durations)
@@ -0,0 +1,57 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Simulator process kept running to run the tests of many :meth:`.Runner.test` calls.
+
+:meth:`.Runner.test` with *reuse_simulator* starts the simulator with the first tests to run
+and the address of a socket in :envvar:`COCOTB_WORKER_ADDRESS`.
+When these tests finish, the simulator process connects to the runner instead of stopping,
+and waits for the environment variables of the next tests,
+like their test modules, filter and results file, which it runs from the current simulation time.
+"""
+
+from __future__ import annotations
+
+import os
+from multiprocessing.connection import Client, Connection
+
+from cocotb_tools import _env
+
+_connection: Connection | None = None
+"""Connection to the runner, made when the first tests finish."""
+
+
+def wait_for_tests() -> bool:
+    """Tell the runner the tests it asked for finished, and wait for the next tests.
+
+    Returns:
+        ``True`` if the runner sent more tests to run, with their environment variables set in :data:`os.environ`.
+        ``False`` if the simulation should end, or this process isn't reused.
+    """
+    global _connection
+
+    address = _env.get_str("COCOTB_WORKER_ADDRESS")
+    if not address:
+        return False
+
+    try:
+        if _connection is None:
+            _connection = Client(address)
+        _connection.send(True)
+        env: dict[str, str | None] | None = _connection.recv()
+    except (OSError, EOFError):
+        # The runner is gone.
+        env = None
+
+    if env is None:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+        return False
+
+    for name, value in env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    return True
@@ -8,20 +8,26 @@ from __future__ import annotations
 import enum
 import logging
 import re
+import weakref
 from abc import ABC, abstractmethod
+from array import array
 from collections.abc import Iterable, Iterator, Sequence
-from functools import cached_property
+from contextlib import suppress
+from fnmatch import fnmatchcase
 from logging import Logger
 from typing import (
     Any,
     Callable,
     Generic,
+    NamedTuple,
     NoReturn,
     TypeVar,
     Union,
     cast,
+    get_origin,
 )
 
+import cocotb._hierarchy_index
 import cocotb.simulator
 from cocotb._base_triggers import TriggerCallback
 from cocotb._deprecation import deprecated
@@ -61,6 +67,25 @@ __all__ = (
 )
 
 
+class _ObjectInfo(NamedTuple):
+    """Everything about an object that the GPI returns from :meth:`~cocotb.simulator.sim_obj.get_info`."""
+
+    name: str
+    type: int
+    type_string: str
+    def_name: str
+    def_file: str
+    const: bool
+    left: int
+    right: int
+    direction: int
+    signed: int
+
+
+_path_segment_re = re.compile(r"\[(-?\d+)\]|([^.\[\]]+)")
+_path_re = re.compile(r"(?:[^.\[\]]+|\[-?\d+\])(?:\.[^.\[\]]+|\[-?\d+\])*")
+
+
 class SimHandleBase(ABC):
     """Base class for all simulation objects.
 
@@ -76,6 +101,19 @@ class SimHandleBase(ABC):
         ``get_definition_name()`` and ``get_definition_file()`` were removed in favor of :meth:`_def_name` and :meth:`_def_file`, respectively.
     """
 
+    # Handles are stored in slots instead of a __dict__ to keep them small,
+    # since testbenches may hold on to hundreds of thousands of them.
+    # Mixins have empty slots so they can be combined; concrete classes declare the slots the mixins use.
+    __slots__ = ("__weakref__", "_handle", "_info", "_logger", "_path", "_unresolved")
+
+    _info: _ObjectInfo
+    """What the GPI knows about the object, fetched in one call when first needed."""
+
+    _logger: Logger
+
+    _unresolved: tuple[_HierarchyObjectBase[Any], Any, int]
+    """The parent, key and GPI type of an object created from the hierarchy index, until its handle is looked up."""
+
     @abstractmethod
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         self._handle = handle
@@ -85,27 +123,40 @@ class SimHandleBase(ABC):
         :meta public:
         """
 
-    @cached_property
+    def _get_info(self) -> _ObjectInfo:
+        try:
+            return self._info
+        except AttributeError:
+            pass
+        info = self._info = _ObjectInfo._make(self._handle.get_info())
+        return info
+
+    @property
     def _name(self) -> str:
         """The name of an object.
 
         :meta public:
         """
-        return self._handle.get_name_string()
+        return self._get_info().name
 
-    @cached_property
+    @property
     def _type(self) -> str:
         """The type of an object as a string.
 
         :meta public:
         """
-        return self._handle.get_type_string()
+        return self._get_info().type_string
 
-    @cached_property
+    @property
     def _log(self) -> Logger:
-        return logging.getLogger(f"cocotb.{self._name}")
+        try:
+            return self._logger
+        except AttributeError:
+            pass
+        logger = self._logger = logging.getLogger(f"cocotb.{self._name}")
+        return logger
 
-    @cached_property
+    @property
     def _def_name(self) -> str:
         """The name of a GPI object's definition.
 
@@ -115,9 +166,9 @@ class SimHandleBase(ABC):
 
         :meta public:
         """
-        return self._handle.get_definition_name()
+        return self._get_info().def_name
 
-    @cached_property
+    @property
     def _def_file(self) -> str:
         """The name of the file that sources the object's definition.
 
@@ -127,7 +178,47 @@ class SimHandleBase(ABC):
 
         :meta public:
         """
-        return self._handle.get_definition_file()
+        return self._get_info().def_file
+
+    def _resolve_handle(self) -> cocotb.simulator.sim_obj:
+        parent, key, gpi_type = self._unresolved
+        handle = parent._get_handle_by_key(key, GPIDiscovery.AUTO)
+        if handle is None:
+            # Some simulators only find some objects by iterating over their parent,
+            # which finds the handles of all of its children at once.
+            parent._resolve_indexed_children()
+            if not isinstance(self, _UnresolvedMixin):
+                # The object was resolved while iterating.
+                return self._handle
+        if handle is None or handle.get_type() != gpi_type:
+            # The object can't change its class, so it must be discovered again.
+            cocotb._hierarchy_index.disable()
+            if parent._sub_handles.get(key) is self:
+                del parent._sub_handles[key]
+                # paths remembered by _lookup() may lead to the dropped object or below it
+                _clear_lookups()
+            raise RuntimeError(
+                f"{self._path} in the hierarchy index does not match the design. "
+                "The index has been deleted; look up the object again."
+            )
+        self._set_resolved_handle(handle)
+        return handle
+
+    def _set_resolved_handle(self, handle: cocotb.simulator.sim_obj) -> None:
+        """Turn an object created from the hierarchy index into an ordinary handle for *handle*."""
+        info = _ObjectInfo._make(handle.get_info())
+        if info != self._info:
+            # The design was elaborated differently, so the index can't be trusted.
+            cocotb._hierarchy_index.disable()
+            self._info = info
+            for name in ("_range", "_max", "_min"):
+                with suppress(AttributeError):
+                    delattr(self, name)
+        del self._unresolved
+        self._handle = handle
+        # From now on the object is an ordinary handle, without the __getattr__ of _UnresolvedMixin.
+        self.__class__ = cast("type[_UnresolvedMixin]", type(self))._resolved_class
+        _handle2obj.setdefault(handle, cast("_ConcreteHandleTypes", self))
 
     def __hash__(self) -> int:
         return hash(self._handle)
@@ -159,15 +250,27 @@ class SimHandleBase(ABC):
 class _RangeableObjectMixin(SimHandleBase):
     """Base class for simulation objects that have a range."""
 
-    @cached_property
+    __slots__ = ()
+
+    _range: Range
+
+    @property
     def range(self) -> Range:
         """Return a :class:`~cocotb.types.Range` over the indexes of the array/vector."""
-        left, right, direction = self._handle.get_range()
-        if direction == cocotb.simulator.RANGE_NO_DIR:
+        try:
+            return self._range
+        except AttributeError:
+            pass
+        info = self._get_info()
+        if info.direction == cocotb.simulator.RANGE_NO_DIR:
             raise RuntimeError("Expected range to have a direction but got none!")
-        return Range(
-            left, "to" if direction == cocotb.simulator.RANGE_UP else "downto", right
+        # The slot is declared by the concrete classes, so mixins can be combined.
+        self._range = Range(  # type: ignore[misc]
+            info.left,
+            "to" if info.direction == cocotb.simulator.RANGE_UP else "downto",
+            info.right,
         )
+        return self._range
 
     @property
     def left(self) -> int:
@@ -219,10 +322,13 @@ class _HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
     See :class:`HierarchyObject` and :class:`HierarchyArrayObject` for examples.
     """
 
+    __slots__ = ("_discovered", "_lookups", "_sub_handles")
+
     @abstractmethod
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
         self._sub_handles: dict[KeyType, SimHandleBase] = {}
+        self._lookups: dict[str, SimHandleBase] = {}
         self._discovered = False
 
     def _keys(self) -> Iterable[KeyType]:
@@ -258,35 +364,201 @@ class _HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
         if self._discovered:
             return
 
-        for thing in self._handle.iterate(cocotb.simulator.OBJECTS):
-            name = thing.get_name_string()
+        index = cocotb._hierarchy_index._index
+        if index is None:
+            for thing in self._handle.iterate(cocotb.simulator.OBJECTS):
+                self._add_child(thing)
+        else:
+            entries = index.get(self._path)
+            if entries is not None:
+                for entry in entries:
+                    self._add_indexed_child(entry)
+            else:
+                entries = []
+                for thing in self._handle.iterate(cocotb.simulator.OBJECTS):
+                    added = self._add_child(thing)
+                    if added is not None:
+                        entries.append(
+                            cocotb._hierarchy_index.IndexEntry._make(
+                                added[1]._get_info()
+                            )
+                        )
+                index.add(self._path, entries)
 
-            # translate HDL name into a consistent key name
-            try:
-                key = self._sub_handle_key(name)
-            except ValueError:
-                self._log.exception(
-                    "Unable to translate handle >%s< to a valid _sub_handle key",
-                    name,
-                )
-                continue
+        self._discovered = True
 
-            # compute a full path using the key name
-            path = self._child_path(key)
+    def _discover(
+        self, pattern: str | None = None, types: Iterable[int] | None = None
+    ) -> dict[KeyType, SimHandleBase]:
+        """Discover only the child objects with matching names and types.
 
-            # attempt to create the child object
-            try:
-                hdl = _make_sim_object(thing, path)
-            except NotImplementedError:
-                self._log.exception(
-                    "Unable to construct a SimHandle object for %s", path
+        Unlike :meth:`_discover_all`, children are filtered by the GPI before any handles are created for them,
+        so discovering a few children of a large scope doesn't pay for constructing all the others.
+        The matching children are cached and returned.
+
+        :meta public:
+
+        Args:
+            pattern:
+                A shell-style pattern, as understood by :func:`fnmatch.fnmatchcase`, that the HDL name of the child must match.
+                Note that the names of generate blocks are matched without their index.
+            types: The ``cocotb.simulator`` object type constants, like ``cocotb.simulator.LOGIC``, of the children to return.
+
+        Returns:
+            A mapping of the key of each matching child to the child object.
+
+        Usage:
+            .. code-block:: python
+
+                valids = dut._discover(
+                    pattern="*_valid", types={cocotb.simulator.LOGIC}
                 )
+
+        .. versionadded:: 2.1
+        """
+        found: dict[KeyType, SimHandleBase] = {}
+
+        index = cocotb._hierarchy_index._index
+        entries = None if index is None else index.get(self._path)
+        if entries is not None:
+            types = None if types is None else set(types)
+            for entry in entries:
+                if pattern is not None and not fnmatchcase(entry.name, pattern):
+                    continue
+                if types and entry.type not in types:
+                    continue
+                child = self._add_indexed_child(entry)
+                if child is not None:
+                    key, hdl = child
+                    found[key] = hdl
+            return found
+
+        type_mask = 0
+        for type_ in types or ():
+            type_mask |= 1 << type_
+
+        for thing in self._handle.iterate(cocotb.simulator.OBJECTS, pattern, type_mask):
+            child = self._add_child(thing)
+            if child is not None:
+                key, hdl = child
+                found[key] = hdl
+        return found
+
+    def _discover_tree(self) -> None:
+        """Discover all objects in the hierarchy below this object.
+
+        This is like calling :meth:`_discover_all` on this object and every hierarchical object below it,
+        but the GPI finds all objects in one call, instead of one call per object.
+        Use this to build a map of all signals in a large design.
+
+        :meta public:
+
+        .. versionadded:: 2.1
+        """
+        index = cocotb._hierarchy_index._index
+        if self._discovered or (
+            index is not None and index.get(self._path) is not None
+        ):
+            # only the objects below which aren't discovered yet need the GPI
+            self._discover_all()
+            for child in self._sub_handles.values():
+                if isinstance(child, _HierarchyObjectBase):
+                    child._discover_tree()
+            return
+
+        things, packed_parents = self._handle.scan()
+        parents = array("i", packed_parents)
+
+        # The position of each object's parent refers to an earlier object.
+        scopes: dict[int, _HierarchyObjectBase[Any]] = {-1: self}
+        entries: dict[int, list[cocotb._hierarchy_index.IndexEntry]] = {-1: []}
+        for pos, (thing, parent_pos) in enumerate(zip(things, parents)):
+            parent = scopes.get(parent_pos)
+            if parent is None:
                 continue
+            added = parent._add_child(thing)
+            if added is None:
+                continue
+            hdl = added[1]
+            if index is not None:
+                entries[parent_pos].append(
+                    cocotb._hierarchy_index.IndexEntry._make(hdl._get_info())
+                )
+            if isinstance(hdl, _HierarchyObjectBase):
+                scopes[pos] = hdl
+                entries[pos] = []
 
-            # add to cache
-            self._sub_handles[key] = hdl
+        for pos, scope in scopes.items():
+            scope._discovered = True
+            if index is not None:
+                index.add(scope._path, entries[pos])
 
-        self._discovered = True
+    def _add_child(
+        self, thing: cocotb.simulator.sim_obj
+    ) -> tuple[KeyType, SimHandleBase] | None:
+        name = thing.get_name_string()
+
+        # translate HDL name into a consistent key name
+        try:
+            key = self._sub_handle_key(name)
+        except ValueError:
+            self._log.exception(
+                "Unable to translate handle >%s< to a valid _sub_handle key",
+                name,
+            )
+            return None
+
+        # reuse a cached object so each child has one object
+        try:
+            return key, self._sub_handles[key]
+        except KeyError:
+            pass
+
+        # compute a full path using the key name
+        path = self._child_path(key)
+
+        # attempt to create the child object
+        try:
+            hdl = _make_sim_object(thing, path)
+        except NotImplementedError:
+            self._log.exception("Unable to construct a SimHandle object for %s", path)
+            return None
+
+        # add to cache
+        self._sub_handles[key] = hdl
+        return key, hdl
+
+    def _add_indexed_child(
+        self, entry: cocotb._hierarchy_index.IndexEntry
+    ) -> tuple[KeyType, SimHandleBase] | None:
+        try:
+            key = self._sub_handle_key(entry.name)
+        except ValueError:
+            return None
+        try:
+            return key, self._sub_handles[key]
+        except KeyError:
+            pass
+        try:
+            hdl = _make_indexed_sim_object(entry, self, key)
+        except NotImplementedError:
+            return None
+        self._sub_handles[key] = hdl
+        return key, hdl
+
+    def _resolve_indexed_children(self) -> None:
+        """Find the handles of all children created from the hierarchy index with one iteration over this object."""
+        for thing in self._handle.iterate(cocotb.simulator.OBJECTS):
+            try:
+                key = self._sub_handle_key(thing.get_name_string())
+            except ValueError:
+                continue
+            child = self._sub_handles.get(key)
+            if (
+                isinstance(child, _UnresolvedMixin)
+                and thing.get_type() == child._unresolved[2]
+            ):
+                child._set_resolved_handle(thing)
 
     def _get(
         self, key: KeyType, discovery_method: GPIDiscovery = GPIDiscovery.AUTO
@@ -314,6 +586,20 @@ class _HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
         except KeyError:
             pass
 
+        # try the children recorded in the hierarchy index by a previous run
+        index = cocotb._hierarchy_index._index
+        if (
+            index is not None
+            and not self._discovered
+            and discovery_method is GPIDiscovery.AUTO
+            and index.get(self._path) is not None
+        ):
+            self._discover_all()
+            try:
+                return self._sub_handles[key]
+            except KeyError:
+                pass
+
         # try to get value from GPI
         new_handle = self._get_handle_by_key(key, discovery_method)
         if new_handle is None:
@@ -325,6 +611,49 @@ class _HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
 
         return sub_handle
 
+    def _lookup(self, path: str) -> SimHandleBase:
+        """Return the object at *path* below this object.
+
+        *path* is written like the Python expression to access the object,
+        without the leading object, e.g. ``"sub.fifo[3].data"``.
+        The result is remembered,
+        so looking up the same path again costs a single dictionary lookup
+        regardless of how deep the object is.
+
+        Names containing ``.``, ``[``, or ``]`` can't be used in *path*;
+        use the index syntax to access those objects.
+
+        :meta public:
+
+        Args:
+            path: The path of the object relative to this object.
+
+        Returns:
+            The object at *path*.
+
+        Raises:
+            ValueError: If *path* is not a valid path.
+            KeyError: If a named object in *path* doesn't exist.
+            IndexError: If an indexed object in *path* doesn't exist.
+
+        .. versionadded:: 2.1
+        """
+        lookups = self._lookups
+        try:
+            return lookups[path]
+        except KeyError:
+            pass
+
+        if not _path_re.fullmatch(path):
+            raise ValueError(f"Invalid path {path!r}")
+        obj: Any = self
+        for match in _path_segment_re.finditer(path):
+            index, name = match.groups()
+            obj = obj[name] if index is None else obj[int(index)]
+        lookups[path] = obj
+        _lookup_owners.add(self)
+        return obj
+
     @abstractmethod
     def _get_handle_by_key(
         self, key: KeyType, discovery_method: GPIDiscovery
@@ -430,8 +759,14 @@ class HierarchyObject(_HierarchyObjectBase[str]):
 
         # make sure we found them all
         assert len(dut.some_module) == total
+
+    .. versionchanged:: 2.1
+        Accessing a child with attribute syntax again doesn't query the GPI
+        or check the hierarchy index.
     """
 
+    __slots__ = ()
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
 
@@ -455,6 +790,12 @@ class HierarchyObject(_HierarchyObjectBase[str]):
         if name.startswith("_"):
             return object.__getattribute__(self, name)
 
+        # children found before don't need the rest of _get()
+        try:
+            return self._sub_handles[name]
+        except KeyError:
+            pass
+
         handle = self._get(name)
         if handle is None:
             raise AttributeError(f"{self._path} contains no child object named {name}")
@@ -553,6 +894,8 @@ class HierarchyArrayObject(
         assert len(dut.gen_pipe_stage) == len(dut.gen_pipe_stages.range)
     """
 
+    __slots__ = ("_range",)
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
 
@@ -836,6 +1179,8 @@ class ValueObjectBase(SimHandleBase, Generic[ValueGetT, ValueSetT]):
     Inherits from :class:`SimHandleBase`.
     """
 
+    __slots__ = ()
+
     @property
     def value(self) -> ValueGetT:
         """Get or set the value of the simulation object.
@@ -938,10 +1283,10 @@ class ValueObjectBase(SimHandleBase, Generic[ValueGetT, ValueSetT]):
             value = _OldImmediate(value)
         self.value = value
 
-    @cached_property
+    @property
     def is_const(self) -> bool:
         """``True`` if the simulator object is immutable, e.g. a Verilog parameter or VHDL constant or generic."""
-        return self._handle.get_const()
+        return self._get_info().const
 
     @abstractmethod
     def _set_value(
@@ -1002,6 +1347,8 @@ class ArrayObject(
             dut.array_object[child_idx]
     """
 
+    __slots__ = ("_range", "_sub_handles")
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
         self._sub_handles: dict[int, ChildObjectT] = {}
@@ -1096,18 +1443,33 @@ class _NonIndexableValueObjectBase(ValueObjectBase[ValueGetT, ValueSetT]):
     NonArrayValueObjects support :meth:`value_change` triggers.
     """
 
-    @cached_property
+    __slots__ = ("_edge_trigger", "_value_change")
+
+    _edge_trigger: Edge
+    _value_change: ValueChange
+
+    @property
     def value_change(self) -> ValueChange:
         """A trigger which fires whenever the value changes."""
+        try:
+            return self._value_change
+        except AttributeError:
+            pass
         if self.is_const:
             raise TypeError("Can't get ValueChange on immutable signal.")
-        return ValueChange._make(self)
+        self._value_change = ValueChange._make(self)
+        return self._value_change
 
-    @cached_property
+    @property
     def _edge(self) -> Edge:
+        try:
+            return self._edge_trigger
+        except AttributeError:
+            pass
         if self.is_const:
             raise TypeError("Can't get Edge on immutable signal.")
-        return Edge._make(self)
+        self._edge_trigger = Edge._make(self)
+        return self._edge_trigger
 
 
 class LogicObject(
@@ -1129,6 +1491,11 @@ class LogicObject(
         * ``bit``
     """
 
+    __slots__ = ("_falling_edge", "_rising_edge")
+
+    _falling_edge: FallingEdge
+    _rising_edge: RisingEdge
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
 
@@ -1186,19 +1553,29 @@ class LogicObject(
         """
         self.value = value
 
-    @cached_property
+    @property
     def rising_edge(self) -> RisingEdge:
         """A trigger which fires whenever the value changes to a ``1``."""
+        try:
+            return self._rising_edge
+        except AttributeError:
+            pass
         if self.is_const:
             raise TypeError("Can't get RisingEdge on immutable signal")
-        return RisingEdge._make(self)
+        self._rising_edge = RisingEdge._make(self)
+        return self._rising_edge
 
-    @cached_property
+    @property
     def falling_edge(self) -> FallingEdge:
         """A trigger which fires whenever the value changes to a ``0``."""
+        try:
+            return self._falling_edge
+        except AttributeError:
+            pass
         if self.is_const:
             raise TypeError("Can't get FallingEdge on immutable signal")
-        return FallingEdge._make(self)
+        self._falling_edge = FallingEdge._make(self)
+        return self._falling_edge
 
     def __len__(self) -> int:
         return 1
@@ -1217,31 +1594,45 @@ class LogicObject(
 
 
 class _SignednessObjectMixin(SimHandleBase):
+    __slots__ = ()
+
+    _min: int
+    _max: int
+
     @abstractmethod
     def __len__(self) -> int: ...
 
-    @cached_property
+    @property
     def is_signed(self) -> bool:
-        signed = self._handle.get_signed()
+        signed = self._get_info().signed
         if signed == -1:
             raise RuntimeError(f"Simulator failed to get signedness of {self._path!r}.")
         return bool(signed)
 
-    @cached_property
+    @property
     def _min_val(self) -> int:
-        signed = self._handle.get_signed()
-        if signed == 0:
-            return 0
+        try:
+            return self._min
+        except AttributeError:
+            pass
+        # The slot is declared by the concrete classes, so mixins can be combined.
+        if self._get_info().signed == 0:
+            self._min = 0  # type: ignore[misc]
         else:
-            return -(2 ** (len(self) - 1))
+            self._min = -(2 ** (len(self) - 1))  # type: ignore[misc]
+        return self._min
 
-    @cached_property
+    @property
     def _max_val(self) -> int:
-        signed = self._handle.get_signed()
-        if signed == 1:
-            return (2 ** (len(self) - 1)) - 1
+        try:
+            return self._max
+        except AttributeError:
+            pass
+        if self._get_info().signed == 1:
+            self._max = (2 ** (len(self) - 1)) - 1  # type: ignore[misc]
         else:
-            return (2 ** len(self)) - 1
+            self._max = (2 ** len(self)) - 1  # type: ignore[misc]
+        return self._max
 
 
 class LogicArrayObject(
@@ -1275,6 +1666,18 @@ class LogicArrayObject(
         bit_0 = dut.my_vec[0]
     """
 
+    __slots__ = (
+        "_falling_edge",
+        "_max",
+        "_min",
+        "_range",
+        "_rising_edge",
+        "_sub_handles",
+    )
+
+    _falling_edge: FallingEdge
+    _rising_edge: RisingEdge
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
         self._sub_handles: dict[int, SimHandleBase] = {}
@@ -1399,33 +1802,43 @@ class LogicArrayObject(
         self._sub_handles[key] = sub
         return sub
 
-    @cached_property
+    @property
     def _min_val(self) -> int:
         # Backwards compatibility. Always wrap negative values.
         return -(2 ** (len(self) - 1))
 
-    @cached_property
+    @property
     def _max_val(self) -> int:
         # Backwards compatibility. Always wrap negative values.
         return (2 ** len(self)) - 1
 
-    @cached_property
+    @property
     def rising_edge(self) -> RisingEdge:
         """A trigger which fires whenever the value changes to a ``1``."""
+        try:
+            return self._rising_edge
+        except AttributeError:
+            pass
         if len(self) != 1:
             raise TypeError(f"Can't get RisingEdge on {len(self)}-bit signal")
         if self.is_const:
             raise TypeError("Can't get RisingEdge on immutable signal")
-        return RisingEdge._make(self)
+        self._rising_edge = RisingEdge._make(self)
+        return self._rising_edge
 
-    @cached_property
+    @property
     def falling_edge(self) -> FallingEdge:
         """A trigger which fires whenever the value changes to a ``0``."""
+        try:
+            return self._falling_edge
+        except AttributeError:
+            pass
         if len(self) != 1:
             raise TypeError(f"Can't get FallingEdge on {len(self)}-bit signal")
         if self.is_const:
             raise TypeError("Can't get FallingEdge on immutable signal")
-        return FallingEdge._make(self)
+        self._falling_edge = FallingEdge._make(self)
+        return self._falling_edge
 
 
 class RealObject(_NonIndexableValueObjectBase[float, float]):
@@ -1437,6 +1850,8 @@ class RealObject(_NonIndexableValueObjectBase[float, float]):
     They are assumed to be IEEE 754 double precision floating point types.
     """
 
+    __slots__ = ()
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
 
@@ -1503,6 +1918,8 @@ class EnumObject(
         There is currently no support for getting the enumeration names or values.
     """
 
+    __slots__ = ("_max", "_min")
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
 
@@ -1543,7 +1960,7 @@ class EnumObject(
             res = int(self._handle.get_signal_val_binstr(), 2)
         if res > self._max_val:
             res -= 1 << len(self)
-        elif self._handle.get_signed() == 0 and res < 0:
+        elif self._get_info().signed == 0 and res < 0:
             res += 1 << len(self)
         return res
 
@@ -1619,6 +2036,8 @@ class IntegerObject(_NonIndexableValueObjectBase[int, int], _SignednessObjectMix
         This may cause changes in behavior, but in the direction of better correctness.
     """
 
+    __slots__ = ("_max", "_min")
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
 
@@ -1660,7 +2079,7 @@ class IntegerObject(_NonIndexableValueObjectBase[int, int], _SignednessObjectMix
             res = int(self._handle.get_signal_val_binstr(), 2)
         if res > self._max_val:
             res -= 1 << len(self)
-        elif self._handle.get_signed() == 0 and res < 0:
+        elif self._get_info().signed == 0 and res < 0:
             res += 1 << len(self)
         return res
 
@@ -1703,6 +2122,8 @@ class StringObject(
     This type is used when a ``string`` (VHDL or Verilog) simulation object is seen.
     """
 
+    __slots__ = ("_range",)
+
     def __init__(self, handle: cocotb.simulator.sim_obj, path: str | None) -> None:
         super().__init__(handle, path)
 
@@ -1778,6 +2199,8 @@ class FixedStringObject(StringObject):
     This is because in VHDL string are fixed-length unlike Verilog string
     """
 
+    __slots__ = ()
+
     def _set_value(
         self,
         value: bytes,
@@ -1813,6 +2236,17 @@ _handle2obj: dict[
     _ConcreteHandleTypes,
 ] = {}
 
+# The objects with paths remembered by _lookup().
+_lookup_owners: weakref.WeakSet[_HierarchyObjectBase[Any]] = weakref.WeakSet()
+
+
+def _clear_lookups() -> None:
+    """Forget the paths remembered by :meth:`_HierarchyObjectBase._lookup`."""
+    for obj in _lookup_owners:
+        obj._lookups.clear()
+    _lookup_owners.clear()
+
+
 _type2cls: dict[int, type[_ConcreteHandleTypes]] = {
     cocotb.simulator.MODULE: HierarchyObject,
     cocotb.simulator.STRUCTURE: HierarchyObject,
@@ -1861,3 +2295,74 @@ def _make_sim_object(
     obj = _type2cls[t](handle, path)
     _handle2obj[handle] = obj
     return obj
+
+
+class _UnresolvedMixin:
+    """Looks up the GPI handle of an object created from the hierarchy index when it's first used.
+
+    Only the classes of objects created from the index derive from this,
+    so other objects don't pay for a :meth:`__getattr__`.
+    The object changes back to its :attr:`_resolved_class` once its handle is found.
+    """
+
+    __slots__ = ()
+
+    _resolved_class: type[SimHandleBase]
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_handle":
+            return cast("SimHandleBase", self)._resolve_handle()
+        getattr_ = getattr(super(), "__getattr__", None)
+        if getattr_ is None:
+            return object.__getattribute__(self, name)
+        return getattr_(name)
+
+
+_unresolved_classes: dict[type[SimHandleBase], type[SimHandleBase]] = {}
+
+
+def _unresolved_class(cls: type[SimHandleBase]) -> type[SimHandleBase]:
+    try:
+        return _unresolved_classes[cls]
+    except KeyError:
+        pass
+    unresolved = type(
+        cls.__name__,
+        (_UnresolvedMixin, cls),
+        {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_resolved_class": cls,
+        },
+    )
+    _unresolved_classes[cls] = unresolved
+    return unresolved
+
+
+def _make_indexed_sim_object(
+    entry: cocotb._hierarchy_index.IndexEntry,
+    parent: _HierarchyObjectBase[Any],
+    key: Any,
+) -> SimHandleBase:
+    """Create a `SimHandle` object from its hierarchy index *entry* without looking up its GPI handle.
+
+    The GPI handle is looked up from *parent* by *key* when it's first used.
+
+    Raises:
+        NotImplementedError: If no matching object for GPI type could be found.
+    """
+    if entry.type not in _type2cls:
+        raise NotImplementedError(
+            f"Couldn't find a matching object for GPI type {entry.type_string}({entry.type})"
+        )
+    cls = _unresolved_class(get_origin(_type2cls[entry.type]) or _type2cls[entry.type])
+    obj: SimHandleBase = cls(
+        cast("cocotb.simulator.sim_obj", None), parent._child_path(key)
+    )
+    del obj._handle
+    obj._unresolved = (parent, key, entry.type)
+
+    # The index knows everything the GPI would be asked for.
+    obj._info = _ObjectInfo._make(entry)
+    return obj
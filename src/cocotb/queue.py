@@ -8,6 +8,7 @@ import collections
 import heapq
 import sys
 from abc import abstractmethod
+from itertools import islice
 from typing import Generic, Protocol, TypeVar
 
 import cocotb
@@ -21,6 +22,8 @@ if sys.version_info >= (3, 11):
 
 __all__ = (
     "AbstractQueue",
+    "Broadcast",
+    "BroadcastReceiver",
     "LifoQueue",
     "PriorityQueue",
     "Queue",
@@ -40,6 +43,14 @@ class QueueEmpty(asyncio.queues.QueueEmpty):
 T = TypeVar("T")
 
 
+def _wakeup_next(waiters: collections.deque[tuple[Event, Task[object]]]) -> None:
+    while waiters:
+        event, task = waiters.popleft()
+        if not task.done():
+            event.set()
+            break
+
+
 class AbstractQueue(Generic[T]):
     """A queue, useful for coordinating producer and consumer coroutines.
 
@@ -76,11 +87,7 @@ class AbstractQueue(Generic[T]):
     def _wakeup_next(
         self, waiters: collections.deque[tuple[Event, Task[object]]]
     ) -> None:
-        while waiters:
-            event, task = waiters.popleft()
-            if not task.done():
-                event.set()
-                break
+        _wakeup_next(waiters)
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} {self._format()} at {pointer_str(self)}>"
@@ -243,3 +250,236 @@ class LifoQueue(AbstractQueue[T]):
 
     def _repr(self) -> str:
         return repr(self._queue)
+
+
+class _BroadcastEntry(Generic[T]):
+    """An item in a :class:`Broadcast` buffer and the number of receivers yet to retrieve it."""
+
+    __slots__ = ("item", "remaining")
+
+    def __init__(self, item: T, remaining: int) -> None:
+        self.item = item
+        self.remaining = remaining
+
+
+class Broadcast(Generic[T]):
+    """A channel which delivers every item put into it to every subscribed receiver.
+
+    Receivers are created with :meth:`subscribe`.
+    Each receiver holds a read cursor into a single buffer shared by all receivers,
+    so an item is stored once regardless of the number of receivers,
+    and is released once every receiver has retrieved it.
+    All receivers waiting on an empty channel are woken by a single trigger when an item is put.
+
+    Receivers only see items put into the channel after they subscribed.
+    Items put into the channel while there are no receivers are discarded.
+
+    If *maxsize* is less than or equal to 0, the buffer size is infinite.
+    If it is an integer greater than 0, then :meth:`put` will block while the
+    slowest receiver has *maxsize* items it has not yet retrieved.
+
+    Usage:
+        .. code-block:: python
+
+            channel = Broadcast()
+            scoreboard_rx = channel.subscribe()
+            coverage_rx = channel.subscribe()
+
+            channel.put_nowait(transaction)
+            assert await scoreboard_rx.get() is transaction
+            assert await coverage_rx.get() is transaction
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._maxsize: int = maxsize
+        self._buffer: collections.deque[_BroadcastEntry[T]] = collections.deque()
+        # sequence number of the item at the front of _buffer
+        self._base: int = 0
+        self._num_receivers: int = 0
+        self._not_empty: Event = Event()
+        self._putters: collections.deque[tuple[Event, Task[object]]] = (
+            collections.deque()
+        )
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._format()} at {pointer_str(self)}>"
+
+    def __str__(self) -> str:
+        return f"<{type(self).__name__} {self._format()}>"
+
+    def _format(self) -> str:
+        result = f"maxsize={self._maxsize!r} receivers={self._num_receivers!r}"
+        if self._buffer:
+            result += f" _buffer[{len(self._buffer)}]"
+        if self._putters:
+            result += f" _putters[{len(self._putters)}]"
+        return result
+
+    @property
+    def _end(self) -> int:
+        """Sequence number the next item put into the channel will get."""
+        return self._base + len(self._buffer)
+
+    @property
+    def maxsize(self) -> int:
+        """Number of items allowed in the buffer."""
+        return self._maxsize
+
+    @property
+    def receivers(self) -> int:
+        """Number of currently subscribed receivers."""
+        return self._num_receivers
+
+    def qsize(self) -> int:
+        """Number of items not yet retrieved by every receiver."""
+        return len(self._buffer)
+
+    def empty(self) -> bool:
+        """Return ``True`` if every receiver has retrieved every item, ``False`` otherwise."""
+        return not self._buffer
+
+    def full(self) -> bool:
+        """Return ``True`` if there are :attr:`maxsize` items in the buffer.
+
+        .. note::
+            If the channel was initialized with ``maxsize=0`` (the default), then
+            :meth:`full` is never ``True``.
+        """
+        if self._maxsize <= 0:
+            return False
+        else:
+            return len(self._buffer) >= self._maxsize
+
+    def subscribe(self) -> BroadcastReceiver[T]:
+        """Create a new receiver which will see every item put into the channel from now on."""
+        self._num_receivers += 1
+        return BroadcastReceiver(self)
+
+    async def put(self, item: T) -> None:
+        """Put an *item* into the channel.
+
+        If the buffer is full, wait until the slowest receiver
+        has retrieved an item before adding the item.
+        """
+        while self.full():
+            event = Event()
+            self._putters.append((event, cocotb.task.current_task()))
+            await event.wait()
+        self.put_nowait(item)
+
+    def put_nowait(self, item: T) -> None:
+        """Put an *item* into the channel without blocking.
+
+        If the buffer is full, raise :exc:`~cocotb.queue.QueueFull`.
+        """
+        if self.full():
+            raise QueueFull()
+        if self._num_receivers:
+            self._buffer.append(_BroadcastEntry(item, self._num_receivers))
+            self._wakeup_receivers()
+        # a reclaim can free several slots but wakes one putter per slot,
+        # so pass the wakeup on while there is room left
+        if not self.full():
+            _wakeup_next(self._putters)
+
+    def _wakeup_receivers(self) -> None:
+        # All waiting receivers share one Event, so they are woken with a single trigger.
+        self._not_empty.set()
+        self._not_empty.clear()
+
+    def _consume(self, receiver: BroadcastReceiver[T]) -> T:
+        index = receiver._cursor - self._base
+        entry = self._buffer[index]
+        receiver._cursor += 1
+        entry.remaining -= 1
+        if index == 0 and entry.remaining == 0:
+            self._reclaim()
+        return entry.item
+
+    def _reclaim(self) -> None:
+        buffer = self._buffer
+        while buffer and buffer[0].remaining == 0:
+            buffer.popleft()
+            self._base += 1
+            # one putter per freed slot
+            _wakeup_next(self._putters)
+
+    def _unsubscribe(self, receiver: BroadcastReceiver[T]) -> None:
+        for entry in islice(self._buffer, receiver._cursor - self._base, None):
+            entry.remaining -= 1
+        receiver._cursor = self._end
+        self._num_receivers -= 1
+        self._reclaim()
+        # wake a Task blocked in receiver.get() so it can see it was unsubscribed
+        self._wakeup_receivers()
+
+
+class BroadcastReceiver(Generic[T]):
+    """A read cursor into a :class:`Broadcast` channel.
+
+    Created by :meth:`Broadcast.subscribe`; not intended to be constructed directly.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, channel: Broadcast[T]) -> None:
+        self._channel = channel
+        self._cursor: int = channel._end
+        self._subscribed: bool = True
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {self._channel!r} qsize={self.qsize()!r} at {pointer_str(self)}>"
+
+    @property
+    def channel(self) -> Broadcast[T]:
+        """The channel this receiver reads from."""
+        return self._channel
+
+    def qsize(self) -> int:
+        """Number of items available to this receiver."""
+        return self._channel._end - self._cursor
+
+    def empty(self) -> bool:
+        """Return ``True`` if there are no items available to this receiver, ``False`` otherwise."""
+        return self._cursor == self._channel._end
+
+    async def get(self) -> T:
+        """Return the next item from the channel.
+
+        If there is no item available, wait until one is.
+
+        Raises:
+            RuntimeError: If the receiver is or becomes unsubscribed.
+        """
+        while self.empty():
+            if not self._subscribed:
+                raise RuntimeError(f"{self!r} is unsubscribed")
+            await self._channel._not_empty.wait()
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        """Return the next item from the channel.
+
+        Return an item if one is immediately available, else raise
+        :exc:`~cocotb.queue.QueueEmpty`.
+
+        Raises:
+            RuntimeError: If the receiver is unsubscribed.
+        """
+        if not self._subscribed:
+            raise RuntimeError(f"{self!r} is unsubscribed")
+        if self.empty():
+            raise QueueEmpty()
+        return self._channel._consume(self)
+
+    def unsubscribe(self) -> None:
+        """Stop receiving items from the channel.
+
+        Items not yet retrieved by this receiver are released.
+        Calling this more than once has no effect.
+        """
+        if self._subscribed:
+            self._subscribed = False
+            self._channel._unsubscribe(self)
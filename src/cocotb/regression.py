@@ -15,17 +15,22 @@ import os
 import random
 import re
 import sys
+import tempfile
 import time
 import warnings
+from collections.abc import Callable
 from enum import Enum, auto
 from importlib import import_module
-from typing import Any, cast
-
-import pytest
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, cast
 
 import cocotb
+import cocotb._discovery_cache
 import cocotb._event_loop
 import cocotb._shutdown as shutdown
+import cocotb._test_queue
+import cocotb._worker
 import cocotb.handle
 import cocotb.simulator
 import cocotb.types._resolve
@@ -41,6 +46,9 @@ from cocotb.logging import ANSI
 from cocotb.simtime import get_sim_time
 from cocotb_tools import _env
 
+if TYPE_CHECKING:
+    import pytest
+
 __all__ = (
     "RegressionManager",
     "RegressionMode",
@@ -56,55 +64,55 @@ Test.__module__ = __name__
 TestFactory.__module__ = __name__
 
 
-_TestFailures: tuple[type[BaseException], ...] = (
-    AssertionError,
-    pytest.raises.Exception,  # type: ignore[attr-defined]
-)
+def _test_failures() -> tuple[type[BaseException], ...]:
+    # pytest is slow to import, and pytest.fail() can only be called if it was already imported.
+    pytest_module = sys.modules.get("pytest")
+    if pytest_module is None:
+        return (AssertionError,)
+    return (AssertionError, pytest_module.fail.Exception)
 
-if hasattr(pytest, "RaisesGroup") and hasattr(pytest, "RaisesExc"):
 
-    def handle_pytest_exception_matchers(
-        exc: BaseException,
-        expected_error_set: set[
-            type[BaseException] | pytest.RaisesExc | pytest.RaisesGroup
-        ],
-    ) -> tuple[set[pytest.RaisesExc | pytest.RaisesGroup], bool]:
-        """Filter out :class:`pytest.RaisesExc` and :class:`pytest.RaisesGroup` exceptions and do checking on them.
-
-        Args:
-            exc: The exception result of the test.
-            expected_error_set: The set of expected exceptions and :class:`!pytest.RaisesExc` and :class:`!pytest.RaisesGroup` objects.
+def handle_pytest_exception_matchers(
+    exc: BaseException,
+    expected_error_set: set[
+        type[BaseException] | pytest.RaisesExc | pytest.RaisesGroup
+    ],
+) -> tuple[set[pytest.RaisesExc | pytest.RaisesGroup], bool]:
+    """Filter out :class:`pytest.RaisesExc` and :class:`pytest.RaisesGroup` exceptions and do checking on them.
 
-        Returns:
-            A tuple of the filtered out :class:`!pytest.RaisesExc` and :class:`!pytest.RaisesGroup` objects
-            (so that the caller may remove them from the exception set)
-            and a boolean whether there was a match.
-        """
-        exception_matcher_excs = cast(
-            "set[pytest.RaisesExc | pytest.RaisesGroup]",
-            {
-                exc
-                for exc in expected_error_set
-                if isinstance(exc, (pytest.RaisesExc, pytest.RaisesGroup))
-            },
-        )
+    Args:
+        exc: The exception result of the test.
+        expected_error_set: The set of expected exceptions and :class:`!pytest.RaisesExc` and :class:`!pytest.RaisesGroup` objects.
 
-        for exception_matcher_exc in exception_matcher_excs:
-            if exception_matcher_exc.matches(exc):
-                # We got an exception that matches an exception matcher, so we consider the test passed.
-                return exception_matcher_excs, True
+    Returns:
+        A tuple of the filtered out :class:`!pytest.RaisesExc` and :class:`!pytest.RaisesGroup` objects
+        (so that the caller may remove them from the exception set)
+        and a boolean whether there was a match.
+    """
+    # pytest is slow to import, and RaisesExc and RaisesGroup objects can only exist if it was already imported.
+    pytest_module = sys.modules.get("pytest")
+    if (
+        pytest_module is None
+        or not hasattr(pytest_module, "RaisesExc")
+        or not hasattr(pytest_module, "RaisesGroup")
+    ):
+        return set(), False
 
-        return exception_matcher_excs, False
+    exception_matcher_excs = cast(
+        "set[pytest.RaisesExc | pytest.RaisesGroup]",
+        {
+            exc
+            for exc in expected_error_set
+            if isinstance(exc, (pytest_module.RaisesExc, pytest_module.RaisesGroup))
+        },
+    )
 
-else:
+    for exception_matcher_exc in exception_matcher_excs:
+        if exception_matcher_exc.matches(exc):
+            # We got an exception that matches an exception matcher, so we consider the test passed.
+            return exception_matcher_excs, True
 
-    def handle_pytest_exception_matchers(
-        exc: BaseException,
-        expected_error_set: set[
-            type[BaseException] | pytest.RaisesExc | pytest.RaisesGroup
-        ],
-    ) -> tuple[set[pytest.RaisesExc | pytest.RaisesGroup], bool]:
-        return set(), False
+    return exception_matcher_excs, False
 
 
 class SimFailure(BaseException):
@@ -233,7 +241,14 @@ class RegressionManager:
         )
         self._random_state: Any
         self._max_failures = _env.get_int("COCOTB_MAX_FAILURES", default=0)
+        self._shard_index = _env.get_int("COCOTB_SHARD_INDEX", default=0)
+        self._shard_count = _env.get_int("COCOTB_SHARD_COUNT", default=1)
+        self._queue = cocotb._test_queue.from_env()
+        self._discovery_cache = cocotb._discovery_cache.from_env()
         self._random_x_resolver_state: Any
+        self._checkpoint: Test | None = None
+        self._checkpoint_failed = False
+        self._checkpoint_state: str | None = None
 
         # Setup xUnit
         ###################
@@ -247,40 +262,138 @@ class RegressionManager:
         """Discover tests in files automatically.
 
         Should be called before :meth:`start_regression` is called.
+        Parametrized tests which none of the filters added before with :meth:`add_filters` match
+        aren't generated, and with :envvar:`COCOTB_DISCOVERY_CACHE`,
+        modules without a matching test aren't imported.
 
         Args:
             modules: Each argument given is the name of a module where tests are found.
         """
+        include = self._discovery_filter()
+        found_test = False
         for module_name in modules:
-            mod = import_module(module_name)
-
-            found_test = False
-            for obj_name, obj in vars(mod).items():
-                if isinstance(obj, Test):
-                    found_test = True
-                    self.register_test(obj)
-                elif isinstance(obj, TestGenerator):
-                    found_test = True
-                    generated_tests = False
-                    for test in obj.generate_tests():
-                        generated_tests = True
+            cached = (
+                None
+                if self._discovery_cache is None
+                else self._discovery_cache.get(module_name)
+            )
+            if cached and include is not None:
+                found_test = True
+                selected = [
+                    test for test in cached if test.checkpoint or include(test.fullname)
+                ]
+                if not selected:
+                    self.log.debug(
+                        "Not importing %s, none of its tests match the filters",
+                        module_name,
+                    )
+                    continue
+                tests = self._tests_from_cache(import_module(module_name), selected)
+                if tests is not None:
+                    for test in tests:
                         self.register_test(test)
-                    if not generated_tests:
-                        warnings.warn(
-                            f"TestGenerator generated no tests: {module_name}.{obj_name}",
-                            stacklevel=2,
-                        )
+                    continue
+                cached = None
+            found_test |= self._discover_module(
+                module_name, include, record=cached is None
+            )
 
-            if not found_test:
-                warnings.warn(
-                    f"No tests were discovered in module: {module_name}", stacklevel=2
-                )
+        if self._discovery_cache is not None:
+            self._discovery_cache.save()
 
-        # error if no tests were discovered
-        if not self._test_queue:
+        # error if no tests were discovered, not counting those left out by the filters
+        if not self._test_queue and not (found_test and include is not None):
             modules_str = ", ".join(repr(m) for m in modules)
             raise RuntimeError(f"No tests were discovered in any module: {modules_str}")
 
+    def _discovery_filter(self) -> Callable[[str], bool] | None:
+        # With a random test order, the seed orders all tests before they are filtered,
+        # so all of them are discovered to run the matching tests in the same order.
+        # Listing the tests lists all of them.
+        if (
+            not self._filters
+            or self._random_test_order
+            or _env.get_bool("COCOTB_LIST_TESTS", False)
+        ):
+            return None
+        filters = self._filters
+        return lambda name: any(f.search(name) for f in filters)
+
+    def _discover_module(
+        self, module_name: str, include: Callable[[str], bool] | None, record: bool
+    ) -> bool:
+        """Register the tests in the module *module_name*, returning whether it has any tests."""
+        cache = self._discovery_cache if record else None
+        if cache is not None:
+            # Every test is generated to cache all of their names.
+            include = None
+        mod = import_module(module_name)
+        cached_tests: list[cocotb._discovery_cache.CachedTest] = []
+
+        found_test = False
+        for obj_name, obj in vars(mod).items():
+            if isinstance(obj, Test):
+                found_test = True
+                cached_tests.append(
+                    cocotb._discovery_cache.CachedTest(
+                        obj_name, None, obj.fullname, obj.checkpoint
+                    )
+                )
+                self.register_test(obj)
+            elif isinstance(obj, TestGenerator):
+                found_test = True
+                if obj.sample is not None:
+                    # the sample depends on the seed, not only on the module's files
+                    cache = None
+                # the checkpoint test is run regardless of the filters
+                tests = obj._generate_tests(
+                    include=None if obj.checkpoint else include,
+                    seed=self._regression_seed,
+                )
+                for indexes, test in tests:
+                    cached_tests.append(
+                        cocotb._discovery_cache.CachedTest(
+                            obj_name, indexes, test.fullname, test.checkpoint
+                        )
+                    )
+                    self.register_test(test)
+                if any(not values for _, values in obj.options):
+                    warnings.warn(
+                        f"TestGenerator generated no tests: {module_name}.{obj_name}",
+                        stacklevel=3,
+                    )
+
+        if not found_test:
+            warnings.warn(
+                f"No tests were discovered in module: {module_name}", stacklevel=3
+            )
+
+        if cache is not None:
+            cache.add(module_name, cached_tests)
+        return found_test
+
+    def _tests_from_cache(
+        self, mod: ModuleType, cached_tests: list[cocotb._discovery_cache.CachedTest]
+    ) -> list[Test] | None:
+        """Return the tests in *mod* which are *cached_tests*, or ``None`` if *mod* no longer has them."""
+        tests: list[Test] = []
+        for cached_test in cached_tests:
+            obj = vars(mod).get(cached_test.attr)
+            if isinstance(obj, Test) and cached_test.indexes is None:
+                test = obj
+            elif isinstance(obj, TestGenerator) and cached_test.indexes is not None:
+                try:
+                    ((_, test),) = obj._generate_tests(indexes=[cached_test.indexes])
+                except IndexError:
+                    return None
+            else:
+                return None
+            if test.fullname != cached_test.fullname:
+                # the options depend on something besides the module's files
+                return None
+            tests.append(test)
+        return tests
+
     def add_filters(self, *filters: str) -> None:
         """Add regular expressions to filter-in registered tests.
 
@@ -353,6 +466,15 @@ class RegressionManager:
         # sort tests into stages
         self._test_queue.sort(key=lambda test: test.stage)
 
+        # the checkpoint test is run first and regardless of the filters
+        checkpoints = [test for test in self._test_queue if test.checkpoint]
+        if len(checkpoints) > 1:
+            names = ", ".join(test.fullname for test in checkpoints)
+            raise RuntimeError(f"Only one test may be a checkpoint, got: {names}")
+        elif checkpoints:
+            self._checkpoint = checkpoints[0]
+            self._test_queue.remove(self._checkpoint)
+
         # mark tests for running and count included tests
         if self._filters:
             self._test_queue = [
@@ -360,6 +482,20 @@ class RegressionManager:
                 for test in self._test_queue
                 if any(f.search(test.fullname) for f in self._filters)
             ]
+
+        # only run this process's share of the tests, the other shards run the rest
+        if self._shard_count > 1:
+            self._test_queue = self._test_queue[self._shard_index :: self._shard_count]
+
+        # the tests are claimed one at a time, so claim the longest first
+        if self._queue is not None:
+            queue = self._queue
+            self._test_queue.sort(
+                key=lambda test: (test.stage, -queue.duration(test.fullname))
+            )
+
+        if self._checkpoint is not None:
+            self._test_queue.insert(0, self._checkpoint)
         self.total_tests = len(self._test_queue)
 
         # compute counts
@@ -384,6 +520,13 @@ class RegressionManager:
         while self._test_queue:
             self._test = self._test_queue.pop(0)
 
+            # leave tests another process claimed, or which it can run after this process failed
+            if self._queue is not None and self._test is not self._checkpoint:
+                if self._regression_terminated is not None or not self._queue.claim(
+                    self._test.fullname
+                ):
+                    continue
+
             # if the test is skipped, record and continue
             if self._test.skip and self._mode != RegressionMode.TESTCASE:
                 current_sim_time = get_sim_time("ns")
@@ -393,6 +536,9 @@ class RegressionManager:
                     sim_time_stop=current_sim_time,
                     msg=None,
                 )
+                if self._test is self._checkpoint:
+                    # the other tests start from time zero as usual
+                    self._checkpoint = None
                 continue
 
             # if the test should be run, but the simulator has failed, record and continue
@@ -405,24 +551,58 @@ class RegressionManager:
                 )
                 continue
 
-            # initialize the test, if it fails, record and continue
-            try:
-                self._running_test = self._init_test()
-            except Exception:  # noqa: BLE001
-                self._record_test_init_failed()
-                continue
-
-            self._log_test_start()
+            # start the test from the state the checkpoint test left the simulation in
+            if self._checkpoint is not None and self._test is not self._checkpoint:
+                if self._checkpoint_failed:
+                    current_sim_time = get_sim_time("ns")
+                    self._record_test_skipped(
+                        wall_time_s=0,
+                        sim_time_start=current_sim_time,
+                        sim_time_stop=current_sim_time,
+                        msg=f"checkpoint {self._checkpoint.fullname} did not pass",
+                    )
+                    continue
+                assert self._checkpoint_state is not None
+                try:
+                    cocotb.simulator.restore_state(self._checkpoint_state)
+                except RuntimeError as e:
+                    current_sim_time = get_sim_time("ns")
+                    self._record_test_failed(
+                        wall_time_s=0,
+                        sim_time_start=current_sim_time,
+                        sim_time_stop=current_sim_time,
+                        result=e,
+                        msg="failed to restore the checkpoint",
+                    )
+                    continue
 
-            if self._first_test:
-                self._first_test = False
-                return self._schedule_next_test()
-            else:
-                self._timer1._register(self._schedule_next_test)
+            if self._start_test():
                 return
 
         return self._tear_down()
 
+    def _start_test(self) -> bool:
+        """Initialize and schedule the current test.
+
+        Returns:
+            ``False`` if the test failed to initialize, so the next test should be run.
+        """
+        # initialize the test, if it fails, record and continue
+        try:
+            self._running_test = self._init_test()
+        except Exception:  # noqa: BLE001
+            self._record_test_init_failed()
+            return False
+
+        self._log_test_start()
+
+        if self._first_test:
+            self._first_test = False
+            self._schedule_next_test()
+        else:
+            self._timer1._register(self._schedule_next_test)
+        return True
+
     def _init_test(self) -> TestManager:
         coro = self._test.func(cocotb.top, *self._test.args, **self._test.kwargs)
         return TestManager(
@@ -432,6 +612,35 @@ class RegressionManager:
             timeout=self._test.timeout,
         )
 
+    def _save_checkpoint(self) -> None:
+        """Called by :meth:`_test_complete` when the checkpoint test is complete."""
+        assert self._checkpoint is not None
+        if self._test_results[-1].outcome is not _TestOutcome.PASS:
+            self._checkpoint_failed = True
+            self.log.warning(
+                "Checkpoint %s did not pass, skipping all other tests",
+                self._checkpoint.fullname,
+            )
+            return
+
+        fd, name = tempfile.mkstemp(prefix="cocotb_checkpoint_", dir=".")
+        os.close(fd)
+        path = Path(name)
+        try:
+            cocotb.simulator.save_state(name)
+        except (NotImplementedError, RuntimeError) as e:
+            path.unlink()
+            self.log.warning(
+                "%s, so the tests after checkpoint %s don't start from its state, "
+                "but run one after another as without a checkpoint",
+                e,
+                self._checkpoint.fullname,
+            )
+            self._checkpoint = None
+            return
+        self._checkpoint_state = name
+        shutdown.register(path.unlink)
+
     def _schedule_next_test(self) -> None:
         # seed random number generator based on test module, name, and COCOTB_RANDOM_SEED
         hasher = hashlib.sha1()
@@ -471,6 +680,11 @@ class RegressionManager:
         # Generate output reports
         self.xunit.write(os.getenv("COCOTB_RESULTS_FILE", "results.xml"))
 
+        # Keep simulating for the tests the runner sends next, unless the simulator failed.
+        if self._regression_terminated is None and cocotb._worker.wait_for_tests():
+            self._timer1._register(_run_next_regression)
+            return
+
         # We shut down here since the shutdown callback isn't called if stop_simulator is called.
         shutdown._shutdown()
 
@@ -505,6 +719,9 @@ class RegressionManager:
             sim_time_stop,
         )
 
+        if self._test is self._checkpoint:
+            self._save_checkpoint()
+
         # Run next test.
         return self._execute()
 
@@ -518,8 +735,12 @@ class RegressionManager:
         test = self._test
 
         if exc is not None:
+            # pytest is slow to import, and pytest.skip() and pytest.xfail() can only be called if it was already imported.
+            pytest_module = sys.modules.get("pytest")
             # These special exceptions take precedence over expect_error and expect_fail.
-            if isinstance(exc, pytest.skip.Exception):
+            if pytest_module is not None and isinstance(
+                exc, pytest_module.skip.Exception
+            ):
                 # We got a skip exception, so we consider the test skipped.
                 return self._record_test_skipped(
                     wall_time_s=wall_time_s,
@@ -527,7 +748,9 @@ class RegressionManager:
                     sim_time_stop=sim_time_stop,
                     msg=exc.msg,
                 )
-            elif isinstance(exc, pytest.xfail.Exception):
+            elif pytest_module is not None and isinstance(
+                exc, pytest_module.xfail.Exception
+            ):
                 # We got an xfail exception, so we consider the test xfailed.
                 return self._record_test_xfail(
                     wall_time_s=wall_time_s,
@@ -574,7 +797,7 @@ class RegressionManager:
                         result=exc,
                         msg="errored as expected",
                     )
-                elif isinstance(exc, _TestFailures):
+                elif isinstance(exc, _test_failures()):
                     # We got a failure exception but expected an error.
                     return self._record_test_failed(
                         wall_time_s=wall_time_s,
@@ -593,7 +816,7 @@ class RegressionManager:
                         msg="errored with unexpected type",
                     )
             elif test.expect_fail:
-                if isinstance(exc, _TestFailures):
+                if isinstance(exc, _test_failures()):
                     # We expected a failure and got one.
                     return self._record_test_xfail(
                         wall_time_s=wall_time_s,
@@ -1146,16 +1369,13 @@ def _setup_regression_manager() -> None:
     global _manager_inst
     _manager_inst = RegressionManager()
 
-    # discover tests
     modules: list[str] = _env.get_list("COCOTB_TEST_MODULES")
     if not modules:
         raise RuntimeError(
             "Environment variable COCOTB_TEST_MODULES, which defines the module(s) to execute, is not defined or empty."
         )
-    _manager_inst.setup_pytest_assertion_rewriting()
-    _manager_inst.discover_tests(*modules)
 
-    # filter tests
+    # filter tests, before discovering them so tests which are filtered out needn't be discovered
     testcases: list[str] = _env.get_list("COCOTB_TESTCASE")
     test_filter: str = _env.get_str("COCOTB_TEST_FILTER")
     if testcases and test_filter:
@@ -1173,6 +1393,9 @@ def _setup_regression_manager() -> None:
         _manager_inst.add_filters(test_filter)
         _manager_inst.set_mode(RegressionMode.TESTCASE)
 
+    # discover tests
+    _manager_inst.discover_tests(*modules)
+
 
 def _run_regression() -> None:
     """Setup and run a regression."""
@@ -1187,6 +1410,7 @@ def _run_regression() -> None:
     if not sys.warnoptions:
         warnings.simplefilter("default")
 
+    RegressionManager.setup_pytest_assertion_rewriting()
     _setup_regression_manager()
 
     if _env.get_bool("COCOTB_LIST_TESTS", False):
@@ -1194,3 +1418,10 @@ def _run_regression() -> None:
     else:
         _manager_inst.start_regression()
         shutdown.register(_manager_inst._on_sim_end)
+
+
+def _run_next_regression() -> None:
+    """Run the tests a runner sent to the simulator after the previous tests finished."""
+    _setup_regression_manager()
+    _manager_inst.start_regression()
+    shutdown.register(_manager_inst._on_sim_end)
@@ -141,6 +141,97 @@ GPI_EXPORT const char *gpi_get_simulator_version(void);
  */
 GPI_EXPORT int gpi_get_simulator_args(int *argc, char const *const **argv);
 
+/** Function saving or restoring the state of the simulation to or from a file.
+ *
+ * @param path  The file to save the state to or restore it from.
+ * @return      Zero on success, non-zero on failure.
+ */
+typedef int (*gpi_state_func)(const char *path);
+
+/** Register the functions that save and restore the state of the simulation.
+ *
+ * Called by the main program of simulators which can save and restore the
+ * state of the design and the simulation time, but not through their
+ * simulator interface, such as Verilator models built with `--savable`.
+ *
+ * @param save     Function saving the state.
+ * @param restore  Function restoring the state.
+ */
+GPI_EXPORT void gpi_register_state_funcs(gpi_state_func save,
+                                         gpi_state_func restore);
+
+/** Save the state of the design and the simulation time to a file.
+ *
+ * @param path  The file to save the state to.
+ * @return      `0` on success, `1` if the simulator can't save its state,
+ *              `-1` on failure.
+ */
+GPI_EXPORT int gpi_save_state(const char *path);
+
+/** Restore the state of the design and the simulation time from a file.
+ *
+ * The state must have been saved by @ref gpi_save_state in a simulation of
+ * the same build. Must not be called while any callbacks are registered
+ * whose time would become invalid.
+ *
+ * @param path  The file to restore the state from.
+ * @return      `0` on success, `1` if the simulator can't restore its state,
+ *              `-1` on failure.
+ */
+GPI_EXPORT int gpi_restore_state(const char *path);
+
+/** Function starting to trace signals to a file.
+ *
+ * @param path    The file to trace to.
+ * @param depth   Number of hierarchy levels below *scope* to trace,
+ *                `0` for all.
+ * @param scope   Hierarchical name of the scope to trace, empty for all.
+ * @param rotate  Simulation time after which to continue in the next file,
+ *                `0` to never rotate.
+ * @return        Zero on success, non-zero on failure.
+ */
+typedef int (*gpi_trace_start_func)(const char *path, int depth,
+                                    const char *scope, uint64_t rotate);
+
+/** Function stopping to trace signals.
+ *
+ * @return  Zero on success, non-zero on failure.
+ */
+typedef int (*gpi_trace_stop_func)(void);
+
+/** Register the functions that start and stop tracing signals.
+ *
+ * Called by the main program of simulators which trace signals themselves,
+ * not through their simulator interface, such as Verilator models built with
+ * `--trace`.
+ *
+ * @param start  Function starting to trace.
+ * @param stop   Function stopping to trace.
+ */
+GPI_EXPORT void gpi_register_trace_funcs(gpi_trace_start_func start,
+                                         gpi_trace_stop_func stop);
+
+/** Start tracing signals to a file, closing the file traced to before.
+ *
+ * @param path    The file to trace to.
+ * @param depth   Number of hierarchy levels below *scope* to trace,
+ *                `0` for all.
+ * @param scope   Hierarchical name of the scope to trace, empty for all.
+ * @param rotate  Simulation time in steps after which to continue in the
+ *                next file, `0` to never rotate.
+ * @return        `0` on success, `1` if the simulator can't trace,
+ *                `-1` on failure.
+ */
+GPI_EXPORT int gpi_trace_start(const char *path, int depth, const char *scope,
+                               uint64_t rotate);
+
+/** Stop tracing signals and close the file traced to.
+ *
+ * @return  `0` on success, `1` if the simulator can't trace,
+ *          `-1` on failure.
+ */
+GPI_EXPORT int gpi_trace_stop(void);
+
 /** @} */  // End of group SimIntf
 
 /** @defgroup ObjQuery Simulation Object Query
@@ -183,6 +274,20 @@ GPI_EXPORT gpi_sim_hdl gpi_get_handle_by_name(gpi_sim_hdl parent,
 GPI_EXPORT gpi_sim_hdl gpi_get_handle_by_index(gpi_sim_hdl parent,
                                                int32_t index);
 
+/** Statistics of the store of unique simulation object handles. */
+typedef struct gpi_handle_stats_s {
+    uint64_t handles;         ///< Number of unique object handles.
+    uint64_t names;           ///< Number of distinct (interned) object names.
+    uint64_t name_bytes;      ///< Characters stored for interned names.
+    uint64_t fullname_bytes;  ///< Characters stored for full names.
+} gpi_handle_stats;
+
+/** Get statistics of the store of unique simulation object handles.
+ *
+ * @param stats  Location to return the statistics.
+ */
+GPI_EXPORT void gpi_get_handle_stats(gpi_handle_stats *stats);
+
 /** @} */  // End of group ObjQuery
 
 /** @defgroup ObjProps General Object Properties
@@ -381,6 +486,49 @@ typedef enum gpi_iterator_sel_e {
 GPI_EXPORT gpi_iterator_hdl gpi_iterate(gpi_sim_hdl base,
                                         gpi_iterator_sel type);
 
+/** Start iteration on a simulation object, skipping unwanted children.
+ *
+ * Like @ref gpi_iterate, but children are checked against the filter before
+ * handles are created for them where the implementation allows it, so
+ * skipped children cost little.
+ *
+ * @param base     Simulation object to iterate over.
+ * @param type     Iteration type.
+ * @param pattern  Shell-style pattern the child's name must match, with the
+ *                 same case-sensitive semantics as Python's
+ *                 `fnmatch.fnmatchcase()`. `NULL` or empty to match any name.
+ * @param types    Bitmask of `1 << gpi_objtype` of the types of children to
+ *                 return. `0` to match any type.
+ * @return         An iterator handle which can then be used with @ref gpi_next.
+ */
+GPI_EXPORT gpi_iterator_hdl gpi_iterate_filtered(gpi_sim_hdl base,
+                                                 gpi_iterator_sel type,
+                                                 const char *pattern,
+                                                 uint64_t types);
+
+/** Function called by @ref gpi_scan for every object found.
+ *
+ * @param data    The *data* passed to @ref gpi_scan.
+ * @param hdl     The object found.
+ * @param parent  The position of the object's parent in the order of calls,
+ *                starting at `0`, or `-1` if the parent is the base object.
+ */
+typedef void (*gpi_scan_visitor)(void *data, gpi_sim_hdl hdl, int32_t parent);
+
+/** Find all objects in the hierarchy below a simulation object in one call.
+ *
+ * Iterates over the objects of the base object and, recursively, of every
+ * module, structure, generate array, and package found, calling *visit*
+ * once for each object. Parents are always visited before their children.
+ *
+ * @param base   Simulation object to scan below.
+ * @param visit  Function to call for every object found.
+ * @param data   Data to pass to *visit*.
+ * @return       The number of objects found.
+ */
+GPI_EXPORT int32_t gpi_scan(gpi_sim_hdl base, gpi_scan_visitor visit,
+                            void *data);
+
 /** Get next object in iteration.
  *
  * @param iterator  Iterator handle.
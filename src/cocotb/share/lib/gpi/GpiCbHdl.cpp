@@ -7,7 +7,7 @@
 
 #include "./gpi_priv.hpp"
 
-const char *GpiObjHdl::get_name_str() { return m_name.c_str(); }
+const char *GpiObjHdl::get_name_str() { return get_name().c_str(); }
 
 const char *GpiObjHdl::get_fullname_str() { return m_fullname.c_str(); }
 
@@ -43,7 +43,10 @@ const char *GpiObjHdl::get_type_str() {
     return ret;
 }
 
-const std::string &GpiObjHdl::get_name() { return m_name; }
+const std::string &GpiObjHdl::get_name() {
+    static const std::string unknown("unknown");
+    return m_name ? *m_name : unknown;
+}
 
 /* Genertic base clss implementations */
 bool GpiHdl::is_this_impl(GpiImplInterface *impl) {
@@ -51,7 +54,84 @@ bool GpiHdl::is_this_impl(GpiImplInterface *impl) {
 }
 
 int GpiObjHdl::initialise(const std::string &name, const std::string &fq_name) {
-    m_name = name;
+    m_name = &gpi_intern_name(name);
     m_fullname = fq_name;
     return 0;
 }
+
+/* Match c against the bracket expression starting after the '[' at p, leaving
+ * p after the closing ']'. Returns false if the expression is unterminated, in
+ * which case the '[' is matched literally like fnmatch does.
+ */
+static bool glob_match_class(const char *&p, char c, bool &matched) {
+    const char *q = p;
+    bool negate = false;
+    if (*q == '!') {
+        negate = true;
+        ++q;
+    }
+    bool found = false;
+    bool first = true;
+    while (*q && (first || *q != ']')) {
+        first = false;
+        char lo = *q++;
+        char hi = lo;
+        if (*q == '-' && q[1] && q[1] != ']') {
+            hi = q[1];
+            q += 2;
+        }
+        if (lo <= c && c <= hi) {
+            found = true;
+        }
+    }
+    if (!*q) {
+        return false;
+    }
+    p = q + 1;
+    matched = found != negate;
+    return true;
+}
+
+/* Case-sensitive shell-style matching of '*', '?', '[seq]' and '[!seq]', with
+ * the same semantics as Python's fnmatch.fnmatchcase().
+ */
+static bool glob_match(const char *pat, const char *str) {
+    const char *star_pat = nullptr;
+    const char *star_str = nullptr;
+    while (*str) {
+        if (*pat == '*') {
+            star_pat = ++pat;
+            star_str = str;
+            continue;
+        }
+        const char *next = pat + 1;
+        bool ok;
+        if (*pat == '?') {
+            ok = true;
+        } else if (*pat == '[') {
+            if (!glob_match_class(next, *str, ok)) {
+                ok = *str == '[';
+            }
+        } else {
+            ok = *pat && *pat == *str;
+        }
+        if (ok) {
+            pat = next;
+            ++str;
+        } else if (star_pat) {
+            // Let the last '*' consume one more character and retry.
+            pat = star_pat;
+            str = ++star_str;
+        } else {
+            return false;
+        }
+    }
+    while (*pat == '*') {
+        ++pat;
+    }
+    return !*pat;
+}
+
+bool GpiIterator::name_matches(const std::string &name) const {
+    return m_pattern.empty() || glob_match(m_pattern.c_str(), name.c_str());
+}
@@ -8,8 +8,11 @@
 #include <sys/types.h>
 
 #include <algorithm>
+#include <functional>
 #include <map>
 #include <string>
+#include <unordered_map>
+#include <unordered_set>
 #include <utility>
 #include <vector>
 
@@ -23,18 +26,50 @@ static vector<std::pair<int (*)(void *), void *>> start_of_sim_time_cbs;
 static vector<std::pair<void (*)(void *), void *>> end_of_sim_time_cbs;
 static vector<std::pair<void (*)(void *), void *>> finalize_cbs;
 
+// Pool of interned object names. std::unordered_set never moves its
+// elements, so references to them stay valid as the pool grows.
+class GpiNamePool {
+  public:
+    const std::string &intern(const std::string &name) {
+        auto res = pool.insert(name);
+        if (res.second) {
+            bytes += name.size();
+        }
+        return *res.first;
+    }
+
+    uint64_t count() { return pool.size(); }
+
+    uint64_t byte_count() { return bytes; }
+
+  private:
+    std::unordered_set<std::string> pool;
+    uint64_t bytes = 0;
+};
+
+static GpiNamePool &name_pool() {
+    // Constructed on first use so it is available to static initializers.
+    static GpiNamePool pool;
+    return pool;
+}
+
+const std::string &gpi_intern_name(const std::string &name) {
+    return name_pool().intern(name);
+}
+
 class GpiHandleStore {
   public:
     GpiObjHdl *check_and_store(GpiObjHdl *hdl) {
-        std::map<std::string, GpiObjHdl *>::iterator it;
-
         const std::string &name = hdl->get_fullname();
 
         LOG_DEBUG("Checking %s exists", name.c_str());
 
-        it = handle_map.find(name);
+        // The key points to the full name owned by the stored handle rather
+        // than holding a second copy of it.
+        auto it = handle_map.find(&name);
         if (it == handle_map.end()) {
-            handle_map[name] = hdl;
+            handle_map.emplace(&name, hdl);
+            fullname_bytes += name.size();
             return hdl;
         } else {
             LOG_DEBUG("Found duplicate %s", name.c_str());
@@ -46,18 +81,38 @@ class GpiHandleStore {
 
     uint64_t handle_count() { return handle_map.size(); }
 
-    void clear() {
-        std::map<std::string, GpiObjHdl *>::iterator it;
+    uint64_t fullname_byte_count() { return fullname_bytes; }
 
-        // Delete the object handles before clearing the map
-        for (it = handle_map.begin(); it != handle_map.end(); it++) {
-            delete (it->second);
+    void clear() {
+        // Delete the object handles after clearing the map, as the keys
+        // point into them
+        std::vector<GpiObjHdl *> handles;
+        handles.reserve(handle_map.size());
+        for (auto &entry : handle_map) {
+            handles.push_back(entry.second);
         }
         handle_map.clear();
+        fullname_bytes = 0;
+        for (auto hdl : handles) {
+            delete hdl;
+        }
     }
 
   private:
-    std::map<std::string, GpiObjHdl *> handle_map;
+    struct NameHash {
+        size_t operator()(const std::string *name) const {
+            return std::hash<std::string>()(*name);
+        }
+    };
+    struct NameEqual {
+        bool operator()(const std::string *a, const std::string *b) const {
+            return *a == *b;
+        }
+    };
+
+    std::unordered_map<const std::string *, GpiObjHdl *, NameHash, NameEqual>
+        handle_map;
+    uint64_t fullname_bytes = 0;
 };
 
 static GpiHandleStore unique_handles;
@@ -122,7 +177,81 @@ void gpi_finish() {
     }
 }
 
+static gpi_state_func save_state_func = nullptr;
+static gpi_state_func restore_state_func = nullptr;
+
+void gpi_register_state_funcs(gpi_state_func save, gpi_state_func restore) {
+    save_state_func = save;
+    restore_state_func = restore;
+}
+
+int gpi_save_state(const char *path) {
+    if (!save_state_func) {
+        return 1;
+    }
+    if (save_state_func(path)) {
+        LOG_ERROR("Failed to save the simulation state to '%s'", path);
+        return -1;
+    }
+    return 0;
+}
+
+int gpi_restore_state(const char *path) {
+    if (!restore_state_func) {
+        return 1;
+    }
+    if (restore_state_func(path)) {
+        LOG_ERROR("Failed to restore the simulation state from '%s'", path);
+        return -1;
+    }
+    return 0;
+}
+
+static gpi_trace_start_func trace_start_func = nullptr;
+static gpi_trace_stop_func trace_stop_func = nullptr;
+
+void gpi_register_trace_funcs(gpi_trace_start_func start,
+                              gpi_trace_stop_func stop) {
+    trace_start_func = start;
+    trace_stop_func = stop;
+}
+
+int gpi_trace_start(const char *path, int depth, const char *scope,
+                    uint64_t rotate) {
+    if (!trace_start_func) {
+        return 1;
+    }
+    if (trace_start_func(path, depth, scope, rotate)) {
+        LOG_ERROR("Failed to start tracing to '%s'", path);
+        return -1;
+    }
+    return 0;
+}
+
+int gpi_trace_stop() {
+    if (!trace_stop_func) {
+        return 1;
+    }
+    if (trace_stop_func()) {
+        LOG_ERROR("Failed to stop tracing");
+        return -1;
+    }
+    return 0;
+}
+
+void gpi_get_handle_stats(gpi_handle_stats *stats) {
+    stats->handles = unique_handles.handle_count();
+    stats->names = name_pool().count();
+    stats->name_bytes = name_pool().byte_count();
+    stats->fullname_bytes = unique_handles.fullname_byte_count();
+}
+
 void gpi_finalize(void) {
+    LOG_DEBUG("GPI handle store: %llu handles, %llu names (%llu bytes)",
+              (unsigned long long)unique_handles.handle_count(),
+              (unsigned long long)name_pool().count(),
+              (unsigned long long)(name_pool().byte_count() +
+                                   unique_handles.fullname_byte_count()));
     CLEAR_STORE();
     for (auto it = finalize_cbs.rbegin(); it != finalize_cbs.rend(); it++) {
         LOG_TRACE("[ GPI Finalize ] => User Finalize callback");
@@ -516,6 +645,53 @@ gpi_iterator_hdl gpi_iterate(gpi_sim_hdl obj_hdl, gpi_iterator_sel type) {
     return iter;
 }
 
+gpi_iterator_hdl gpi_iterate_filtered(gpi_sim_hdl obj_hdl,
+                                      gpi_iterator_sel type,
+                                      const char *pattern, uint64_t types) {
+    GpiIterator *iter = gpi_iterate(obj_hdl, type);
+    if (iter) {
+        iter->set_filter(pattern ? pattern : "", types);
+    }
+    return iter;
+}
+
+int32_t gpi_scan(gpi_sim_hdl base, gpi_scan_visitor visit, void *data) {
+    // Handles are unique, so this also catches generate pseudo-regions, which
+    // are found once per generate block.
+    std::unordered_set<GpiObjHdl *> seen;
+    std::vector<std::pair<GpiObjHdl *, int32_t>> scopes = {{base, -1}};
+    int32_t count = 0;
+
+    while (!scopes.empty()) {
+        GpiObjHdl *scope = scopes.back().first;
+        int32_t parent = scopes.back().second;
+        scopes.pop_back();
+
+        gpi_iterator_hdl iter = gpi_iterate(scope, GPI_OBJECTS);
+        if (!iter) {
+            continue;
+        }
+        while (GpiObjHdl *child = gpi_next(iter)) {
+            if (!seen.insert(child).second) {
+                continue;
+            }
+            visit(data, child, parent);
+            switch (child->get_type()) {
+                case GPI_MODULE:
+                case GPI_STRUCTURE:
+                case GPI_GENARRAY:
+                case GPI_PACKAGE:
+                    scopes.emplace_back(child, count);
+                    break;
+                default:
+                    break;
+            }
+            count++;
+        }
+    }
+    return count;
+}
+
 gpi_sim_hdl gpi_next(gpi_iterator_hdl iter) {
     std::string name;
     GpiObjHdl *parent = iter->get_parent();
@@ -528,6 +704,11 @@ gpi_sim_hdl gpi_next(gpi_iterator_hdl iter) {
         switch (ret) {
             case GpiIterator::NATIVE:
                 LOG_DEBUG("Create a native handle");
+                if (!iter->name_matches(next->get_name()) ||
+                    !iter->type_matches(next->get_type())) {
+                    delete next;
+                    continue;
+                }
                 return CHECK_AND_STORE(next);
             case GpiIterator::NATIVE_NO_NAME:
                 LOG_DEBUG("Unable to fully setup handle, skipping");
@@ -536,8 +717,14 @@ gpi_sim_hdl gpi_next(gpi_iterator_hdl iter) {
                 LOG_DEBUG(
                     "Found a name but unable to create via native "
                     "implementation, trying others");
+                if (!iter->name_matches(name)) {
+                    continue;
+                }
                 next = gpi_get_child_by_name(parent, name, iter->m_impl);
                 if (next) {
+                    if (!iter->type_matches(next->get_type())) {
+                        continue;
+                    }
                     return next;
                 }
                 LOG_WARN(
@@ -550,9 +737,15 @@ gpi_sim_hdl gpi_next(gpi_iterator_hdl iter) {
                     iter->m_impl->get_name_c());
                 next = gpi_get_child_from_handle(parent, raw_hdl, iter->m_impl);
                 if (next) {
+                    if (!iter->name_matches(next->get_name()) ||
+                        !iter->type_matches(next->get_type())) {
+                        continue;
+                    }
                     return next;
                 }
                 continue;
+            case GpiIterator::FILTERED:
+                continue;
             case GpiIterator::END:
                 LOG_DEBUG("Reached end of iterator");
                 delete iter;
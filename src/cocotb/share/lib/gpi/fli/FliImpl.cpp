@@ -991,6 +991,9 @@ GpiIterator::Status FliIterator::next_handle(std::string &name, GpiObjHdl **hdl,
         fq_name += "/" + name;
     }
 
+    if (!name_matches(name)) {
+        return GpiIterator::FILTERED;
+    }
     FliImpl *fli_impl = reinterpret_cast<FliImpl *>(m_impl);
     new_obj = fli_impl->create_gpi_obj_from_handle(obj, name, fq_name, accType,
                                                    accFullType);
@@ -321,13 +321,13 @@ const char *FliLogicObjHdl::get_signal_value_binstr() {
             }
         } break;
         default:
-            LOG_ERROR("Object type is not 'logic' for %s (%d)", m_name.c_str(),
+            LOG_ERROR("Object type is not 'logic' for %s (%d)", get_name_str(),
                       m_fli_type);
             return NULL;
     }
 
     LOG_DEBUG("Retrieved \"%s\" for value object %s", m_val_buff,
-              m_name.c_str());
+              get_name_str());
 
     return m_val_buff;
 }
@@ -646,7 +646,7 @@ double FliRealObjHdl::get_signal_value_real() {
     }
 
     LOG_DEBUG("Retrieved \"%f\" for value object %s", m_mti_buff[0],
-              m_name.c_str());
+              get_name_str());
 
     return m_mti_buff[0];
 }
@@ -720,7 +720,7 @@ const char *FliStringObjHdl::get_signal_value_str() {
     strncpy(m_val_buff, m_mti_buff, static_cast<size_t>(m_num_elems));
 
     LOG_DEBUG("Retrieved \"%s\" for value object %s", m_val_buff,
-              m_name.c_str());
+              get_name_str());
 
     return m_val_buff;
 }
@@ -97,7 +97,8 @@ class GPI_EXPORT GpiObjHdl : public GpiHdl {
     int m_range_left = -1;
     int m_range_right = -1;
     gpi_range_dir m_range_dir = GPI_RANGE_NO_DIR;
-    std::string m_name = "unknown";
+    // Leaf names repeat across instances, so they are interned.
+    const std::string *m_name = nullptr;
     std::string m_fullname = "unknown";
 
     std::string m_definition_name;
@@ -202,6 +203,7 @@ class GPI_EXPORT GpiIterator : public GpiHdl {
         NATIVE_NO_NAME,  // Native object was found but unable to fully create
         NOT_NATIVE,      // Non-native object was found but we did get a name
         NOT_NATIVE_NO_NAME,  // Non-native object was found without a name
+        FILTERED,  // Object was found but its name doesn't match the filter
         END
     };
 
@@ -217,8 +219,23 @@ class GPI_EXPORT GpiIterator : public GpiHdl {
 
     GpiObjHdl *get_parent() { return m_parent; }
 
+    /* Only yield children whose name matches the glob pattern and whose type
+     * bit (1 << gpi_objtype) is set in types. An empty pattern or zero types
+     * matches everything.
+     */
+    void set_filter(const std::string &pattern, uint64_t types) {
+        m_pattern = pattern;
+        m_types = types;
+    }
+    bool name_matches(const std::string &name) const;
+    bool type_matches(gpi_objtype type) const {
+        return !m_types || (m_types & (uint64_t(1) << type));
+    }
+
   protected:
     GpiObjHdl *m_parent;
+    std::string m_pattern;
+    uint64_t m_types = 0;
 };
 
 class GPI_EXPORT GpiImplInterface {
@@ -275,6 +292,9 @@ GPI_EXPORT void gpi_check_cleanup();
 GPI_EXPORT bool gpi_is_finalizing();
 GPI_EXPORT void gpi_init_logging_and_debug();
 
+// Return a pooled copy of name which lives until the program exits.
+const std::string &gpi_intern_name(const std::string &name);
+
 void *utils_dyn_open(const char *lib_name);
 void *utils_dyn_sym(void *handle, const char *sym_name);
 
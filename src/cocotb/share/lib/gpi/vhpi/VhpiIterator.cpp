@@ -290,6 +290,9 @@ GpiIterator::Status VhpiIterator::next_handle(std::string &name,
     } else {
         fq_name += "." + name;
     }
+    if (!name_matches(name)) {
+        return GpiIterator::FILTERED;
+    }
     VhpiImpl *vhpi_impl = reinterpret_cast<VhpiImpl *>(m_impl);
     new_obj = vhpi_impl->create_gpi_obj_from_handle(obj, name, fq_name);
     if (new_obj) {
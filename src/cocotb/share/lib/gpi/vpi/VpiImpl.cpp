@@ -861,6 +861,22 @@ COCOTBVPI_EXPORT void vlog_startup_routines_bootstrap() {
     vpi_main();
     LOG_TRACE("[ VPI (vlog_startup_routines_bootstrap) ] => Sim");
 }
+
+#ifdef VERILATOR
+// Lets verilator.cpp, which only links against this library, provide the
+// functions saving and restoring the model.
+COCOTBVPI_EXPORT void vlog_register_state_funcs(gpi_state_func save,
+                                                gpi_state_func restore) {
+    gpi_register_state_funcs(save, restore);
+}
+
+// Lets verilator.cpp provide the functions controlling the trace of the
+// model.
+COCOTBVPI_EXPORT void vlog_register_trace_funcs(gpi_trace_start_func start,
+                                                gpi_trace_stop_func stop) {
+    gpi_register_trace_funcs(start, stop);
+}
+#endif
 }
 
 GPI_ENTRY_POINT(cocotbvpi, register_impl)
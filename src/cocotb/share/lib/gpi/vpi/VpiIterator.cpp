@@ -403,6 +403,9 @@ GpiIterator::Status VpiIterator::next_handle(std::string &name, GpiObjHdl **hdl,
         fq_name += vpi_impl->get_type_delimiter(m_parent) + name;
     }
 
+    if (!name_matches(name)) {
+        return GpiIterator::FILTERED;
+    }
     LOG_DEBUG("vpi_scan found '%s'", fq_name.c_str());
     new_obj = vpi_impl->create_gpi_obj_from_handle(obj, name, fq_name);
     if (new_obj) {
@@ -16,6 +16,10 @@
 
 #include <cerrno>
 #include <cstdint>
+#include <deque>
+#include <string>
+#include <utility>
+#include <vector>
 
 #include "../utils.hpp"      // DEFER
 #include "./pygpi_priv.hpp"  // pygpi_logger_set_level, c_to_python, python_to_c
@@ -46,6 +50,23 @@ struct PythonCallback {
 class GpiClock;
 using gpi_clk_hdl = GpiClock *;
 
+class GpiSampler;
+using gpi_sampler_hdl = GpiSampler *;
+
+class GpiDriver;
+using gpi_driver_hdl = GpiDriver *;
+
+class GpiRecorder;
+using gpi_recorder_hdl = GpiRecorder *;
+
+// How a signal value is read from or written to the GPI by the native helpers
+enum gpi_value_format {
+    FORMAT_BINSTR = 0,  // gpi_[gs]et_signal_value_binstr(), as str
+    FORMAT_INT = 1,     // gpi_get_signal_value_long() / _int(), as int
+    FORMAT_REAL = 2,    // gpi_[gs]et_signal_value_real(), as float
+    FORMAT_STR = 3,     // gpi_[gs]et_signal_value_str(), as bytes
+};
+
 /* define the extension types as templates */
 namespace {
 template <typename gpi_hdl_type>
@@ -136,6 +157,12 @@ template <>
 PyTypeObject gpi_hdl_Object<gpi_cb_hdl>::py_type;
 template <>
 PyTypeObject gpi_hdl_Object<gpi_clk_hdl>::py_type;
+template <>
+PyTypeObject gpi_hdl_Object<gpi_sampler_hdl>::py_type;
+template <>
+PyTypeObject gpi_hdl_Object<gpi_driver_hdl>::py_type;
+template <>
+PyTypeObject gpi_hdl_Object<gpi_recorder_hdl>::py_type;
 }  // namespace
 
 typedef int (*gpi_function_t)(void *);
@@ -442,16 +469,67 @@ static PyObject *register_value_change_callback(
 
 static PyObject *iterate(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject *args) {
     int type;
+    const char *pattern = NULL;
+    unsigned long long types = 0;
 
-    if (!PyArg_ParseTuple(args, "i:iterate", &type)) {
+    if (!PyArg_ParseTuple(args, "i|zK:iterate", &type, &pattern, &types)) {
         return NULL;
     }
 
-    gpi_iterator_hdl result = gpi_iterate(self->hdl, (gpi_iterator_sel)type);
+    gpi_iterator_hdl result;
+    if (pattern || types) {
+        result = gpi_iterate_filtered(self->hdl, (gpi_iterator_sel)type,
+                                      pattern, types);
+    } else {
+        result = gpi_iterate(self->hdl, (gpi_iterator_sel)type);
+    }
 
     return gpi_hdl_New(result);
 }
 
+namespace {
+struct ScanResult {
+    PyObject *handles;
+    std::vector<int32_t> parents;
+    bool failed;
+};
+}  // namespace
+
+static void scan_visit(void *data, gpi_sim_hdl hdl, int32_t parent) {
+    ScanResult *result = static_cast<ScanResult *>(data);
+    if (result->failed) {
+        return;
+    }
+    PyObject *obj = gpi_hdl_New(hdl);
+    if (!obj || PyList_Append(result->handles, obj) < 0) {
+        result->failed = true;
+    }
+    Py_XDECREF(obj);
+    result->parents.push_back(parent);
+}
+
+static PyObject *scan(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject *) {
+    ScanResult result = {PyList_New(0), {}, false};
+    if (!result.handles) {
+        return NULL;
+    }
+
+    gpi_scan(self->hdl, scan_visit, &result);
+    if (result.failed) {
+        Py_DECREF(result.handles);
+        return NULL;
+    }
+
+    PyObject *parents = PyBytes_FromStringAndSize(
+        reinterpret_cast<const char *>(result.parents.data()),
+        static_cast<Py_ssize_t>(result.parents.size() * sizeof(int32_t)));
+    if (!parents) {
+        Py_DECREF(result.handles);
+        return NULL;
+    }
+    return Py_BuildValue("(NN)", result.handles, parents);
+}
+
 static PyObject *package_iterate(PyObject *, PyObject *) {
     gpi_iterator_hdl result = gpi_iterate(NULL, GPI_PACKAGE_SCOPES);
 
@@ -667,6 +745,18 @@ static PyObject *get_signed(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject *) {
     return PyLong_FromLong(result);
 }
 
+static PyObject *get_info(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject *) {
+    return Py_BuildValue(
+        "(sisssOiiii)", gpi_get_signal_name_str(self->hdl),
+        static_cast<int>(gpi_get_object_type(self->hdl)),
+        gpi_get_signal_type_str(self->hdl), gpi_get_definition_name(self->hdl),
+        gpi_get_definition_file(self->hdl),
+        gpi_is_constant(self->hdl) ? Py_True : Py_False,
+        gpi_get_range_left(self->hdl), gpi_get_range_right(self->hdl),
+        static_cast<int>(gpi_get_range_dir(self->hdl)),
+        gpi_is_signed(self->hdl));
+}
+
 static PyObject *is_running(PyObject *, PyObject *) {
     return PyBool_FromLong(gpi_has_registered_impl());
 }
@@ -715,6 +805,22 @@ static PyObject *get_precision(PyObject *, PyObject *) {
     return PyLong_FromLong(precision);
 }
 
+static PyObject *get_handle_stats(PyObject *, PyObject *) {
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    gpi_handle_stats stats;
+    gpi_get_handle_stats(&stats);
+
+    return Py_BuildValue("{sKsKsKsK}", "handles",
+                         (unsigned long long)stats.handles, "names",
+                         (unsigned long long)stats.names, "name_bytes",
+                         (unsigned long long)stats.name_bytes, "fullname_bytes",
+                         (unsigned long long)stats.fullname_bytes);
+}
+
 static PyObject *get_simulator_product(PyObject *, PyObject *) {
     if (!gpi_has_registered_impl()) {
         PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
@@ -733,6 +839,86 @@ static PyObject *get_simulator_version(PyObject *, PyObject *) {
     return PyUnicode_FromString(gpi_get_simulator_version());
 }
 
+static PyObject *state_call(PyObject *args, const char *format,
+                            int (*func)(const char *), const char *action) {
+    const char *path;
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    if (!PyArg_ParseTuple(args, format, &path)) {
+        return NULL;
+    }
+
+    int ret = func(path);
+    if (ret > 0) {
+        PyErr_Format(PyExc_NotImplementedError,
+                     "The simulator can't %s its state", action);
+        return NULL;
+    } else if (ret < 0) {
+        PyErr_Format(PyExc_RuntimeError, "Failed to %s the simulation state",
+                     action);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *save_state(PyObject *, PyObject *args) {
+    return state_call(args, "s:save_state", gpi_save_state, "save");
+}
+
+static PyObject *restore_state(PyObject *, PyObject *args) {
+    return state_call(args, "s:restore_state", gpi_restore_state, "restore");
+}
+
+static PyObject *trace_call_result(int ret, const char *action) {
+    if (ret > 0) {
+        PyErr_SetString(PyExc_NotImplementedError,
+                        "The simulator can't trace signals");
+        return NULL;
+    } else if (ret < 0) {
+        PyErr_Format(PyExc_RuntimeError, "Failed to %s tracing", action);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *trace_start(PyObject *, PyObject *args) {
+    const char *path;
+    int depth = 0;
+    const char *scope = "";
+    unsigned long long rotate = 0;
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    if (!PyArg_ParseTuple(args, "s|isK:trace_start", &path, &depth, &scope,
+                          &rotate)) {
+        return NULL;
+    }
+
+    if (depth < 0) {
+        PyErr_SetString(PyExc_ValueError, "depth must not be negative");
+        return NULL;
+    }
+
+    return trace_call_result(gpi_trace_start(path, depth, scope, rotate),
+                             "start");
+}
+
+static PyObject *trace_stop(PyObject *, PyObject *) {
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    return trace_call_result(gpi_trace_stop(), "stop");
+}
+
 static PyObject *get_argv(PyObject *, PyObject *) {
     if (!gpi_has_registered_impl()) {
         PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
@@ -1027,164 +1213,1223 @@ static PyObject *clk_stop(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *) {
     Py_RETURN_NONE;
 }
 
-static int add_module_constants(PyObject *simulator) {
-    // Make the GPI constants accessible from the C world
-    if (PyModule_AddIntConstant(simulator, "UNKNOWN", GPI_UNKNOWN) < 0 ||
-        PyModule_AddIntConstant(simulator, "MEMORY", GPI_MEMORY) < 0 ||
-        PyModule_AddIntConstant(simulator, "MODULE", GPI_MODULE) < 0 ||
-        PyModule_AddIntConstant(simulator, "NETARRAY", GPI_ARRAY) < 0 ||
-        PyModule_AddIntConstant(simulator, "ENUM", GPI_ENUM) < 0 ||
-        PyModule_AddIntConstant(simulator, "STRUCTURE", GPI_STRUCTURE) < 0 ||
-        PyModule_AddIntConstant(simulator, "PACKED_STRUCTURE",
-                                GPI_PACKED_STRUCTURE) < 0 ||
-        PyModule_AddIntConstant(simulator, "REAL", GPI_REAL) < 0 ||
-        PyModule_AddIntConstant(simulator, "INTEGER", GPI_INTEGER) < 0 ||
-        PyModule_AddIntConstant(simulator, "STRING", GPI_STRING) < 0 ||
-        PyModule_AddIntConstant(simulator, "FIXED_STRING", GPI_FIXED_STRING) <
-            0 ||
-        PyModule_AddIntConstant(simulator, "GENARRAY", GPI_GENARRAY) < 0 ||
-        PyModule_AddIntConstant(simulator, "PACKAGE", GPI_PACKAGE) < 0 ||
-        PyModule_AddIntConstant(simulator, "OBJECTS", GPI_OBJECTS) < 0 ||
-        PyModule_AddIntConstant(simulator, "DRIVERS", GPI_DRIVERS) < 0 ||
-        PyModule_AddIntConstant(simulator, "LOADS", GPI_LOADS) < 0 ||
-        PyModule_AddIntConstant(simulator, "RISING", GPI_RISING) < 0 ||
-        PyModule_AddIntConstant(simulator, "FALLING", GPI_FALLING) < 0 ||
-        PyModule_AddIntConstant(simulator, "VALUE_CHANGE", GPI_VALUE_CHANGE) <
-            0 ||
-        PyModule_AddIntConstant(simulator, "RANGE_UP", GPI_RANGE_UP) < 0 ||
-        PyModule_AddIntConstant(simulator, "RANGE_DOWN", GPI_RANGE_DOWN) < 0 ||
-        PyModule_AddIntConstant(simulator, "RANGE_NO_DIR", GPI_RANGE_NO_DIR) <
-            0 ||
-        PyModule_AddIntConstant(simulator, "LOGIC", GPI_LOGIC) < 0 ||
-        PyModule_AddIntConstant(simulator, "LOGIC_ARRAY", GPI_LOGIC_ARRAY) <
-            0 ||
-        false) {
-        return -1;
+class GpiSampler {
+  public:
+    GpiSampler(GpiObjHdl *edge_sig, gpi_edge edge, size_t capacity)
+        : m_edge_signal(edge_sig), m_edge(edge), m_capacity(capacity) {}
+
+    ~GpiSampler() {
+        stop();
+        Py_XDECREF(m_on_full);
     }
 
+    int add_signal(GpiObjHdl *sig, gpi_value_format format);
+
+    // Start sampling. Returns nonzero in case of failure:
+    //  - EBUSY if the sampler was already started (stop first)
+    //  - EAGAIN if registering the edge callback failed
+    int start(PyObject *on_full);
+
+    int stop();
+
+    // Remove all buffered samples and return them as a list of
+    // (time, value, ...) tuples.
+    PyObject *drain();
+
+    size_t size() const { return m_times.size(); }
+
+  private:
+    GpiObjHdl *m_edge_signal = nullptr;
+    gpi_edge m_edge;
+    size_t m_capacity;
+    std::vector<std::pair<GpiObjHdl *, gpi_value_format>> m_signals;
+
+    GpiCbHdl *m_edge_cb_hdl = nullptr;
+    GpiCbHdl *m_readonly_cb_hdl = nullptr;
+    PyObject *m_on_full = nullptr;
+
+    // Sample buffer, reserved for m_capacity samples on start. Values are
+    // stored in one column per value format in the order they were sampled.
+    std::vector<uint64_t> m_times;
+    std::vector<long> m_ints;
+    std::vector<double> m_reals;
+    std::vector<std::string> m_strs;
+
+    int register_edge();
+    int sample();
+    static int edge_cb(void *gpi_sampler);
+    static int readonly_cb(void *gpi_sampler);
+};
+
+int GpiSampler::add_signal(GpiObjHdl *sig, gpi_value_format format) {
+    if (m_edge_cb_hdl) {
+        return EBUSY;
+    }
+    if (format < FORMAT_BINSTR || format > FORMAT_STR) {
+        return EINVAL;
+    }
+    m_signals.emplace_back(sig, format);
     return 0;
 }
 
-// Add the extension types as entries in the module namespace
-static int add_module_types(PyObject *simulator) {
-    PyObject *typ;
+int GpiSampler::start(PyObject *on_full) {
+    if (m_edge_cb_hdl) {
+        return EBUSY;
+    }
 
-    typ = (PyObject *)&gpi_hdl_Object<gpi_sim_hdl>::py_type;
-    Py_INCREF(typ);
-    if (PyModule_AddObject(simulator, "sim_obj", typ) < 0) {
-        Py_DECREF(typ);
-        return -1;
+    Py_XINCREF(on_full);
+    Py_XDECREF(m_on_full);
+    m_on_full = on_full;
+
+    size_t n_strs = 0, n_ints = 0, n_reals = 0;
+    for (auto const &sig : m_signals) {
+        switch (sig.second) {
+            case FORMAT_INT:
+                ++n_ints;
+                break;
+            case FORMAT_REAL:
+                ++n_reals;
+                break;
+            default:
+                ++n_strs;
+                break;
+        }
     }
+    m_times.reserve(m_capacity);
+    m_ints.reserve(m_capacity * n_ints);
+    m_reals.reserve(m_capacity * n_reals);
+    m_strs.reserve(m_capacity * n_strs);
 
-    typ = (PyObject *)&gpi_hdl_Object<gpi_cb_hdl>::py_type;
-    Py_INCREF(typ);
-    if (PyModule_AddObject(simulator, "sim_callback", typ) < 0) {
-        Py_DECREF(typ);
+    return register_edge();
+}
+
+int GpiSampler::stop() {
+    // Drop the callback so it doesn't keep the Python object owning this one
+    // alive.
+    Py_CLEAR(m_on_full);
+    if (m_readonly_cb_hdl) {
+        gpi_remove_cb(m_readonly_cb_hdl);
+        m_readonly_cb_hdl = nullptr;
+    }
+    if (!m_edge_cb_hdl) {
         return -1;
     }
+    gpi_remove_cb(m_edge_cb_hdl);
+    m_edge_cb_hdl = nullptr;
+    return 0;
+}
 
-    typ = (PyObject *)&gpi_hdl_Object<gpi_iterator_hdl>::py_type;
-    Py_INCREF(typ);
-    if (PyModule_AddObject(simulator, "sim_obj_iterator", typ) < 0) {
-        Py_DECREF(typ);
-        return -1;
+int GpiSampler::register_edge() {
+    m_edge_cb_hdl = gpi_register_value_change_callback(
+        &GpiSampler::edge_cb, this, m_edge_signal, m_edge);
+    if (!m_edge_cb_hdl) {
+        // LCOV_EXCL_START
+        return EAGAIN;
+        // LCOV_EXCL_STOP
     }
+    return 0;
+}
 
-    typ = (PyObject *)&gpi_hdl_Object<gpi_clk_hdl>::py_type;
-    Py_INCREF(typ);
-    if (PyModule_AddObject(simulator, "cpp_clock", typ) < 0) {
+int GpiSampler::edge_cb(void *gpi_sampler) {
+    PYGPI_LOG_TRACE("GPI => [ PYGPI (GpiSampler) ]");
+    DEFER(PYGPI_LOG_TRACE("[ PYGPI (GpiSampler) ] => GPI"));
+    GpiSampler *sampler = (GpiSampler *)gpi_sampler;
+
+    if (sampler->register_edge() != 0) {
         // LCOV_EXCL_START
-        Py_DECREF(typ);
-        return -1;
+        PYGPI_LOG_ERROR("Sampler will be stopped: failed to register edge cb");
+        return 0;
         // LCOV_EXCL_STOP
     }
 
+    // Several edges in one time step only produce one sample.
+    if (!sampler->m_readonly_cb_hdl) {
+        sampler->m_readonly_cb_hdl =
+            gpi_register_readonly_callback(&GpiSampler::readonly_cb, sampler);
+        if (!sampler->m_readonly_cb_hdl) {
+            // LCOV_EXCL_START
+            PYGPI_LOG_ERROR("Sampler failed to register ReadOnly cb");
+            // LCOV_EXCL_STOP
+        }
+    }
     return 0;
 }
 
-/* NOTE: in the following docstrings we are specifying the parameters twice, but
- * this is necessary. The first docstring before the long '--' line specifies
- * the __text_signature__ that is used by the help() function. And the second
- * after the '--' line contains type annotations used by the
- * `autodoc_docstring_signature` setting of sphinx.ext.autodoc for generating
- * documentation because type annotations are not supported in
- * __text_signature__.
- */
+int GpiSampler::readonly_cb(void *gpi_sampler) {
+    PYGPI_LOG_TRACE("GPI => [ PYGPI (GpiSampler) ]");
+    DEFER(PYGPI_LOG_TRACE("[ PYGPI (GpiSampler) ] => GPI"));
+    GpiSampler *sampler = (GpiSampler *)gpi_sampler;
+    sampler->m_readonly_cb_hdl = nullptr;
+    return sampler->sample();
+}
 
-static PyMethodDef SimulatorMethods[] = {
-    {"get_root_handle", get_root_handle, METH_VARARGS,
-     PyDoc_STR("get_root_handle(name, /)\n"
-               "--\n\n"
-               "get_root_handle(name: str) -> cocotb.simulator.sim_obj\n"
-               "Get the root handle.")},
-    {"package_iterate", package_iterate, METH_NOARGS,
-     PyDoc_STR("package_iterate(/)\n"
-               "--\n\n"
-               "package_iterate() -> cocotb.simulator.sim_obj_iterator\n"
-               "Get an iterator handle to loop over all HDL packages.\n"
-               "\n"
-               ".. versionadded:: 2.0")},
-    {"root_iterate", root_iterate, METH_NOARGS,
-     PyDoc_STR("root_iterate(/)\n"
-               "--\n\n"
-               "root_iterate() -> cocotb.simulator.sim_obj_iterator\n"
-               "Get an iterator to loop over all root handles"
-               "only when there are multiple tops.\n"
-               "\n"
-               ".. versionadded:: 2.1")},
-    {"register_timed_callback", register_timed_callback, METH_VARARGS,
-     PyDoc_STR("register_timed_callback(time, func, /, *args)\n"
-               "--\n\n"
-               "register_timed_callback(time: int, func: Callable[..., Any], "
-               "*args: Any) -> cocotb.simulator.sim_callback\n"
-               "Register a timed callback.")},
-    {"register_value_change_callback", register_value_change_callback,
-     METH_VARARGS,
-     PyDoc_STR("register_value_change_callback(signal, func, edge, /, *args)\n"
-               "--\n\n"
-               "register_value_change_callback(signal: "
-               "cocotb.simulator.sim_obj, func: Callable[..., Any], edge: "
-               "int, *args: Any) -> cocotb.simulator.sim_callback\n"
-               "Register a signal change callback.")},
-    {"register_readonly_callback", register_readonly_callback, METH_VARARGS,
-     PyDoc_STR("register_readonly_callback(func, /, *args)\n"
-               "--\n\n"
-               "register_readonly_callback(func: Callable[..., Any], *args: "
-               "Any) -> cocotb.simulator.sim_callback\n"
-               "Register a callback for the read-only phase.")},
-    {"register_nextstep_callback", register_nextstep_callback, METH_VARARGS,
-     PyDoc_STR("register_nextstep_callback(func, /, *args)\n"
-               "--\n\n"
-               "register_nextstep_callback(func: Callable[..., Any], *args: "
-               "Any) -> cocotb.simulator.sim_callback\n"
-               "Register a callback for the cbNextSimTime callback.")},
-    {"register_rwsynch_callback", register_rwsynch_callback, METH_VARARGS,
-     PyDoc_STR("register_rwsynch_callback(func, /, *args)\n"
-               "--\n\n"
-               "register_rwsynch_callback(func: Callable[..., Any], *args: "
-               "Any) -> cocotb.simulator.sim_callback\n"
-               "Register a callback for the read-write phase.")},
-    {"stop_simulator", stop_simulator, METH_VARARGS,
-     PyDoc_STR("stop_simulator()\n"
-               "--\n\n"
-               "stop_simulator() -> None\n"
-               "Instruct the attached simulator to stop. Users should not call "
-               "this function.")},
-    {"set_gpi_log_level", set_gpi_log_level, METH_VARARGS,
-     PyDoc_STR("set_gpi_log_level(level, /)\n"
-               "--\n\n"
-               "set_gpi_log_level(level: int) -> None\n"
-               "Set the log level of GPI logger.")},
-    {"is_running", is_running, METH_NOARGS,
-     PyDoc_STR("is_running()\n"
-               "--\n\n"
-               "is_running() -> bool\n"
-               "Returns ``True`` if the caller is running within a simulator.\n"
-               "\n"
-               ".. versionadded:: 1.4")},
-    {"get_sim_time", get_sim_time, METH_NOARGS,
-     PyDoc_STR("get_sim_time()\n"
-               "--\n\n"
+int GpiSampler::sample() {
+    uint32_t high, low;
+    gpi_get_sim_time(&high, &low);
+    m_times.push_back(((uint64_t)high << 32) | low);
+
+    for (auto const &sig : m_signals) {
+        switch (sig.second) {
+            case FORMAT_BINSTR: {
+                const char *val = gpi_get_signal_value_binstr(sig.first);
+                m_strs.emplace_back(val ? val : "");
+                break;
+            }
+            case FORMAT_INT:
+                m_ints.push_back(gpi_get_signal_value_long(sig.first));
+                break;
+            case FORMAT_REAL:
+                m_reals.push_back(gpi_get_signal_value_real(sig.first));
+                break;
+            case FORMAT_STR: {
+                const char *val = gpi_get_signal_value_str(sig.first);
+                m_strs.emplace_back(val ? val : "");
+                break;
+            }
+        }
+    }
+
+    if (m_times.size() < m_capacity || !m_on_full) {
+        return 0;
+    }
+
+    // Buffer is full, have Python drain it. Nothing may touch this object
+    // after the call as Python is free to destroy it.
+    c_to_python();
+    DEFER(python_to_c());
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    DEFER(PyGILState_Release(gstate));
+
+    // The callback may stop this object, so hold on to it during the call.
+    PyObject *on_full = m_on_full;
+    Py_INCREF(on_full);
+    PyObject *pValue = PyObject_CallNoArgs(on_full);
+    Py_DECREF(on_full);
+    if (pValue == NULL) {
+        // Printing a SystemExit calls exit(1), which we don't want.
+        if (!PyErr_ExceptionMatches(PyExc_SystemExit)) {
+            PyErr_Print();
+        }
+        // Clear error so re-entering Python doesn't fail.
+        PyErr_Clear();
+        return -1;
+    }
+    Py_DECREF(pValue);
+    return 0;
+}
+
+PyObject *GpiSampler::drain() {
+    size_t n_samples = m_times.size();
+    PyObject *samples = PyList_New((Py_ssize_t)n_samples);
+    if (samples == NULL) {
+        // LCOV_EXCL_START
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    size_t i_str = 0, i_int = 0, i_real = 0;
+    for (size_t i = 0; i < n_samples; ++i) {
+        PyObject *sample = PyTuple_New((Py_ssize_t)m_signals.size() + 1);
+        if (sample == NULL) {
+            // LCOV_EXCL_START
+            Py_DECREF(samples);
+            return NULL;
+            // LCOV_EXCL_STOP
+        }
+        PyList_SET_ITEM(samples, (Py_ssize_t)i, sample);
+        PyTuple_SET_ITEM(sample, 0, PyLong_FromUnsignedLongLong(m_times[i]));
+
+        Py_ssize_t j = 1;
+        for (auto const &sig : m_signals) {
+            PyObject *val = NULL;
+            switch (sig.second) {
+                case FORMAT_BINSTR:
+                    val = PyUnicode_FromStringAndSize(
+                        m_strs[i_str].data(), (Py_ssize_t)m_strs[i_str].size());
+                    ++i_str;
+                    break;
+                case FORMAT_INT:
+                    val = PyLong_FromLong(m_ints[i_int++]);
+                    break;
+                case FORMAT_REAL:
+                    val = PyFloat_FromDouble(m_reals[i_real++]);
+                    break;
+                case FORMAT_STR:
+                    val = PyBytes_FromStringAndSize(
+                        m_strs[i_str].data(), (Py_ssize_t)m_strs[i_str].size());
+                    ++i_str;
+                    break;
+            }
+            if (val == NULL) {
+                // LCOV_EXCL_START
+                Py_DECREF(samples);
+                return NULL;
+                // LCOV_EXCL_STOP
+            }
+            PyTuple_SET_ITEM(sample, j++, val);
+        }
+    }
+
+    // clear() keeps the reserved capacity so the next batch does not allocate.
+    m_times.clear();
+    m_ints.clear();
+    m_reals.clear();
+    m_strs.clear();
+
+    return samples;
+}
+
+// Create a new sampler object
+static PyObject *sampler_create(PyObject *, PyObject *args) {
+    if (!gpi_has_registered_impl()) {
+        // LCOV_EXCL_START
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    PyObject *pSigHdl;
+    int edge;
+    Py_ssize_t capacity;
+    if (!PyArg_ParseTuple(args, "O!in:sampler_create",
+                          &gpi_hdl_Object<gpi_sim_hdl>::py_type, &pSigHdl,
+                          &edge, &capacity)) {
+        return NULL;
+    }
+    if (capacity < 1) {
+        PyErr_SetString(PyExc_ValueError, "capacity must be at least 1");
+        return NULL;
+    }
+    gpi_sim_hdl sim_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+
+    GpiSampler *gpi_sampler =
+        new GpiSampler(sim_hdl, (gpi_edge)edge, (size_t)capacity);
+
+    return gpi_hdl_New(gpi_sampler);
+}
+
+static void sampler_dealloc(PyObject *self) {
+    GpiSampler *gpi_sampler = ((gpi_hdl_Object<gpi_sampler_hdl> *)self)->hdl;
+
+    delete gpi_sampler;
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *sampler_add_signal(gpi_hdl_Object<gpi_sampler_hdl> *self,
+                                    PyObject *args) {
+    PyObject *pSigHdl;
+    int format;
+    if (!PyArg_ParseTuple(args, "O!i:add_signal",
+                          &gpi_hdl_Object<gpi_sim_hdl>::py_type, &pSigHdl,
+                          &format)) {
+        return NULL;
+    }
+    gpi_sim_hdl sim_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+
+    int ret = self->hdl->add_signal(sim_hdl, (gpi_value_format)format);
+    if (ret == EINVAL) {
+        PyErr_SetString(PyExc_ValueError, "Invalid value format");
+        return NULL;
+    } else if (ret == EBUSY) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Cannot add signals to a started sampler");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *sampler_start(gpi_hdl_Object<gpi_sampler_hdl> *self,
+                               PyObject *args) {
+    PyObject *on_full;
+    if (!PyArg_ParseTuple(args, "O:start", &on_full)) {
+        return NULL;
+    }
+    if (!PyCallable_Check(on_full)) {
+        PyErr_SetString(PyExc_TypeError, "on_full must be callable");
+        return NULL;
+    }
+
+    int ret = self->hdl->start(on_full);
+    if (ret == EBUSY) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Failed to start sampler: already started!\n");
+        return NULL;
+    } else if (ret != 0) {
+        // LCOV_EXCL_START
+        PyErr_SetString(PyExc_RuntimeError, "Failed to start sampler!\n");
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *sampler_stop(gpi_hdl_Object<gpi_sampler_hdl> *self,
+                              PyObject *) {
+    self->hdl->stop();
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *sampler_drain(gpi_hdl_Object<gpi_sampler_hdl> *self,
+                               PyObject *) {
+    return self->hdl->drain();
+}
+
+static PyObject *sampler_size(gpi_hdl_Object<gpi_sampler_hdl> *self,
+                              PyObject *) {
+    return PyLong_FromSize_t(self->hdl->size());
+}
+
+class GpiDriver {
+  public:
+    GpiDriver(GpiObjHdl *edge_sig, gpi_edge edge, gpi_set_action set_action)
+        : m_edge_signal(edge_sig), m_edge(edge), m_set_action(set_action) {}
+
+    ~GpiDriver() {
+        stop();
+        Py_XDECREF(m_on_empty);
+    }
+
+    int add_signal(GpiObjHdl *sig, gpi_value_format format);
+
+    // Append rows of values to the stimulus buffer. Returns -1 with a Python
+    // exception set if a row is malformed, in which case nothing is appended.
+    int push(PyObject *rows);
+
+    // Start driving. Returns nonzero in case of failure:
+    //  - EBUSY if the driver was already started (stop first)
+    //  - EAGAIN if registering the edge callback failed
+    int start(PyObject *on_empty);
+
+    int stop();
+
+    size_t size() const { return m_n_rows; }
+
+  private:
+    GpiObjHdl *m_edge_signal = nullptr;
+    gpi_edge m_edge;
+    gpi_set_action m_set_action;
+    std::vector<std::pair<GpiObjHdl *, gpi_value_format>> m_signals;
+
+    GpiCbHdl *m_edge_cb_hdl = nullptr;
+    GpiCbHdl *m_readwrite_cb_hdl = nullptr;
+    PyObject *m_on_empty = nullptr;
+
+    // Stimulus buffer, one column per value format in the order the values
+    // are written.
+    size_t m_n_rows = 0;
+    std::deque<long> m_ints;
+    std::deque<double> m_reals;
+    std::deque<std::string> m_strs;
+
+    int register_edge();
+    void write_next();
+    int drive();
+    static int edge_cb(void *gpi_driver);
+    static int readwrite_cb(void *gpi_driver);
+};
+
+int GpiDriver::add_signal(GpiObjHdl *sig, gpi_value_format format) {
+    if (m_edge_cb_hdl) {
+        return EBUSY;
+    }
+    if (format < FORMAT_BINSTR || format > FORMAT_STR) {
+        return EINVAL;
+    }
+    m_signals.emplace_back(sig, format);
+    return 0;
+}
+
+int GpiDriver::push(PyObject *rows) {
+    PyObject *seq = PySequence_Fast(rows, "rows must be a sequence");
+    if (seq == NULL) {
+        return -1;
+    }
+    DEFER(Py_DECREF(seq));
+
+    // Convert everything first so a bad row doesn't leave a partial push.
+    std::vector<long> ints;
+    std::vector<double> reals;
+    std::vector<std::string> strs;
+
+    Py_ssize_t n_rows = PySequence_Fast_GET_SIZE(seq);
+    for (Py_ssize_t i = 0; i < n_rows; ++i) {
+        PyObject *row = PySequence_Fast_GET_ITEM(seq, i);
+        if (!PyTuple_Check(row) ||
+            PyTuple_GET_SIZE(row) != (Py_ssize_t)m_signals.size()) {
+            PyErr_Format(PyExc_ValueError,
+                         "Each row must be a tuple of %zu values",
+                         m_signals.size());
+            return -1;
+        }
+        Py_ssize_t j = 0;
+        for (auto const &sig : m_signals) {
+            PyObject *val = PyTuple_GET_ITEM(row, j++);
+            switch (sig.second) {
+                case FORMAT_BINSTR: {
+                    Py_ssize_t len;
+                    const char *str = PyUnicode_AsUTF8AndSize(val, &len);
+                    if (str == NULL) {
+                        return -1;
+                    }
+                    strs.emplace_back(str, (size_t)len);
+                    break;
+                }
+                case FORMAT_INT: {
+                    long v = PyLong_AsLong(val);
+                    if (v == -1 && PyErr_Occurred()) {
+                        return -1;
+                    }
+                    ints.push_back(v);
+                    break;
+                }
+                case FORMAT_REAL: {
+                    double v = PyFloat_AsDouble(val);
+                    if (v == -1.0 && PyErr_Occurred()) {
+                        return -1;
+                    }
+                    reals.push_back(v);
+                    break;
+                }
+                case FORMAT_STR: {
+                    char *str;
+                    Py_ssize_t len;
+                    if (PyBytes_AsStringAndSize(val, &str, &len) < 0) {
+                        return -1;
+                    }
+                    strs.emplace_back(str, (size_t)len);
+                    break;
+                }
+            }
+        }
+    }
+
+    m_ints.insert(m_ints.end(), ints.begin(), ints.end());
+    m_reals.insert(m_reals.end(), reals.begin(), reals.end());
+    for (auto &str : strs) {
+        m_strs.emplace_back(std::move(str));
+    }
+    m_n_rows += (size_t)n_rows;
+    return 0;
+}
+
+int GpiDriver::start(PyObject *on_empty) {
+    if (m_edge_cb_hdl) {
+        return EBUSY;
+    }
+
+    Py_XINCREF(on_empty);
+    Py_XDECREF(m_on_empty);
+    m_on_empty = on_empty;
+
+    return register_edge();
+}
+
+int GpiDriver::stop() {
+    // Drop the callback so it doesn't keep the Python object owning this one
+    // alive.
+    Py_CLEAR(m_on_empty);
+    if (m_readwrite_cb_hdl) {
+        gpi_remove_cb(m_readwrite_cb_hdl);
+        m_readwrite_cb_hdl = nullptr;
+    }
+    if (!m_edge_cb_hdl) {
+        return -1;
+    }
+    gpi_remove_cb(m_edge_cb_hdl);
+    m_edge_cb_hdl = nullptr;
+    return 0;
+}
+
+int GpiDriver::register_edge() {
+    m_edge_cb_hdl = gpi_register_value_change_callback(
+        &GpiDriver::edge_cb, this, m_edge_signal, m_edge);
+    if (!m_edge_cb_hdl) {
+        // LCOV_EXCL_START
+        return EAGAIN;
+        // LCOV_EXCL_STOP
+    }
+    return 0;
+}
+
+int GpiDriver::edge_cb(void *gpi_driver) {
+    PYGPI_LOG_TRACE("GPI => [ PYGPI (GpiDriver) ]");
+    DEFER(PYGPI_LOG_TRACE("[ PYGPI (GpiDriver) ] => GPI"));
+    GpiDriver *driver = (GpiDriver *)gpi_driver;
+
+    if (driver->register_edge() != 0) {
+        // LCOV_EXCL_START
+        PYGPI_LOG_ERROR("Driver will be stopped: failed to register edge cb");
+        return 0;
+        // LCOV_EXCL_STOP
+    }
+
+    // Writes are applied in the ReadWrite phase, like writes from Python, and
+    // several edges in one time step only consume one row.
+    if (!driver->m_readwrite_cb_hdl) {
+        driver->m_readwrite_cb_hdl =
+            gpi_register_readwrite_callback(&GpiDriver::readwrite_cb, driver);
+        if (!driver->m_readwrite_cb_hdl) {
+            // LCOV_EXCL_START
+            PYGPI_LOG_ERROR("Driver failed to register ReadWrite cb");
+            // LCOV_EXCL_STOP
+        }
+    }
+    return 0;
+}
+
+int GpiDriver::readwrite_cb(void *gpi_driver) {
+    PYGPI_LOG_TRACE("GPI => [ PYGPI (GpiDriver) ]");
+    DEFER(PYGPI_LOG_TRACE("[ PYGPI (GpiDriver) ] => GPI"));
+    GpiDriver *driver = (GpiDriver *)gpi_driver;
+    driver->m_readwrite_cb_hdl = nullptr;
+    return driver->drive();
+}
+
+void GpiDriver::write_next() {
+    for (auto const &sig : m_signals) {
+        switch (sig.second) {
+            case FORMAT_BINSTR:
+                gpi_set_signal_value_binstr(sig.first, m_strs.front().c_str(),
+                                            m_set_action);
+                m_strs.pop_front();
+                break;
+            case FORMAT_INT:
+                gpi_set_signal_value_int(sig.first, (int32_t)m_ints.front(),
+                                         m_set_action);
+                m_ints.pop_front();
+                break;
+            case FORMAT_REAL:
+                gpi_set_signal_value_real(sig.first, m_reals.front(),
+                                          m_set_action);
+                m_reals.pop_front();
+                break;
+            case FORMAT_STR:
+                gpi_set_signal_value_str(sig.first, m_strs.front().c_str(),
+                                         m_set_action);
+                m_strs.pop_front();
+                break;
+        }
+    }
+    --m_n_rows;
+}
+
+int GpiDriver::drive() {
+    if (m_n_rows) {
+        write_next();
+    }
+
+    if (m_n_rows || !m_on_empty) {
+        return 0;
+    }
+
+    // Buffer is empty, have Python refill it. Nothing may touch this object
+    // after the call as Python is free to destroy it.
+    c_to_python();
+    DEFER(python_to_c());
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    DEFER(PyGILState_Release(gstate));
+
+    // The callback may stop this object, so hold on to it during the call.
+    PyObject *on_empty = m_on_empty;
+    Py_INCREF(on_empty);
+    PyObject *pValue = PyObject_CallNoArgs(on_empty);
+    Py_DECREF(on_empty);
+    if (pValue == NULL) {
+        // Printing a SystemExit calls exit(1), which we don't want.
+        if (!PyErr_ExceptionMatches(PyExc_SystemExit)) {
+            PyErr_Print();
+        }
+        // Clear error so re-entering Python doesn't fail.
+        PyErr_Clear();
+        return -1;
+    }
+    Py_DECREF(pValue);
+    return 0;
+}
+
+// Create a new driver object
+static PyObject *driver_create(PyObject *, PyObject *args) {
+    if (!gpi_has_registered_impl()) {
+        // LCOV_EXCL_START
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    PyObject *pSigHdl;
+    int edge;
+    int set_action;
+    if (!PyArg_ParseTuple(args, "O!ii:driver_create",
+                          &gpi_hdl_Object<gpi_sim_hdl>::py_type, &pSigHdl,
+                          &edge, &set_action)) {
+        return NULL;
+    }
+    gpi_sim_hdl sim_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+
+    GpiDriver *gpi_driver =
+        new GpiDriver(sim_hdl, (gpi_edge)edge, (gpi_set_action)set_action);
+
+    return gpi_hdl_New(gpi_driver);
+}
+
+static void driver_dealloc(PyObject *self) {
+    GpiDriver *gpi_driver = ((gpi_hdl_Object<gpi_driver_hdl> *)self)->hdl;
+
+    delete gpi_driver;
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *driver_add_signal(gpi_hdl_Object<gpi_driver_hdl> *self,
+                                   PyObject *args) {
+    PyObject *pSigHdl;
+    int format;
+    if (!PyArg_ParseTuple(args, "O!i:add_signal",
+                          &gpi_hdl_Object<gpi_sim_hdl>::py_type, &pSigHdl,
+                          &format)) {
+        return NULL;
+    }
+    gpi_sim_hdl sim_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+
+    int ret = self->hdl->add_signal(sim_hdl, (gpi_value_format)format);
+    if (ret == EINVAL) {
+        PyErr_SetString(PyExc_ValueError, "Invalid value format");
+        return NULL;
+    } else if (ret == EBUSY) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Cannot add signals to a started driver");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *driver_push(gpi_hdl_Object<gpi_driver_hdl> *self,
+                             PyObject *rows) {
+    if (self->hdl->push(rows) < 0) {
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *driver_start(gpi_hdl_Object<gpi_driver_hdl> *self,
+                              PyObject *args) {
+    PyObject *on_empty;
+    if (!PyArg_ParseTuple(args, "O:start", &on_empty)) {
+        return NULL;
+    }
+    if (!PyCallable_Check(on_empty)) {
+        PyErr_SetString(PyExc_TypeError, "on_empty must be callable");
+        return NULL;
+    }
+
+    int ret = self->hdl->start(on_empty);
+    if (ret == EBUSY) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Failed to start driver: already started!\n");
+        return NULL;
+    } else if (ret != 0) {
+        // LCOV_EXCL_START
+        PyErr_SetString(PyExc_RuntimeError, "Failed to start driver!\n");
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *driver_stop(gpi_hdl_Object<gpi_driver_hdl> *self, PyObject *) {
+    self->hdl->stop();
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *driver_size(gpi_hdl_Object<gpi_driver_hdl> *self, PyObject *) {
+    return PyLong_FromSize_t(self->hdl->size());
+}
+
+class GpiRecorder {
+  public:
+    ~GpiRecorder() { stop(); }
+
+    // Add a signal to record, returning its index. Returns -1 if the
+    // recorder was already started or the format is not valid.
+    long add_signal(GpiObjHdl *sig, gpi_value_format format);
+
+    // Start recording, first recording the current value of every signal.
+    // Returns nonzero in case of failure:
+    //  - EBUSY if the recorder was already started (stop first)
+    //  - EAGAIN if registering a value change callback failed
+    int start();
+
+    int stop();
+
+    // Remove all recorded changes and return them as a tuple of
+    // (times, indices, values), where times is bytes of native uint64,
+    // indices is bytes of native uint32, and values is a list.
+    PyObject *drain();
+
+    size_t size() const { return m_times.size(); }
+
+  private:
+    struct Channel {
+        GpiRecorder *recorder;
+        uint32_t index;
+        GpiObjHdl *signal;
+        gpi_value_format format;
+        GpiCbHdl *cb_hdl;
+    };
+
+    // deque so Channel addresses, used as callback data, are stable
+    std::deque<Channel> m_channels;
+    bool m_started = false;
+
+    // Change buffer. Values are stored in one column per value format in
+    // the order they were recorded; strings are stored back to back.
+    std::vector<uint64_t> m_times;
+    std::vector<uint32_t> m_indices;
+    std::vector<long> m_ints;
+    std::vector<double> m_reals;
+    std::string m_chars;
+    std::vector<size_t> m_str_ends;
+
+    void record(Channel &channel);
+    static int register_change(Channel &channel);
+    static int change_cb(void *channel);
+};
+
+long GpiRecorder::add_signal(GpiObjHdl *sig, gpi_value_format format) {
+    if (m_started || format < FORMAT_BINSTR || format > FORMAT_STR) {
+        return -1;
+    }
+    uint32_t index = (uint32_t)m_channels.size();
+    m_channels.push_back(Channel{this, index, sig, format, nullptr});
+    return (long)index;
+}
+
+int GpiRecorder::start() {
+    if (m_started) {
+        return EBUSY;
+    }
+    m_started = true;
+    for (auto &channel : m_channels) {
+        record(channel);
+        if (register_change(channel) != 0) {
+            // LCOV_EXCL_START
+            stop();
+            return EAGAIN;
+            // LCOV_EXCL_STOP
+        }
+    }
+    return 0;
+}
+
+int GpiRecorder::stop() {
+    if (!m_started) {
+        return -1;
+    }
+    for (auto &channel : m_channels) {
+        if (channel.cb_hdl) {
+            gpi_remove_cb(channel.cb_hdl);
+            channel.cb_hdl = nullptr;
+        }
+    }
+    m_started = false;
+    return 0;
+}
+
+int GpiRecorder::register_change(Channel &channel) {
+    channel.cb_hdl = gpi_register_value_change_callback(
+        &GpiRecorder::change_cb, &channel, channel.signal, GPI_VALUE_CHANGE);
+    if (!channel.cb_hdl) {
+        // LCOV_EXCL_START
+        return EAGAIN;
+        // LCOV_EXCL_STOP
+    }
+    return 0;
+}
+
+int GpiRecorder::change_cb(void *gpi_channel) {
+    PYGPI_LOG_TRACE("GPI => [ PYGPI (GpiRecorder) ]");
+    DEFER(PYGPI_LOG_TRACE("[ PYGPI (GpiRecorder) ] => GPI"));
+    Channel &channel = *(Channel *)gpi_channel;
+
+    if (register_change(channel) != 0) {
+        // LCOV_EXCL_START
+        PYGPI_LOG_ERROR("Recording of signal stopped: failed to register cb");
+        // LCOV_EXCL_STOP
+    }
+    channel.recorder->record(channel);
+    return 0;
+}
+
+void GpiRecorder::record(Channel &channel) {
+    uint32_t high, low;
+    gpi_get_sim_time(&high, &low);
+    m_times.push_back(((uint64_t)high << 32) | low);
+    m_indices.push_back(channel.index);
+
+    const char *str = nullptr;
+    switch (channel.format) {
+        case FORMAT_BINSTR:
+            str = gpi_get_signal_value_binstr(channel.signal);
+            break;
+        case FORMAT_INT:
+            m_ints.push_back(gpi_get_signal_value_long(channel.signal));
+            return;
+        case FORMAT_REAL:
+            m_reals.push_back(gpi_get_signal_value_real(channel.signal));
+            return;
+        case FORMAT_STR:
+            str = gpi_get_signal_value_str(channel.signal);
+            break;
+    }
+    if (str) {
+        m_chars.append(str);
+    }
+    m_str_ends.push_back(m_chars.size());
+}
+
+PyObject *GpiRecorder::drain() {
+    size_t n_changes = m_times.size();
+
+    PyObject *times =
+        PyBytes_FromStringAndSize((const char *)m_times.data(),
+                                  (Py_ssize_t)(n_changes * sizeof(uint64_t)));
+    PyObject *indices =
+        PyBytes_FromStringAndSize((const char *)m_indices.data(),
+                                  (Py_ssize_t)(n_changes * sizeof(uint32_t)));
+    PyObject *values = PyList_New((Py_ssize_t)n_changes);
+    if (times == NULL || indices == NULL || values == NULL) {
+        // LCOV_EXCL_START
+        Py_XDECREF(times);
+        Py_XDECREF(indices);
+        Py_XDECREF(values);
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    size_t i_str = 0, i_int = 0, i_real = 0, str_begin = 0;
+    for (size_t i = 0; i < n_changes; ++i) {
+        PyObject *val = NULL;
+        switch (m_channels[m_indices[i]].format) {
+            case FORMAT_BINSTR:
+            case FORMAT_STR: {
+                size_t str_end = m_str_ends[i_str++];
+                const char *data = m_chars.data() + str_begin;
+                Py_ssize_t len = (Py_ssize_t)(str_end - str_begin);
+                str_begin = str_end;
+                if (m_channels[m_indices[i]].format == FORMAT_BINSTR) {
+                    val = PyUnicode_FromStringAndSize(data, len);
+                } else {
+                    val = PyBytes_FromStringAndSize(data, len);
+                }
+                break;
+            }
+            case FORMAT_INT:
+                val = PyLong_FromLong(m_ints[i_int++]);
+                break;
+            case FORMAT_REAL:
+                val = PyFloat_FromDouble(m_reals[i_real++]);
+                break;
+        }
+        if (val == NULL) {
+            // LCOV_EXCL_START
+            Py_DECREF(times);
+            Py_DECREF(indices);
+            Py_DECREF(values);
+            return NULL;
+            // LCOV_EXCL_STOP
+        }
+        PyList_SET_ITEM(values, (Py_ssize_t)i, val);
+    }
+
+    m_times.clear();
+    m_indices.clear();
+    m_ints.clear();
+    m_reals.clear();
+    m_chars.clear();
+    m_str_ends.clear();
+
+    PyObject *result = PyTuple_Pack(3, times, indices, values);
+    Py_DECREF(times);
+    Py_DECREF(indices);
+    Py_DECREF(values);
+    return result;
+}
+
+// Create a new recorder object
+static PyObject *recorder_create(PyObject *, PyObject *) {
+    if (!gpi_has_registered_impl()) {
+        // LCOV_EXCL_START
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    return gpi_hdl_New(new GpiRecorder());
+}
+
+static void recorder_dealloc(PyObject *self) {
+    GpiRecorder *gpi_recorder = ((gpi_hdl_Object<gpi_recorder_hdl> *)self)->hdl;
+
+    delete gpi_recorder;
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *recorder_add_signal(gpi_hdl_Object<gpi_recorder_hdl> *self,
+                                     PyObject *args) {
+    PyObject *pSigHdl;
+    int format;
+    if (!PyArg_ParseTuple(args, "O!i:add_signal",
+                          &gpi_hdl_Object<gpi_sim_hdl>::py_type, &pSigHdl,
+                          &format)) {
+        return NULL;
+    }
+    gpi_sim_hdl sim_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+
+    long index = self->hdl->add_signal(sim_hdl, (gpi_value_format)format);
+    if (index < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Invalid value format, or recorder already started");
+        return NULL;
+    }
+
+    return PyLong_FromLong(index);
+}
+
+static PyObject *recorder_start(gpi_hdl_Object<gpi_recorder_hdl> *self,
+                                PyObject *) {
+    int ret = self->hdl->start();
+    if (ret == EBUSY) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Failed to start recorder: already started!\n");
+        return NULL;
+    } else if (ret != 0) {
+        // LCOV_EXCL_START
+        PyErr_SetString(PyExc_RuntimeError, "Failed to start recorder!\n");
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *recorder_stop(gpi_hdl_Object<gpi_recorder_hdl> *self,
+                               PyObject *) {
+    self->hdl->stop();
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *recorder_drain(gpi_hdl_Object<gpi_recorder_hdl> *self,
+                                PyObject *) {
+    return self->hdl->drain();
+}
+
+static PyObject *recorder_size(gpi_hdl_Object<gpi_recorder_hdl> *self,
+                               PyObject *) {
+    return PyLong_FromSize_t(self->hdl->size());
+}
+
+static int add_module_constants(PyObject *simulator) {
+    // Make the GPI constants accessible from the C world
+    if (PyModule_AddIntConstant(simulator, "UNKNOWN", GPI_UNKNOWN) < 0 ||
+        PyModule_AddIntConstant(simulator, "MEMORY", GPI_MEMORY) < 0 ||
+        PyModule_AddIntConstant(simulator, "MODULE", GPI_MODULE) < 0 ||
+        PyModule_AddIntConstant(simulator, "NETARRAY", GPI_ARRAY) < 0 ||
+        PyModule_AddIntConstant(simulator, "ENUM", GPI_ENUM) < 0 ||
+        PyModule_AddIntConstant(simulator, "STRUCTURE", GPI_STRUCTURE) < 0 ||
+        PyModule_AddIntConstant(simulator, "PACKED_STRUCTURE",
+                                GPI_PACKED_STRUCTURE) < 0 ||
+        PyModule_AddIntConstant(simulator, "REAL", GPI_REAL) < 0 ||
+        PyModule_AddIntConstant(simulator, "INTEGER", GPI_INTEGER) < 0 ||
+        PyModule_AddIntConstant(simulator, "STRING", GPI_STRING) < 0 ||
+        PyModule_AddIntConstant(simulator, "FIXED_STRING", GPI_FIXED_STRING) <
+            0 ||
+        PyModule_AddIntConstant(simulator, "GENARRAY", GPI_GENARRAY) < 0 ||
+        PyModule_AddIntConstant(simulator, "PACKAGE", GPI_PACKAGE) < 0 ||
+        PyModule_AddIntConstant(simulator, "OBJECTS", GPI_OBJECTS) < 0 ||
+        PyModule_AddIntConstant(simulator, "DRIVERS", GPI_DRIVERS) < 0 ||
+        PyModule_AddIntConstant(simulator, "LOADS", GPI_LOADS) < 0 ||
+        PyModule_AddIntConstant(simulator, "RISING", GPI_RISING) < 0 ||
+        PyModule_AddIntConstant(simulator, "FALLING", GPI_FALLING) < 0 ||
+        PyModule_AddIntConstant(simulator, "VALUE_CHANGE", GPI_VALUE_CHANGE) <
+            0 ||
+        PyModule_AddIntConstant(simulator, "RANGE_UP", GPI_RANGE_UP) < 0 ||
+        PyModule_AddIntConstant(simulator, "RANGE_DOWN", GPI_RANGE_DOWN) < 0 ||
+        PyModule_AddIntConstant(simulator, "RANGE_NO_DIR", GPI_RANGE_NO_DIR) <
+            0 ||
+        PyModule_AddIntConstant(simulator, "LOGIC", GPI_LOGIC) < 0 ||
+        PyModule_AddIntConstant(simulator, "LOGIC_ARRAY", GPI_LOGIC_ARRAY) <
+            0 ||
+        PyModule_AddIntConstant(simulator, "FORMAT_BINSTR", FORMAT_BINSTR) <
+            0 ||
+        PyModule_AddIntConstant(simulator, "FORMAT_INT", FORMAT_INT) < 0 ||
+        PyModule_AddIntConstant(simulator, "FORMAT_REAL", FORMAT_REAL) < 0 ||
+        PyModule_AddIntConstant(simulator, "FORMAT_STR", FORMAT_STR) < 0 ||
+        false) {
+        return -1;
+    }
+
+    return 0;
+}
+
+// Add the extension types as entries in the module namespace
+static int add_module_types(PyObject *simulator) {
+    PyObject *typ;
+
+    typ = (PyObject *)&gpi_hdl_Object<gpi_sim_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "sim_obj", typ) < 0) {
+        Py_DECREF(typ);
+        return -1;
+    }
+
+    typ = (PyObject *)&gpi_hdl_Object<gpi_cb_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "sim_callback", typ) < 0) {
+        Py_DECREF(typ);
+        return -1;
+    }
+
+    typ = (PyObject *)&gpi_hdl_Object<gpi_iterator_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "sim_obj_iterator", typ) < 0) {
+        Py_DECREF(typ);
+        return -1;
+    }
+
+    typ = (PyObject *)&gpi_hdl_Object<gpi_clk_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "cpp_clock", typ) < 0) {
+        // LCOV_EXCL_START
+        Py_DECREF(typ);
+        return -1;
+        // LCOV_EXCL_STOP
+    }
+
+    typ = (PyObject *)&gpi_hdl_Object<gpi_sampler_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "cpp_sampler", typ) < 0) {
+        // LCOV_EXCL_START
+        Py_DECREF(typ);
+        return -1;
+        // LCOV_EXCL_STOP
+    }
+
+    typ = (PyObject *)&gpi_hdl_Object<gpi_driver_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "cpp_driver", typ) < 0) {
+        // LCOV_EXCL_START
+        Py_DECREF(typ);
+        return -1;
+        // LCOV_EXCL_STOP
+    }
+
+    typ = (PyObject *)&gpi_hdl_Object<gpi_recorder_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "cpp_recorder", typ) < 0) {
+        // LCOV_EXCL_START
+        Py_DECREF(typ);
+        return -1;
+        // LCOV_EXCL_STOP
+    }
+
+    return 0;
+}
+
+/* NOTE: in the following docstrings we are specifying the parameters twice, but
+ * this is necessary. The first docstring before the long '--' line specifies
+ * the __text_signature__ that is used by the help() function. And the second
+ * after the '--' line contains type annotations used by the
+ * `autodoc_docstring_signature` setting of sphinx.ext.autodoc for generating
+ * documentation because type annotations are not supported in
+ * __text_signature__.
+ */
+
+static PyMethodDef SimulatorMethods[] = {
+    {"get_root_handle", get_root_handle, METH_VARARGS,
+     PyDoc_STR("get_root_handle(name, /)\n"
+               "--\n\n"
+               "get_root_handle(name: str) -> cocotb.simulator.sim_obj\n"
+               "Get the root handle.")},
+    {"package_iterate", package_iterate, METH_NOARGS,
+     PyDoc_STR("package_iterate(/)\n"
+               "--\n\n"
+               "package_iterate() -> cocotb.simulator.sim_obj_iterator\n"
+               "Get an iterator handle to loop over all HDL packages.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
+    {"root_iterate", root_iterate, METH_NOARGS,
+     PyDoc_STR("root_iterate(/)\n"
+               "--\n\n"
+               "root_iterate() -> cocotb.simulator.sim_obj_iterator\n"
+               "Get an iterator to loop over all root handles"
+               "only when there are multiple tops.\n"
+               "\n"
+               ".. versionadded:: 2.1")},
+    {"register_timed_callback", register_timed_callback, METH_VARARGS,
+     PyDoc_STR("register_timed_callback(time, func, /, *args)\n"
+               "--\n\n"
+               "register_timed_callback(time: int, func: Callable[..., Any], "
+               "*args: Any) -> cocotb.simulator.sim_callback\n"
+               "Register a timed callback.")},
+    {"register_value_change_callback", register_value_change_callback,
+     METH_VARARGS,
+     PyDoc_STR("register_value_change_callback(signal, func, edge, /, *args)\n"
+               "--\n\n"
+               "register_value_change_callback(signal: "
+               "cocotb.simulator.sim_obj, func: Callable[..., Any], edge: "
+               "int, *args: Any) -> cocotb.simulator.sim_callback\n"
+               "Register a signal change callback.")},
+    {"register_readonly_callback", register_readonly_callback, METH_VARARGS,
+     PyDoc_STR("register_readonly_callback(func, /, *args)\n"
+               "--\n\n"
+               "register_readonly_callback(func: Callable[..., Any], *args: "
+               "Any) -> cocotb.simulator.sim_callback\n"
+               "Register a callback for the read-only phase.")},
+    {"register_nextstep_callback", register_nextstep_callback, METH_VARARGS,
+     PyDoc_STR("register_nextstep_callback(func, /, *args)\n"
+               "--\n\n"
+               "register_nextstep_callback(func: Callable[..., Any], *args: "
+               "Any) -> cocotb.simulator.sim_callback\n"
+               "Register a callback for the cbNextSimTime callback.")},
+    {"register_rwsynch_callback", register_rwsynch_callback, METH_VARARGS,
+     PyDoc_STR("register_rwsynch_callback(func, /, *args)\n"
+               "--\n\n"
+               "register_rwsynch_callback(func: Callable[..., Any], *args: "
+               "Any) -> cocotb.simulator.sim_callback\n"
+               "Register a callback for the read-write phase.")},
+    {"stop_simulator", stop_simulator, METH_VARARGS,
+     PyDoc_STR("stop_simulator()\n"
+               "--\n\n"
+               "stop_simulator() -> None\n"
+               "Instruct the attached simulator to stop. Users should not call "
+               "this function.")},
+    {"set_gpi_log_level", set_gpi_log_level, METH_VARARGS,
+     PyDoc_STR("set_gpi_log_level(level, /)\n"
+               "--\n\n"
+               "set_gpi_log_level(level: int) -> None\n"
+               "Set the log level of GPI logger.")},
+    {"is_running", is_running, METH_NOARGS,
+     PyDoc_STR("is_running()\n"
+               "--\n\n"
+               "is_running() -> bool\n"
+               "Returns ``True`` if the caller is running within a simulator.\n"
+               "\n"
+               ".. versionadded:: 1.4")},
+    {"get_sim_time", get_sim_time, METH_NOARGS,
+     PyDoc_STR("get_sim_time()\n"
+               "--\n\n"
                "get_sim_time() -> Tuple[int, int]\n"
                "Get the current simulation time.\n"
                "\n"
@@ -1203,6 +2448,16 @@ static PyMethodDef SimulatorMethods[] = {
                "--\n\n"
                "get_simulator_product() -> str\n"
                "Get the simulator's product string.")},
+    {"get_handle_stats", get_handle_stats, METH_NOARGS,
+     PyDoc_STR("get_handle_stats()\n"
+               "--\n\n"
+               "get_handle_stats() -> dict[str, int]\n"
+               "Get statistics of the GPI's store of unique object handles: "
+               "the number of ``handles``, the number of distinct interned "
+               "``names``, and the characters stored for interned names "
+               "(``name_bytes``) and full names (``fullname_bytes``).\n"
+               "\n"
+               ".. versionadded:: 2.1")},
     {"get_simulator_version", get_simulator_version, METH_NOARGS,
      PyDoc_STR("get_simulator_version()\n"
                "--\n\n"
@@ -1213,6 +2468,30 @@ static PyMethodDef SimulatorMethods[] = {
                "--\n\n"
                "get_simulator_args() -> list[str]\n"
                "Get the simulator's command line arguments.")},
+    {"save_state", save_state, METH_VARARGS,
+     PyDoc_STR("save_state(path, /)\n"
+               "--\n\n"
+               "save_state(path: str) -> None\n"
+               "Save the state of the design and the simulation time to a "
+               "file.")},
+    {"restore_state", restore_state, METH_VARARGS,
+     PyDoc_STR("restore_state(path, /)\n"
+               "--\n\n"
+               "restore_state(path: str) -> None\n"
+               "Restore the state of the design and the simulation time from "
+               "a file written by save_state().")},
+    {"trace_start", trace_start, METH_VARARGS,
+     PyDoc_STR("trace_start(path, depth=0, scope='', rotate=0, /)\n"
+               "--\n\n"
+               "trace_start(path: str, depth: int = 0, scope: str = '', "
+               "rotate: int = 0) -> None\n"
+               "Start tracing signals to a file, closing the file traced to "
+               "before.")},
+    {"trace_stop", trace_stop, METH_NOARGS,
+     PyDoc_STR("trace_stop()\n"
+               "--\n\n"
+               "trace_stop() -> None\n"
+               "Stop tracing signals and close the file traced to.")},
     {"clock_create", clock_create, METH_VARARGS,
      PyDoc_STR("clock_create(signal, /)\n"
                "--\n\n"
@@ -1221,6 +2500,32 @@ static PyMethodDef SimulatorMethods[] = {
                "Create a clock driver on a signal.\n"
                "\n"
                ".. versionadded:: 2.0")},
+    {"sampler_create", sampler_create, METH_VARARGS,
+     PyDoc_STR("sampler_create(signal, edge, capacity, /)\n"
+               "--\n\n"
+               "sampler_create(signal: cocotb.simulator.sim_obj, edge: int, "
+               "capacity: int) -> cocotb.simulator.cpp_sampler\n"
+               "Create a sampler which records signal values in the ReadOnly "
+               "phase after each *edge* of *signal*.\n"
+               "\n"
+               ".. versionadded:: 2.1")},
+    {"driver_create", driver_create, METH_VARARGS,
+     PyDoc_STR("driver_create(signal, edge, set_action, /)\n"
+               "--\n\n"
+               "driver_create(signal: cocotb.simulator.sim_obj, edge: int, "
+               "set_action: int) -> cocotb.simulator.cpp_driver\n"
+               "Create a driver which writes buffered rows of signal values "
+               "in the ReadWrite phase after each *edge* of *signal*.\n"
+               "\n"
+               ".. versionadded:: 2.1")},
+    {"recorder_create", recorder_create, METH_NOARGS,
+     PyDoc_STR("recorder_create()\n"
+               "--\n\n"
+               "recorder_create() -> cocotb.simulator.cpp_recorder\n"
+               "Create a recorder which records every value change of a set "
+               "of signals.\n"
+               "\n"
+               ".. versionadded:: 2.1")},
     {"initialize_logger", initialize_logger, METH_VARARGS,
      PyDoc_STR("initialize_logger(log_func, /)\n"
                "--\n\n"
@@ -1271,6 +2576,21 @@ PyMODINIT_FUNC PyInit_simulator(void) {
         return NULL;
         // LCOV_EXCL_STOP
     }
+    if (PyType_Ready(&gpi_hdl_Object<gpi_sampler_hdl>::py_type) < 0) {
+        // LCOV_EXCL_START
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+    if (PyType_Ready(&gpi_hdl_Object<gpi_driver_hdl>::py_type) < 0) {
+        // LCOV_EXCL_START
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+    if (PyType_Ready(&gpi_hdl_Object<gpi_recorder_hdl>::py_type) < 0) {
+        // LCOV_EXCL_START
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
 
     PyObject *simulator = PyModule_Create(&moduledef);
     if (simulator == NULL) {
@@ -1398,6 +2718,14 @@ static PyMethodDef sim_obj_methods[] = {
                "--\n\n"
                "get_num_elems() -> int\n"
                "Get the number of elements contained in the handle.")},
+    {"get_info", (PyCFunction)get_info, METH_NOARGS,
+     PyDoc_STR("get_info($self)\n"
+               "--\n\n"
+               "get_info() -> tuple[str, int, str, str, str, bool, int, int, "
+               "int, int]\n"
+               "Get the name, type, type string, definition name, definition "
+               "file, constness, range left, range right, range direction, and "
+               "signedness of the object in one call.")},
     {"get_range", (PyCFunction)get_range, METH_NOARGS,
      PyDoc_STR("get_range($self)\n"
                "--\n\n"
@@ -1411,12 +2739,26 @@ static PyMethodDef sim_obj_methods[] = {
                "--\n\n"
                "get_indexable() -> bool\n"
                "Return ``True`` if indexable.")},
+    {"scan", (PyCFunction)scan, METH_NOARGS,
+     PyDoc_STR(
+         "scan($self)\n"
+         "--\n\n"
+         "scan() -> tuple[list[cocotb.simulator.sim_obj], bytes]\n"
+         "Get all objects in the hierarchy below an object in one call.\n\n"
+         "Returns the objects, parents before children, and the index of "
+         "each object's parent in the list, or ``-1`` if the parent is this "
+         "object, packed as native ``int32``.")},
     {"iterate", (PyCFunction)iterate, METH_VARARGS,
      PyDoc_STR(
-         "iterate($self, mode, /)\n"
+         "iterate($self, mode, pattern=None, types=0, /)\n"
          "--\n\n"
-         "iterate(mode: int) -> cocotb.simulator.sim_obj_iterator\n"
-         "Get an iterator handle to loop over all members in an object.")},
+         "iterate(mode: int, pattern: str | None = None, types: int = 0) -> "
+         "cocotb.simulator.sim_obj_iterator\n"
+         "Get an iterator handle to loop over all members in an object.\n\n"
+         "If given, only members whose name matches the shell-style "
+         "*pattern* and whose type bit ``1 << type`` is set in *types* are "
+         "returned. Other members are skipped without creating handles for "
+         "them.")},
     {NULL, NULL, 0, NULL} /* Sentinel */
 };
 
@@ -1509,3 +2851,184 @@ PyTypeObject gpi_hdl_Object<gpi_clk_hdl>::py_type = []() -> PyTypeObject {
     type.tp_dealloc = clock_dealloc;
     return type;
 }();
+
+static PyMethodDef cpp_sampler_methods[] = {
+    {"add_signal", (PyCFunction)sampler_add_signal, METH_VARARGS,
+     PyDoc_STR("add_signal($self, signal, format, /)\n"
+               "--\n\n"
+               "add_signal(signal: cocotb.simulator.sim_obj, format: int) -> "
+               "None\n"
+               "Add *signal* to the set of sampled signals, read using one of "
+               "the ``FORMAT_*`` constants.\n"
+               "\n"
+               "Raises:\n"
+               "    ValueError: If *format* is not valid.\n"
+               "    RuntimeError: If the sampler was already started.")},
+    {"start", (PyCFunction)sampler_start, METH_VARARGS,
+     PyDoc_STR("start($self, on_full, /)\n"
+               "--\n\n"
+               "start(on_full: Callable[[], object]) -> None\n"
+               "Start sampling now.\n"
+               "\n"
+               "*on_full* is called from the ReadOnly phase whenever the "
+               "buffer reaches its capacity, and is expected to call "
+               ":meth:`drain`.\n"
+               "\n"
+               "Raises:\n"
+               "    RuntimeError: If the sampler was already started, or the "
+               "GPI callback could not be registered.")},
+    {"stop", (PyCFunction)sampler_stop, METH_NOARGS,
+     PyDoc_STR("stop($self)\n"
+               "--\n\n"
+               "stop() -> None\n"
+               "Stop sampling now. Buffered samples are kept.")},
+    {"drain", (PyCFunction)sampler_drain, METH_NOARGS,
+     PyDoc_STR("drain($self)\n"
+               "--\n\n"
+               "drain() -> list[tuple[Any, ...]]\n"
+               "Remove and return all buffered samples as ``(time, value, "
+               "...)`` tuples, with values in the order the signals were "
+               "added.")},
+    {"size", (PyCFunction)sampler_size, METH_NOARGS,
+     PyDoc_STR("size($self)\n"
+               "--\n\n"
+               "size() -> int\n"
+               "Return the number of buffered samples.")},
+    {NULL, NULL, 0, NULL} /* Sentinel */
+};
+
+template <>
+PyTypeObject gpi_hdl_Object<gpi_sampler_hdl>::py_type = []() -> PyTypeObject {
+    auto type = fill_common_slots<gpi_sampler_hdl>();
+    type.tp_name = "cocotb.simulator.cpp_sampler";
+    type.tp_doc =
+        "A signal sampler implemented in C++ that uses the GPI directly.\n"
+        "\n"
+        "Signal values are recorded into a native buffer in the ReadOnly "
+        "phase without interacting with Python to increase performance.";
+    type.tp_methods = cpp_sampler_methods;
+    type.tp_dealloc = sampler_dealloc;
+    return type;
+}();
+
+static PyMethodDef cpp_driver_methods[] = {
+    {"add_signal", (PyCFunction)driver_add_signal, METH_VARARGS,
+     PyDoc_STR("add_signal($self, signal, format, /)\n"
+               "--\n\n"
+               "add_signal(signal: cocotb.simulator.sim_obj, format: int) -> "
+               "None\n"
+               "Add *signal* to the set of driven signals, written using one "
+               "of the ``FORMAT_*`` constants.\n"
+               "\n"
+               "Raises:\n"
+               "    ValueError: If *format* is not valid.\n"
+               "    RuntimeError: If the driver was already started.")},
+    {"push", (PyCFunction)driver_push, METH_O,
+     PyDoc_STR("push($self, rows, /)\n"
+               "--\n\n"
+               "push(rows: Sequence[tuple[Any, ...]]) -> None\n"
+               "Append *rows* to the stimulus buffer. Each row is a tuple "
+               "holding one value per signal in the order the signals were "
+               "added: a :class:`str` for ``FORMAT_BINSTR``, an :class:`int` "
+               "for ``FORMAT_INT``, a :class:`float` for ``FORMAT_REAL``, and "
+               ":class:`bytes` for ``FORMAT_STR``.\n"
+               "\n"
+               "Raises:\n"
+               "    ValueError: If a row has the wrong number of values.\n"
+               "    TypeError: If a value has the wrong type.")},
+    {"start", (PyCFunction)driver_start, METH_VARARGS,
+     PyDoc_STR("start($self, on_empty, /)\n"
+               "--\n\n"
+               "start(on_empty: Callable[[], object]) -> None\n"
+               "Start driving now.\n"
+               "\n"
+               "*on_empty* is called from the ReadWrite phase whenever the "
+               "buffer is empty after an edge, and is expected to call "
+               ":meth:`push`.\n"
+               "\n"
+               "Raises:\n"
+               "    RuntimeError: If the driver was already started, or the "
+               "GPI callback could not be registered.")},
+    {"stop", (PyCFunction)driver_stop, METH_NOARGS,
+     PyDoc_STR("stop($self)\n"
+               "--\n\n"
+               "stop() -> None\n"
+               "Stop driving now. Buffered rows are kept.")},
+    {"size", (PyCFunction)driver_size, METH_NOARGS,
+     PyDoc_STR("size($self)\n"
+               "--\n\n"
+               "size() -> int\n"
+               "Return the number of buffered rows.")},
+    {NULL, NULL, 0, NULL} /* Sentinel */
+};
+
+template <>
+PyTypeObject gpi_hdl_Object<gpi_driver_hdl>::py_type = []() -> PyTypeObject {
+    auto type = fill_common_slots<gpi_driver_hdl>();
+    type.tp_name = "cocotb.simulator.cpp_driver";
+    type.tp_doc =
+        "A stimulus driver implemented in C++ that uses the GPI directly.\n"
+        "\n"
+        "Buffered rows of values are written on each edge without "
+        "interacting with Python to increase performance.";
+    type.tp_methods = cpp_driver_methods;
+    type.tp_dealloc = driver_dealloc;
+    return type;
+}();
+
+static PyMethodDef cpp_recorder_methods[] = {
+    {"add_signal", (PyCFunction)recorder_add_signal, METH_VARARGS,
+     PyDoc_STR("add_signal($self, signal, format, /)\n"
+               "--\n\n"
+               "add_signal(signal: cocotb.simulator.sim_obj, format: int) -> "
+               "int\n"
+               "Add *signal* to the set of recorded signals, read using one "
+               "of the ``FORMAT_*`` constants, and return its index.\n"
+               "\n"
+               "Raises:\n"
+               "    ValueError: If *format* is not valid, or the recorder was "
+               "already started.")},
+    {"start", (PyCFunction)recorder_start, METH_NOARGS,
+     PyDoc_STR("start($self)\n"
+               "--\n\n"
+               "start() -> None\n"
+               "Record the current value of each signal and start recording "
+               "changes now.\n"
+               "\n"
+               "Raises:\n"
+               "    RuntimeError: If the recorder was already started, or a "
+               "GPI callback could not be registered.")},
+    {"stop", (PyCFunction)recorder_stop, METH_NOARGS,
+     PyDoc_STR("stop($self)\n"
+               "--\n\n"
+               "stop() -> None\n"
+               "Stop recording now. Recorded changes are kept.")},
+    {"drain", (PyCFunction)recorder_drain, METH_NOARGS,
+     PyDoc_STR("drain($self)\n"
+               "--\n\n"
+               "drain() -> tuple[bytes, bytes, list[Any]]\n"
+               "Remove and return all recorded changes as the columns "
+               "``(times, indices, values)``. *times* holds native "
+               "``uint64`` and *indices* native ``uint32`` values.")},
+    {"size", (PyCFunction)recorder_size, METH_NOARGS,
+     PyDoc_STR("size($self)\n"
+               "--\n\n"
+               "size() -> int\n"
+               "Return the number of recorded changes.")},
+    {NULL, NULL, 0, NULL} /* Sentinel */
+};
+
+template <>
+PyTypeObject gpi_hdl_Object<gpi_recorder_hdl>::py_type = []() -> PyTypeObject {
+    auto type = fill_common_slots<gpi_recorder_hdl>();
+    type.tp_name = "cocotb.simulator.cpp_recorder";
+    type.tp_doc =
+        "A value change recorder implemented in C++ that uses the GPI "
+        "directly.\n"
+        "\n"
+        "Value changes are recorded into a native columnar buffer without "
+        "interacting with Python to increase performance.";
+    type.tp_methods = cpp_recorder_methods;
+    type.tp_dealloc = recorder_dealloc;
+    return type;
+}();
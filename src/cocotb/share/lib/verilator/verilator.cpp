@@ -3,6 +3,7 @@
 // SPDX-License-Identifier: BSD-3-Clause
 
 #include <libgen.h>  // basename
+#include <stdint.h>  // uint64_t
 #include <stdio.h>   // stderr, fprintf
 
 #include <memory>  // std::unique_ptr
@@ -12,6 +13,11 @@
 #include "verilated.h"
 #include "verilated_vpi.h"
 
+#ifdef COCOTB_VERILATOR_SAVABLE
+// Defined by the cocotb build when the model is built with --savable
+#include "verilated_save.h"
+#endif
+
 #ifndef VM_TRACE_FST
 // emulate new verilator behavior for legacy versions
 #define VM_TRACE_FST 0
@@ -42,8 +48,147 @@ double sc_time_stamp() {  // Called by $time in Verilog
                           // what SystemC does
 }
 
+static inline void set_time(vluint64_t time) {
+    main_time = time;
+    // The model reads the time from its context, also on the threads
+    // of a model built with --threads, while sc_time_stamp() is
+    // only a fallback for older builds, so keep both in step.
+    Verilated::threadContextp()->time(time);
+}
+
 extern "C" {
 void vlog_startup_routines_bootstrap(void);
+void vlog_register_state_funcs(int (*save)(const char *),
+                               int (*restore)(const char *));
+void vlog_register_trace_funcs(int (*start)(const char *, int, const char *,
+                                            uint64_t),
+                               int (*stop)(void));
+}
+
+static Vtop *model;
+
+#ifdef COCOTB_VERILATOR_SAVABLE
+
+static int save_state(const char *path) {
+    VerilatedSave os;
+    os.open(path);
+    if (!os.isOpen()) {
+        return -1;
+    }
+    os << main_time;
+    os << *model;
+    os.close();
+    return 0;
+}
+
+static int restore_state(const char *path) {
+    VerilatedRestore os;
+    os.open(path);
+    if (!os.isOpen()) {
+        return -1;
+    }
+    vluint64_t time;
+    os >> time;
+    os >> *model;
+    os.close();
+    set_time(time);
+    return 0;
+}
+#endif
+
+#if VM_TRACE
+// The trace is started and stopped from Python with
+// cocotb.simulator.trace_start() and trace_stop(), or with --trace
+static std::string trace_path;
+static int trace_depth = 0;
+static std::string trace_scope;
+static vluint64_t trace_rotate = 0;
+static vluint64_t trace_rotate_time = 0;
+static unsigned trace_file_index = 0;
+
+static void open_trace() {
+    std::string path = trace_path;
+    if (trace_rotate) {
+        // dump.fst becomes dump.0.fst, dump.1.fst, ...
+        size_t dir = path.find_last_of('/');
+        size_t ext = path.find_last_of('.');
+        if (ext == std::string::npos ||
+            (dir != std::string::npos && ext < dir)) {
+            ext = path.size();
+        }
+        path.insert(ext, "." + std::to_string(trace_file_index++));
+        trace_rotate_time = main_time + trace_rotate;
+    }
+    tfp->open(path.c_str());
+}
+
+static int trace_start(const char *path, int depth, const char *scope,
+                       uint64_t rotate) {
+    if (tfp == nullptr) {
+        tfp = new verilated_trace_t;
+        // The model can only be added to the trace once,
+        // so what it traces is decided by the first start
+        if (depth || *scope) {
+            tfp->dumpvars(depth, scope);
+        }
+        trace_depth = depth;
+        trace_scope = scope;
+        model->trace(tfp, 99);
+    } else if (depth != trace_depth || trace_scope != scope) {
+        fprintf(stderr,
+                "Error: the depth and scope of the trace can't change after "
+                "it started the first time\n");
+        return -1;
+    } else if (tfp->isOpen()) {
+        tfp->close();
+    }
+    trace_path = path;
+    trace_rotate = rotate;
+    trace_file_index = 0;
+    open_trace();
+    return tfp->isOpen() ? 0 : -1;
+}
+
+static int trace_stop() {
+    if (tfp && tfp->isOpen()) {
+        tfp->close();
+    }
+    return 0;
+}
+
+static void dump_trace(bool flush) {
+    if (!tfp || !tfp->isOpen()) {
+        return;
+    }
+    if (trace_rotate && main_time >= trace_rotate_time) {
+        tfp->close();
+        open_trace();
+    }
+    tfp->dump(main_time);
+    if (flush) {
+        tfp->flush();
+    }
+}
+#endif
+
+// How often the model was evaluated, to find tests which waste evaluations
+static struct {
+    vluint64_t evals = 0;
+    vluint64_t time_steps = 1;
+    vluint64_t skipped_time_steps = 0;
+} eval_stats;
+
+static void print_eval_stats() {
+    fprintf(stderr,
+            "Verilator eval stats: %llu evals in %llu time steps "
+            "(%llu skipped without events) up to time %llu, "
+            "%.2f evals per time step\n",
+            static_cast<unsigned long long>(eval_stats.evals),
+            static_cast<unsigned long long>(eval_stats.time_steps),
+            static_cast<unsigned long long>(eval_stats.skipped_time_steps),
+            static_cast<unsigned long long>(main_time),
+            static_cast<double>(eval_stats.evals) /
+                static_cast<double>(eval_stats.time_steps));
 }
 
 static inline bool settle_value_callbacks() {
@@ -51,7 +196,10 @@ static inline bool settle_value_callbacks() {
 
     // Call Value Change callbacks
     // These can modify signal values so we loop
-    // until there are no more changes
+    // until there are no more changes.
+    // Only call this between evaluations, on the thread calling eval_step():
+    // the VPI isn't thread-safe, and a model built with --threads only
+    // runs its own threads within eval_step() and eval_end_step().
     cbs_called = again = VerilatedVpi::callValueCbs();
     while (again) {
         again = VerilatedVpi::callValueCbs();
@@ -64,7 +212,7 @@ void wrap_up() {
     VerilatedVpi::callCbs(cbEndOfSimulation);
 
 #if VM_TRACE
-    if (tfp) {
+    if (tfp && tfp->isOpen()) {
         // We don't delete the trace object to avoid deadlock in verilator sims.
         tfp->close();
     }
@@ -91,6 +239,7 @@ int main(int argc, char **argv) {
 #endif
     bool traceOn = false;
     bool traceFlush = false;
+    bool evalStats = false;
     bool coveragePerInstance = false;
 
     for (int i = 1; i < argc; i++) {
@@ -115,6 +264,8 @@ int main(int argc, char **argv) {
 #endif
         } else if (arg == "--trace-flush") {
             traceFlush = true;
+        } else if (arg == "--eval-stats") {
+            evalStats = true;
         } else if (arg == "--trace-file") {
             if (++i < argc) {
                 traceFile = argv[i];
@@ -126,7 +277,7 @@ int main(int argc, char **argv) {
             fprintf(
                 stderr,
                 "usage: %s [--coverage-per-instance] [--trace] [--trace-flush] "
-                "[--trace-file TRACEFILE]\n"
+                "[--trace-file TRACEFILE] [--eval-stats]\n"
                 "\n"
                 "cocotb + Verilator sim\n"
                 "\n"
@@ -137,7 +288,9 @@ int main(int argc, char **argv) {
                 "  --trace-flush            Flush trace at each time step "
                 "(slow)\n"
                 "  --trace-file             Specify the trace file name (%s by "
-                "default)\n",
+                "default)\n"
+                "  --eval-stats             Print how often the model was "
+                "evaluated at the end\n",
                 basename(argv[0]), traceFile);
             return 0;
         }
@@ -151,6 +304,7 @@ int main(int argc, char **argv) {
     Verilated::debug(99);
 #endif
     std::unique_ptr<Vtop> top(new Vtop(""));
+    model = top.get();
     Verilated::fatalOnVpiError(false);  // otherwise it will fail on systemtf
 
 #ifdef VERILATOR_SIM_DEBUG
@@ -160,10 +314,13 @@ int main(int argc, char **argv) {
 #if VM_TRACE
     Verilated::traceEverOn(true);
     if (traceOn) {
-        tfp = new verilated_trace_t;
-        top->trace(tfp, 99);
-        tfp->open(traceFile);
+        trace_start(traceFile, 0, "", 0);
     }
+    vlog_register_trace_funcs(trace_start, trace_stop);
+#endif
+
+#ifdef COCOTB_VERILATOR_SAVABLE
+    vlog_register_state_funcs(save_state, restore_state);
 #endif
 
     vlog_startup_routines_bootstrap();
@@ -171,12 +328,21 @@ int main(int argc, char **argv) {
     VerilatedVpi::callCbs(cbStartOfSimulation);
     settle_value_callbacks();
 
+    // The first time step evaluates the initial blocks
+    bool skip_eval = false;
+
     while (!Verilated::gotFinish()) {
         do {
             // We must evaluate whole design until we process all 'events' for
             // this time step
             do {
-                top->eval_step();
+                if (skip_eval) {
+                    skip_eval = false;
+                    ++eval_stats.skipped_time_steps;
+                } else {
+                    top->eval_step();
+                    ++eval_stats.evals;
+                }
                 VerilatedVpi::clearEvalNeeded();
                 VerilatedVpi::doInertialPuts();
                 settle_value_callbacks();
@@ -194,12 +360,7 @@ int main(int argc, char **argv) {
         VerilatedVpi::callCbs(cbReadOnlySynch);
 
 #if VM_TRACE
-        if (tfp) {
-            tfp->dump(main_time);
-            if (traceFlush) {
-                tfp->flush();
-            }
-        }
+        dump_trace(traceFlush);
 #endif
         // cocotb controls the clock inputs using cbAfterDelay so
         // skip ahead to the next registered callback
@@ -214,7 +375,7 @@ int main(int argc, char **argv) {
         if (next_time == NO_TOP_EVENTS_PENDING) {
             break;
         } else {
-            main_time = next_time;
+            set_time(next_time);
         }
 
         // Call registered NextSimTime
@@ -228,12 +389,24 @@ int main(int argc, char **argv) {
         // before the iterative regions (IEEE 1800-2012 4.4.1)
         VerilatedVpi::callTimedCbs();
         settle_value_callbacks();
+        ++eval_stats.time_steps;
+
+        // A time step only woke up cocotb which didn't write anything,
+        // and the design has no events of its own now,
+        // so evaluating the model wouldn't change it
+        VerilatedVpi::doInertialPuts();
+        skip_eval = !VerilatedVpi::evalNeeded() &&
+                    next_time_timing != static_cast<vluint64_t>(main_time);
     }
 
     top->final();
 
     wrap_up();
 
+    if (evalStats) {
+        print_eval_stats();
+    }
+
 #if VM_TRACE
     if (tfp) {
         delete tfp;
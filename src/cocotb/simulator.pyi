@@ -4,6 +4,7 @@
 
 # generated with mypy's stubgen script
 
+from collections.abc import Sequence
 from logging import Logger
 from typing import Any, Callable
 
@@ -33,6 +34,10 @@ VALUE_CHANGE: int
 RANGE_UP: int
 RANGE_DOWN: int
 RANGE_NO_DIR: int
+FORMAT_BINSTR: int
+FORMAT_INT: int
+FORMAT_REAL: int
+FORMAT_STR: int
 
 class sim_callback:
     def deregister(self) -> None: ...
@@ -56,6 +61,9 @@ class sim_obj:
         self, name: str, discovery_method: GPIDiscovery | None = GPIDiscovery.AUTO
     ) -> sim_obj | None: ...
     def get_indexable(self) -> bool: ...
+    def get_info(
+        self,
+    ) -> tuple[str, int, str, str, str, bool, int, int, int, int]: ...
     def get_name_string(self) -> str: ...
     def get_num_elems(self) -> int: ...
     def get_range(self) -> tuple[int, int, int]: ...
@@ -66,7 +74,10 @@ class sim_obj:
     def get_signed(self) -> int: ...
     def get_type(self) -> int: ...
     def get_type_string(self) -> str: ...
-    def iterate(self, mode: int) -> sim_obj_iterator: ...
+    def iterate(
+        self, mode: int, pattern: str | None = None, types: int = 0, /
+    ) -> sim_obj_iterator: ...
+    def scan(self) -> tuple[list[sim_obj], bytes]: ...
     def set_signal_val_binstr(self, action: int, value: str) -> None: ...
     def set_signal_val_int(self, action: int, value: int) -> None: ...
     def set_signal_val_real(self, action: int, value: float) -> None: ...
@@ -81,7 +92,14 @@ def root_iterate() -> sim_obj_iterator: ...
 def get_sim_time() -> tuple[int, int]: ...
 def get_simulator_product() -> str: ...
 def get_simulator_version() -> str: ...
+def get_handle_stats() -> dict[str, int]: ...
 def get_simulator_args() -> list[str]: ...
+def save_state(path: str, /) -> None: ...
+def restore_state(path: str, /) -> None: ...
+def trace_start(
+    path: str, depth: int = 0, scope: str = "", rotate: int = 0, /
+) -> None: ...
+def trace_stop() -> None: ...
 def is_running() -> bool: ...
 def set_gpi_log_level(level: int) -> None: ...
 def package_iterate() -> sim_obj_iterator: ...
@@ -107,6 +125,33 @@ class cpp_clock:
     def stop(self) -> None: ...
 
 def clock_create(hdl: sim_obj) -> cpp_clock: ...
+
+class cpp_sampler:
+    def add_signal(self, hdl: sim_obj, value_format: int) -> None: ...
+    def start(self, on_full: Callable[[], object]) -> None: ...
+    def stop(self) -> None: ...
+    def drain(self) -> list[tuple[Any, ...]]: ...
+    def size(self) -> int: ...
+
+def sampler_create(hdl: sim_obj, edge: int, capacity: int) -> cpp_sampler: ...
+
+class cpp_driver:
+    def add_signal(self, hdl: sim_obj, value_format: int) -> None: ...
+    def push(self, rows: Sequence[tuple[Any, ...]]) -> None: ...
+    def start(self, on_empty: Callable[[], object]) -> None: ...
+    def stop(self) -> None: ...
+    def size(self) -> int: ...
+
+def driver_create(hdl: sim_obj, edge: int, set_action: int) -> cpp_driver: ...
+
+class cpp_recorder:
+    def add_signal(self, hdl: sim_obj, value_format: int) -> int: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
+    def drain(self) -> tuple[bytes, bytes, list[Any]]: ...
+    def size(self) -> int: ...
+
+def recorder_create() -> cpp_recorder: ...
 def initialize_logger(
     log_func: Callable[[Logger, int, str, int, str, str], None],
     get_logger: Callable[[str], Logger],
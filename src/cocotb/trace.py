@@ -0,0 +1,301 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Recording of value changes of selected signals into an in-memory trace."""
+
+from __future__ import annotations
+
+import importlib
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Sized
+from typing import Any, Callable, cast
+
+import cocotb
+import cocotb.simtime
+import cocotb.simulator
+from cocotb._sampler import _value_decoder
+from cocotb.handle import (
+    EnumObject,
+    IntegerObject,
+    LogicObject,
+    RealObject,
+    StringObject,
+    ValueObjectBase,
+)
+from cocotb.task import Task
+from cocotb.triggers import Event
+
+__all__ = ("Trace", "record")
+
+
+class Trace:
+    """A record of every value change of *signals*.
+
+    Value changes are recorded by the GPI into a compact native buffer of ``(time, index, value)`` columns,
+    without resuming Python, until the Trace is :meth:`stop`\\ ped or the test ends.
+    The current value of every signal is recorded when the Trace is started.
+    Several changes of a signal in one time step, including changes in delta cycles, are all recorded.
+
+    The recorded changes can be iterated over with :meth:`changes`,
+    exported as NumPy arrays with :meth:`to_numpy`,
+    or written to a VCD file with :meth:`write_vcd`,
+    which can be converted to FST with the ``vcd2fst`` tool distributed with GTKWave.
+
+    Args:
+        signals: The signals to record.
+
+    Raises:
+        TypeError: If a signal's type cannot be recorded natively.
+
+    Usage:
+        .. code-block:: python
+
+            trace = cocotb.trace.record([dut.valid, dut.ready, dut.data])
+            ...
+            trace.stop()
+            trace.write_vcd("handshake.vcd")
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, signals: Iterable[ValueObjectBase[Any, Any]]) -> None:
+        self._signals = tuple(signals)
+        self._native = cocotb.simulator.recorder_create()
+        self._formats: list[int] = []
+        self._decoders: list[Any] = []
+        for signal in self._signals:
+            value_format, decoder = _value_decoder(signal)
+            self._native.add_signal(signal._handle, value_format)
+            self._formats.append(value_format)
+            self._decoders.append(decoder)
+        self._times = array("Q")
+        self._indices = array("I")
+        self._values: list[Any] = []
+        self._task: Task[None] | None = None
+
+    @property
+    def signals(self) -> tuple[ValueObjectBase[Any, Any], ...]:
+        """The signals being recorded, in the order of their index."""
+        return self._signals
+
+    @property
+    def times(self) -> array[int]:
+        """The simulation time in steps of each change."""
+        self._collect()
+        return self._times
+
+    @property
+    def indices(self) -> array[int]:
+        """The index into :attr:`signals` of the signal of each change."""
+        self._collect()
+        return self._indices
+
+    @property
+    def values(self) -> list[Any]:
+        """The new value of each change, in the format returned by the GPI.
+
+        This is :class:`str` for logic and wide integer signals, :class:`int`, :class:`float`, or :class:`bytes`.
+        """
+        self._collect()
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._times) + self._native.size()
+
+    def start(self) -> None:
+        """Start recording.
+
+        Raises:
+            RuntimeError: If the trace has already been started.
+        """
+        if self._task is not None:
+            raise RuntimeError("Starting trace that has already been started.")
+        self._native.start()
+
+        async def run() -> None:
+            try:
+                # Recording happens natively; wait forever on an Event that's never set.
+                await Event().wait()
+            finally:
+                # Also stop when the test ends without calling stop().
+                self._native.stop()
+
+        self._task = cocotb.start_soon(run())
+
+    def stop(self) -> None:
+        """Stop recording. The recorded changes are kept.
+
+        Raises:
+            RuntimeError: If the trace was never started.
+        """
+        if self._task is None:
+            raise RuntimeError("Stopping trace that was never started.")
+        # The task may not have run yet, in which case cancelling it runs nothing.
+        self._task.cancel()
+        self._task = None
+        self._native.stop()
+
+    def _collect(self) -> None:
+        if not self._native.size():
+            return
+        times, indices, values = self._native.drain()
+        self._times.frombytes(times)
+        self._indices.frombytes(indices)
+        self._values.extend(values)
+
+    def changes(
+        self, signal: ValueObjectBase[Any, Any] | None = None
+    ) -> Iterator[tuple[int, ValueObjectBase[Any, Any], Any]]:
+        """Iterate over the recorded changes as ``(time, signal, value)`` tuples.
+
+        *value* is of the same type as :attr:`~cocotb.handle.ValueObjectBase.value` returns.
+
+        Args:
+            signal: If given, only iterate over the changes of this signal.
+        """
+        self._collect()
+        signals = self._signals
+        decoders = self._decoders
+        index = None if signal is None else signals.index(signal)
+        for time, i, value in zip(self._times, self._indices, self._values):
+            if index is not None and i != index:
+                continue
+            decoder = decoders[i]
+            yield time, signals[i], value if decoder is None else decoder(value)
+
+    def to_numpy(self) -> tuple[Any, Any, Any]:
+        """Return the recorded changes as NumPy arrays.
+
+        Returns:
+            The ``(times, indices, values)`` columns.
+            *times* has dtype ``uint64``, *indices* has dtype ``uint32``,
+            and *values* is an ``object`` array of :attr:`values`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        # NumPy is optional, and imported by name so type checking doesn't need it.
+        np = importlib.import_module("numpy")
+
+        self._collect()
+        values = np.empty(len(self._values), dtype=object)
+        values[:] = self._values
+        return (
+            # Copy so the arrays can still grow while recording continues.
+            np.frombuffer(self._times, dtype=np.uint64).copy(),
+            np.frombuffer(self._indices, dtype=np.uint32).copy(),
+            values,
+        )
+
+    def write_vcd(self, path: str | os.PathLike[str]) -> None:
+        """Write the recorded changes to a Value Change Dump file at *path*.
+
+        Signals are placed in scopes following their hierarchical path.
+        """
+        self._collect()
+        ids = [_vcd_id(i) for i in range(len(self._signals))]
+        formatters = [
+            _vcd_formatter(signal, value_format, vcd_id)
+            for signal, value_format, vcd_id in zip(self._signals, self._formats, ids)
+        ]
+
+        with open(path, "w") as f:
+            f.write(f"$version cocotb {cocotb.__version__} $end\n")
+            f.write(
+                f"$timescale {_vcd_timescale(cocotb.simtime.time_precision)} $end\n"
+            )
+
+            scope: list[str] = []
+            for i in sorted(
+                range(len(self._signals)), key=lambda i: self._signals[i]._path
+            ):
+                signal = self._signals[i]
+                *path_scope, name = signal._path.split(".")
+                common = 0
+                while (
+                    common < min(len(scope), len(path_scope))
+                    and scope[common] == path_scope[common]
+                ):
+                    common += 1
+                for _ in scope[common:]:
+                    f.write("$upscope $end\n")
+                for s in path_scope[common:]:
+                    f.write(f"$scope module {s} $end\n")
+                scope = path_scope
+                var_type, width = _vcd_var(signal)
+                f.write(f"$var {var_type} {width} {ids[i]} {name} $end\n")
+            for _ in scope:
+                f.write("$upscope $end\n")
+            f.write("$enddefinitions $end\n")
+
+            last_time = None
+            for time, i, value in zip(self._times, self._indices, self._values):
+                if time != last_time:
+                    f.write(f"#{time}\n")
+                    last_time = time
+                f.write(formatters[i](value))
+
+    def __repr__(self) -> str:
+        signals = ", ".join(s._path for s in self._signals)
+        return f"<{type(self).__qualname__} of [{signals}], {len(self)} changes>"
+
+
+def record(signals: Iterable[ValueObjectBase[Any, Any]]) -> Trace:
+    """Create and start a :class:`Trace` of *signals*.
+
+    Returns:
+        The started :class:`Trace`, which can be :meth:`~Trace.stop`\\ ped.
+
+    .. versionadded:: 2.1
+    """
+    trace = Trace(signals)
+    trace.start()
+    return trace
+
+
+def _vcd_id(n: int) -> str:
+    # Identifiers are made of the printable ASCII characters '!' to '~'.
+    chars = []
+    while True:
+        n, r = divmod(n, 94)
+        chars.append(chr(33 + r))
+        if not n:
+            return "".join(chars)
+
+
+def _vcd_timescale(precision: int) -> str:
+    for exponent, unit in ((0, "s"), (-3, "ms"), (-6, "us"), (-9, "ns"), (-12, "ps")):
+        if precision >= exponent:
+            return f"{10 ** (precision - exponent)} {unit}"
+    return f"{10 ** max(precision + 15, 0)} fs"
+
+
+def _vcd_var(signal: ValueObjectBase[Any, Any]) -> tuple[str, int]:
+    if isinstance(signal, (IntegerObject, EnumObject)):
+        return "integer", len(signal)
+    elif isinstance(signal, RealObject):
+        return "real", 64
+    elif isinstance(signal, StringObject):
+        return "string", 1
+    elif isinstance(signal, LogicObject):
+        return "wire", 1
+    return "wire", len(cast("Sized", signal))
+
+
+def _vcd_formatter(
+    signal: ValueObjectBase[Any, Any], value_format: int, vcd_id: str
+) -> Callable[[Any], str]:
+    if value_format == cocotb.simulator.FORMAT_INT:
+        n_bits = len(cast("Sized", signal))
+        mask = (1 << n_bits) - 1
+        return lambda value: f"b{value & mask:0{n_bits}b} {vcd_id}\n"
+    elif value_format == cocotb.simulator.FORMAT_REAL:
+        return lambda value: f"r{value:.16g} {vcd_id}\n"
+    elif value_format == cocotb.simulator.FORMAT_STR:
+        return lambda value: (
+            f"s{value.decode('ascii', 'backslashreplace').replace(' ', '_')} {vcd_id}\n"
+        )
+    elif isinstance(signal, LogicObject):
+        return lambda value: f"{value.lower()}{vcd_id}\n"
+    return lambda value: f"b{value.lower()} {vcd_id}\n"
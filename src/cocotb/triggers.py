@@ -5,7 +5,14 @@ from __future__ import annotations
 
 import warnings
 
-from cocotb._base_triggers import Event, Lock, NullTrigger, Trigger
+from cocotb._base_triggers import (
+    BoundedSemaphore,
+    Event,
+    Lock,
+    NullTrigger,
+    Semaphore,
+    Trigger,
+)
 from cocotb._concurrent_waiters import gather, select, wait
 from cocotb._extended_awaitables import (
     ClockCycles,
@@ -30,6 +37,7 @@ from cocotb._gpi_triggers import (
 from cocotb._task_manager import TaskManager
 
 __all__ = (
+    "BoundedSemaphore",
     "ClockCycles",
     "Combine",
     "Edge",
@@ -43,6 +51,7 @@ __all__ = (
     "ReadOnly",
     "ReadWrite",
     "RisingEdge",
+    "Semaphore",
     "SimTimeoutError",
     "TaskManager",
     "Timer",
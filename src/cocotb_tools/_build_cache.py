@@ -0,0 +1,156 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Cache of build directories, keyed by everything that goes into a build.
+
+:meth:`.Runner.build` hashes the build commands, which contain the sources, defines,
+parameters and build arguments, together with the contents of the sources and the files they include,
+the simulator executables and the cocotb version.
+After a build, the files of the library it built are copied into the cache directory under that key,
+so later builds with the same key, in other runs or other checkouts at the same path, copy it back instead of compiling.
+
+Simulators build incrementally, so a build only writes the files which changed.
+The files written by every build of a library are therefore listed in a file next to its build stamp,
+and the cache stores all of them, not only those of the last build.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import logging
+import shutil
+import tempfile
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+
+import cocotb_tools.config
+
+_log = logging.getLogger("cocotb.runner.build_cache")
+
+
+def build_key(cmds: Sequence[Sequence[str]], files: Iterable[Path]) -> str:
+    """Return the key of a build running *cmds* which reads *files*."""
+    hasher = hashlib.sha256()
+    hasher.update(cocotb_tools.config._get_version().encode())
+    for executable in sorted({cmd[0] for cmd in cmds if cmd}):
+        # The simulator version is not known to every runner,
+        # but a new version comes with a new executable.
+        path = shutil.which(executable)
+        if path is not None:
+            stat = Path(path).stat()
+            hasher.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+    for cmd in cmds:
+        hasher.update("\0".join(cmd).encode() + b"\n")
+    for file in files:
+        hasher.update(f"{file}\0".encode())
+        with open(file, "rb") as f:
+            while chunk := f.read(1 << 20):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def commands_key(cmds: Sequence[Sequence[str]]) -> str:
+    """Return a key which only changes with *cmds*, unlike :func:`build_key`."""
+    hasher = hashlib.sha256()
+    for cmd in cmds:
+        hasher.update("\0".join(cmd).encode() + b"\n")
+    return hasher.hexdigest()
+
+
+def read_key(stamp: Path) -> str | None:
+    """Return the key of the build recorded in the *stamp* file, or ``None`` if it isn't known."""
+    try:
+        return stamp.read_text() or None
+    except OSError:
+        return None
+
+
+def snapshot(build_dir: Path) -> dict[Path, tuple[int, int]]:
+    """Return the modification time and size of every file in *build_dir*, by path relative to it."""
+    files: dict[Path, tuple[int, int]] = {}
+    for path in build_dir.rglob("*"):
+        if path.is_file() or path.is_symlink():
+            stat = path.lstat()
+            files[path.relative_to(build_dir)] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def changed(build_dir: Path, before: Mapping[Path, tuple[int, int]]) -> set[Path]:
+    """Return the files in *build_dir* which changed since the :func:`snapshot` *before*."""
+    return {
+        path for path, stat in snapshot(build_dir).items() if before.get(path) != stat
+    }
+
+
+def read_files(path: Path) -> set[Path] | None:
+    """Return the files listed in *path* by :func:`write_files`, or ``None`` if it doesn't exist."""
+    try:
+        text = path.read_text()
+    except OSError:
+        return None
+    return {Path(line) for line in text.splitlines() if line}
+
+
+def write_files(path: Path, files: Iterable[Path]) -> None:
+    """List *files* in *path*."""
+    path.write_text("".join(f"{file.as_posix()}\n" for file in sorted(files)))
+
+
+class BuildCache:
+    """Build directories by key, in a directory which can be shared by many workspaces."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def restore(self, key: str, build_dir: Path) -> bool:
+        """Copy the build with *key* into *build_dir*.
+
+        Returns:
+            ``False`` if there is no such build in the cache.
+        """
+        cached = self.path / key
+        if not cached.is_dir():
+            return False
+        shutil.copytree(cached, build_dir, symlinks=True, dirs_exist_ok=True)
+        _log.info("Reusing build %s from %s", key, self.path)
+        return True
+
+    def store(
+        self,
+        key: str,
+        build_dir: Path,
+        files: Iterable[Path] | None = None,
+        ignore: Iterable[str] = (),
+    ) -> None:
+        """Copy the build in *build_dir* into the cache as *key*.
+
+        Only *files*, by path relative to *build_dir*, are copied if given,
+        so restoring a library doesn't overwrite other libraries built into the same directory.
+        Files which no longer exist, and files with names matching a pattern in *ignore*, are left out.
+        """
+        cached = self.path / key
+        if cached.is_dir():
+            return
+        ignore = tuple(ignore)
+        files = [
+            path
+            for path in (snapshot(build_dir) if files is None else sorted(files))
+            if ((build_dir / path).is_file() or (build_dir / path).is_symlink())
+            and not any(fnmatch.fnmatch(path.name, pattern) for pattern in ignore)
+        ]
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Copy to a temporary directory and rename it, so concurrent builds never see a partial copy.
+        tmp = Path(tempfile.mkdtemp(dir=self.path, prefix=f"{key}."))
+        try:
+            for path in files:
+                (tmp / path).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(build_dir / path, tmp / path, follow_symlinks=False)
+            tmp.rename(cached)
+        except OSError:
+            # Another build stored the same key first, or the cache is unusable.
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not cached.is_dir():
+                raise
+        else:
+            _log.info("Stored build %s in %s", key, self.path)
@@ -0,0 +1,71 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Files and libraries HDL sources depend on, besides those given to :meth:`.Runner.build`.
+
+Sources are scanned with regular expressions rather than parsed,
+so a dependency commented out is still found. That only costs a rebuild that wasn't needed.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+_verilog_include_re = re.compile(rb'`include\s+"([^"]+)"')
+_vhdl_library_re = re.compile(
+    rb"^\s*(?:library\s+(\w+(?:\s*,\s*\w+)*)|use\s+(\w+)\.)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_vhdl_builtin_libraries = frozenset(("std", "ieee", "work"))
+
+
+def _find_include(name: str, directories: Iterable[Path]) -> Path | None:
+    for directory in directories:
+        path = directory / name
+        if path.is_file():
+            return path.resolve()
+    return None
+
+
+def scan_includes(sources: Iterable[Path], includes: Sequence[Path]) -> list[Path]:
+    """Return the files included by Verilog *sources*, and by the files they include.
+
+    Included files are looked up next to the including file, then in the *includes* directories.
+    Files which can't be found, like those shipped with the simulator, are left out.
+    """
+    found: dict[Path, None] = {}
+    pending = list(sources)
+    seen = set(pending)
+    while pending:
+        source = pending.pop()
+        try:
+            text = source.read_bytes()
+        except OSError:
+            continue
+        for match in _verilog_include_re.finditer(text):
+            name = match.group(1).decode(errors="replace")
+            path = _find_include(name, (source.parent, *includes))
+            if path is not None and path not in seen:
+                seen.add(path)
+                found[path] = None
+                pending.append(path)
+    return list(found)
+
+
+def scan_libraries(sources: Iterable[Path]) -> set[str]:
+    """Return the lowercase names of the libraries VHDL *sources* use, except ``std``, ``ieee`` and ``work``."""
+    libraries: set[str] = set()
+    for source in sources:
+        try:
+            text = source.read_bytes()
+        except OSError:
+            continue
+        for match in _vhdl_library_re.finditer(text):
+            names = match.group(1) or match.group(2)
+            libraries.update(
+                name.strip().decode().lower() for name in names.split(b",")
+            )
+    return libraries - _vhdl_builtin_libraries
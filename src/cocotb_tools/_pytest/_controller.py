@@ -43,6 +43,7 @@ from pytest import (
 )
 
 import cocotb
+import cocotb_tools.runner
 from cocotb_tools import _env
 from cocotb_tools._pytest._handle import MockSimHandle
 from cocotb_tools._pytest._junitxml import JUnitXML
@@ -234,6 +235,9 @@ class Controller:
         self, session: Session, exitstatus: int | ExitCode
     ) -> None:
         """Stop started thread."""
+        # Simulator processes kept running for later tests have no more tests to run.
+        cocotb_tools.runner._stop_simulators()
+
         if self._thread:
             with Client(address=self._listener.address) as client:
                 client.send(None)  # notify _run thread to exit
@@ -9,6 +9,7 @@ from __future__ import annotations
 import sys
 
 import cocotb
+import cocotb._test_queue
 from cocotb_tools import _env
 from cocotb_tools._pytest._regression import RegressionManager
 
@@ -45,6 +46,11 @@ def run_regression() -> None:
         relative_to=_env.get_str("COCOTB_RESULTS_RELATIVE_TO"),
         # List of file attachments to be included in created test reports
         attachments=_env.get_list("COCOTB_RESULTS_ATTACHMENTS"),
+        # Share of tests to run when tests are split across simulator processes
+        shard_index=_env.get_int("COCOTB_SHARD_INDEX", default=0),
+        shard_count=_env.get_int("COCOTB_SHARD_COUNT", default=1),
+        # Tests shared with other simulator processes
+        test_queue=cocotb._test_queue.from_env(),
     )
 
     manager.start_regression()
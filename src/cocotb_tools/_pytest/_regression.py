@@ -21,6 +21,7 @@ from time import sleep, time
 from typing import Any, Callable, Literal, cast
 
 from _pytest.config import default_plugins
+from _pytest.junitxml import mangle_test_address
 from _pytest.logging import LoggingPlugin
 from _pytest.outcomes import Exit, Skipped
 from pytest import (
@@ -44,6 +45,8 @@ from pytest import (
 import cocotb
 import cocotb._shutdown
 import cocotb._test_manager
+import cocotb._test_queue
+import cocotb._worker
 import cocotb.simulator
 import cocotb.types._resolve
 from cocotb._extended_awaitables import with_timeout
@@ -95,6 +98,9 @@ class RegressionManager:
         toplevel: str = "",
         reporter_address: str = "",
         xmlpath: str | None = None,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        test_queue: cocotb._test_queue.TestQueue | None = None,
         keywords: Iterable[str] | None = None,
         test_modules: Iterable[str] | None = None,
         invocation_dir: Path | str | None = None,
@@ -116,6 +122,9 @@ class RegressionManager:
             seed: Initialization value for the random number generator. If not provided, use current timestamp.
             relative_to: If provided, all absolute paths will be converted to relative ones.
             attachments: List of file attachments to be included in created test reports.
+            shard_index: Index of the share of tests to run when tests are split across *shard_count* simulator processes.
+            shard_count: Number of simulator processes the tests are split across.
+            test_queue: Tests shared with other simulator processes, each run by the process which claims it first.
         """
         self._toplevel: str = toplevel
         """Name of top level."""
@@ -157,6 +166,13 @@ class RegressionManager:
             Path(relative_to_path).resolve() if relative_to_path else Path.cwd()
         )
         self._attachments: list[Path] = self._normalize_paths(attachments)
+        self._shard_index: int = shard_index
+        self._shard_count: int = shard_count
+        self._queue: cocotb._test_queue.TestQueue | None = test_queue
+        self._items: list[Item] = []
+        """Tests run by this process, in order."""
+        self._unclaimed: deque[Item] = deque[Item]()
+        """Tests which might still be claimed when tests are shared with other processes."""
 
         pluginmanager = PytestPluginManager()
 
@@ -264,6 +280,37 @@ class RegressionManager:
 
         return list(self._collect(items))
 
+    @hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, session: Session, config: Config, items: list[Item]
+    ) -> None:
+        """Only keep the share of tests of this simulator process when tests are sharded,
+        and order tests longest first when they are shared with other processes.
+
+        Args:
+            session: The pytest session object.
+            config: The pytest config object.
+            items: List of item objects.
+        """
+        if self._queue is not None:
+            # the tests are claimed one at a time, so claim the longest first
+            queue = self._queue
+            items.sort(key=lambda item: -queue.duration(_junit_name(item)))
+
+        if self._shard_count <= 1:
+            return
+
+        selected: list[Item] = items[self._shard_index :: self._shard_count]
+        deselected: list[Item] = [
+            item
+            for index, item in enumerate(items)
+            if index % self._shard_count != self._shard_index
+        ]
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
     @hookimpl(tryfirst=True)
     def pytest_runtestloop(self, session: Session) -> bool:
         if (
@@ -274,7 +321,14 @@ class RegressionManager:
                 f"{session.testsfailed} error{'s' if session.testsfailed != 1 else ''} during collection"
             )
 
-        if not session.config.option.collectonly and session.items:
+        if not session.config.option.collectonly:
+            if self._queue is None:
+                self._items = session.items
+            else:
+                self._unclaimed.extend(session.items)
+                self._claim()
+
+        if self._items:
             item, nextitem = self._get_item()
             item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
         else:
@@ -298,14 +352,29 @@ class RegressionManager:
     @property
     def _item(self) -> Item:
         """Get current pytest item (test)."""
-        return self._session.items[self._index]
+        return self._items[self._index]
 
     @property
     def _nextitem(self) -> Item | None:
         """Get next pytest item (test) needed by test teardown phase."""
         index: int = self._index + 1
 
-        return self._session.items[index] if index < len(self._session.items) else None
+        if index == len(self._items):
+            self._claim()
+
+        return self._items[index] if index < len(self._items) else None
+
+    def _claim(self) -> None:
+        """Claim the next test which no other simulator process has claimed, if there is one."""
+        if self._queue is None:
+            return
+
+        while self._unclaimed:
+            item: Item = self._unclaimed.popleft()
+
+            if self._queue.claim(_junit_name(item)):
+                self._items.append(item)
+                return
 
     def _collect(
         self, items: Iterable[Item | Collector]
@@ -502,8 +571,23 @@ class RegressionManager:
         )
 
         self._session.config._ensure_unconfigure()
+
+        # Keep simulating for the tests the runner sends next, unless the simulation failed.
+        if (
+            self._session.exitstatus != ExitCode.INTERNAL_ERROR
+            and cocotb._worker.wait_for_tests()
+        ):
+            self._timer1._register(self._run_next_regression)
+            return
+
         self._shutdown()
 
+    def _run_next_regression(self) -> None:
+        # The regression is created from the environment variables the runner sent.
+        from cocotb_tools._pytest._init import run_regression  # noqa: PLC0415
+
+        run_regression()
+
     @hookimpl(tryfirst=True)
     def pytest_runtest_setup(self, item: Item) -> None:
         """Called to perform the setup phase for a test item.
@@ -922,6 +1006,11 @@ def _interactive_exception(item: Item, call: CallInfo, report: TestReport) -> No
         pass
 
 
+def _junit_name(item: Item) -> str:
+    """Name of test in JUnit XML report as ``classname.name``."""
+    return ".".join(mangle_test_address(item.nodeid))
+
+
 def _to_timeout(duration: float, unit: TimeUnit) -> tuple[float, TimeUnit]:
     """Helper function to extract ``*marker.args`` and ``**marker.kwargs`` to tuple."""
     return duration, unit
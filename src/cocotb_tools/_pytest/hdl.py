@@ -157,6 +157,12 @@ class HDL:
         self.seed: str | int | None = option.cocotb_seed
         """A specific random seed to use."""
 
+        self.shards: int = option.cocotb_shards
+        """Number of simulator processes to split the tests across."""
+
+        self.reuse_simulator: bool = option.cocotb_reuse_simulator
+        """Run the tests in a simulator process kept running by an earlier test with the same settings."""
+
         self.elab_args: MutableSequence[str] = []
         """A list of elaboration arguments for the simulator."""
 
@@ -333,6 +339,8 @@ class HDL:
         timescale: tuple[str, str] | None = None,
         build_dir: PathLike | None = None,
         test_dir: PathLike | None = None,
+        shards: int | None = None,
+        reuse_simulator: bool | None = None,
     ) -> Path:
         """Test HDL design.
 
@@ -391,6 +399,12 @@ class HDL:
             test_dir:
                 Directory to run the tests in.
 
+            shards:
+                Number of simulator processes to split the tests across.
+
+            reuse_simulator:
+                Run the tests in a simulator process kept running by an earlier test with the same settings.
+
         Returns:
             Path to created results file with cocotb tests in JUnit XML format.
         """
@@ -433,6 +447,10 @@ class HDL:
             pre_cmd=pre_cmd or None,
             verbose=verbose or self.verbose,
             timescale=None if self.simulator in ("xcelium",) else timescale,
+            shards=shards or self.shards,
+            reuse_simulator=(
+                self.reuse_simulator if reuse_simulator is None else reuse_simulator
+            ),
         )
 
     def _apply_markers(self, node: Any) -> None:
@@ -147,6 +147,25 @@ _OPTIONS: tuple[Option, ...] = (
         type=int,
         description="Seed the Python random module to recreate a previous test stimulus.",
     ),
+    Option(
+        "cocotb_shards",
+        metavar="N",
+        default=1,
+        type=int,
+        description="""
+            Split the cocotb tests of each cocotb runner across N simulator processes running at the same time.
+            All processes use the same random seed and report their test results, which are merged into one results file.
+        """,
+    ),
+    Option(
+        "cocotb_reuse_simulator",
+        action="store_true",
+        description="""
+            Keep each simulator process running after its cocotb tests finished, and run the cocotb tests of later
+            cocotb runners with the same design, parameters and settings in it, instead of starting and elaborating
+            the design again. Later tests start at the simulation time the previous tests ended at.
+        """,
+    ),
     Option(
         "cocotb_attach",
         metavar="SECONDS",
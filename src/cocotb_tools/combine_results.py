@@ -37,6 +37,53 @@ def _get_properties(element: ET.Element) -> dict[str, str]:
     }
 
 
+def _merge_results(results_files: Iterable[Path], output_file: Path) -> None:
+    """Merge the results files of simulator processes which each ran a share of the same tests.
+
+    Test suites with the same name are merged into one and their counters are recounted.
+    Test cases which more than one process ran, like a checkpoint test, are only kept once.
+    """
+    result: ET.Element | None = None
+    testsuites: dict[str | None, ET.Element] = {}
+    testcases: set[tuple[str | None, str | None]] = set()
+
+    for fname in results_files:
+        root = ET.parse(fname).getroot()
+        if result is None:
+            result = ET.Element(root.tag, root.attrib)
+        for ts in root.iter("testsuite"):
+            merged = testsuites.get(ts.get("name"))
+            if merged is None:
+                merged = ET.SubElement(result, "testsuite", ts.attrib)
+                testsuites[ts.get("name")] = merged
+            for child in ts:
+                if child.tag == "testcase":
+                    key = (child.get("classname"), child.get("name"))
+                    if key in testcases:
+                        continue
+                    testcases.add(key)
+                elif any(c.tag == child.tag for c in merged):
+                    # properties etc. are the same in every process
+                    continue
+                merged.append(child)
+
+    if result is None:
+        return
+
+    for merged in testsuites.values():
+        cases = merged.findall("testcase")
+        merged.set("tests", str(len(cases)))
+        for tag, counter in (
+            ("failure", "failures"),
+            ("error", "errors"),
+            ("skipped", "skipped"),
+        ):
+            merged.set(counter, str(sum(c.find(tag) is not None for c in cases)))
+        merged.set("time", f"{sum(float(c.get('time', 0)) for c in cases):.3f}")
+
+    ET.ElementTree(result).write(output_file, encoding="utf-8", xml_declaration=True)
+
+
 def _get_parser() -> argparse.ArgumentParser:
     """Return the cmdline parser"""
     parser = argparse.ArgumentParser(
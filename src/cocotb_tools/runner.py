@@ -10,6 +10,9 @@
 # TODO: support custom dependencies
 from __future__ import annotations
 
+import atexit
+import copy
+import hashlib
 import logging
 import multiprocessing
 import os
@@ -19,13 +22,18 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import suppress
 from itertools import chain
+from multiprocessing.connection import Client, Connection, Listener
 from pathlib import Path
 from typing import (
+    IO,
     Any,
     ClassVar,
     Generic,
@@ -36,11 +44,14 @@ from typing import (
 
 import find_libpython
 
+import cocotb_tools._build_cache
+import cocotb_tools._dependencies
 import cocotb_tools.config
 from cocotb.types._logic import Logic
 from cocotb.types._logic_array import LogicArray
 from cocotb_tools import _env
 from cocotb_tools.check_results import get_results
+from cocotb_tools.combine_results import _merge_results
 from cocotb_tools.sim_versions import NvcVersion
 
 if sys.version_info >= (3, 10):
@@ -190,6 +201,13 @@ class VerilatorControlFile(_Tag):
     """Tags source files to :meth:`Runner.build() <cocotb_tools.runner.Runner.build>` as Verilator control files."""
 
 
+_hierarchy_index_files = "cocotb_hierarchy_index.*.json"
+"""Pattern of the names of the hierarchy indexes of a build, one for each way the design is elaborated."""
+_discovery_cache_file = "cocotb_discovery_cache.json"
+
+_MAX_ERROR_LINES = 10
+"""Number of lines reporting errors to include in the exception raised when a command fails."""
+
 _verilog_extensions = (".v", ".sv", ".vh", ".svh")
 _vhdl_extensions = (".vhd", ".vhdl")
 
@@ -213,6 +231,15 @@ def _determine_file_type(
 class Runner(ABC):
     supported_gpi_interfaces: ClassVar[dict[str, list[str]]] = {}
 
+    _parallel_library_builds: ClassVar[bool] = False
+    """Whether several libraries can be built into the same build directory at the same time."""
+
+    _error_re: ClassVar[re.Pattern[str] | None] = None
+    """Matches the lines of simulator output which report errors."""
+
+    _design_in_test_dir: ClassVar[bool] = False
+    """Whether the simulator finds the built design relative to the directory the tests run in."""
+
     def __init__(self) -> None:
         self._simulator_in_path()
 
@@ -225,6 +252,17 @@ class Runner(ABC):
         self.log = logging.getLogger(type(self).__qualname__)
         self.log.setLevel(logging.INFO)
 
+        self.output_filter: Callable[[str], str | None] | None = None
+        """Function called with each line of simulator output, including the line break,
+        which returns the line to show or write to the log file, or ``None`` to leave it out.
+
+        Output is only read line by line if this is set or a *log_file* is given,
+        and otherwise goes straight to the terminal.
+        Lines reporting errors are only included in the exception raised when a command fails if output is read.
+
+        .. versionadded:: 2.1
+        """
+
     @abstractmethod
     def _simulator_in_path(self) -> None:
         """Raise exception if the simulator executable does not exist in :envvar:`PATH`.
@@ -351,6 +389,7 @@ class Runner(ABC):
         timescale: tuple[str, str] | None = None,
         waves: bool = False,
         log_file: PathLike | None = None,
+        build_cache: PathLike | None = None,
     ) -> None:
         """Build the HDL sources.
 
@@ -386,6 +425,12 @@ class Runner(ABC):
         Tagged *build_args* only supply that option to the compiler when building the source file for the tagged language.
         Non-tagged *build_args* are supplied when compiling any language.
 
+        Simulators which don't track dependencies themselves only compile the sources again
+        if they are newer than the last build, or a file they include,
+        or the last build of a library they use with a VHDL ``library`` or ``use`` clause.
+        Questa also compiles them again if the build commands changed, for example with other *defines*.
+        So with one call per library, only the libraries which are out of date are compiled.
+
         Args:
             hdl_library: The library name to compile into.
             verilog_sources: Verilog source files to build.
@@ -406,6 +451,14 @@ class Runner(ABC):
             timescale: Tuple containing time unit and time precision for simulation.
             waves: Record signal traces. Overridden by the :envvar:`WAVES` environment variable.
             log_file: File to write the build log to.
+            build_cache: Directory in which to keep copies of *build_dir* to reuse for identical builds.
+                Defaults to :envvar:`COCOTB_BUILD_CACHE`.
+                With a cache, a build is identified by a hash of the build commands,
+                the contents of the sources and the Verilog files they include,
+                the simulator executables and the cocotb version, instead of the times the sources were modified.
+                A build is skipped if *build_dir* holds the same build, or copied from the cache if it holds one.
+                Outputs written to *cwd* outside of *build_dir* aren't cached.
+                Since simulators record absolute paths, builds are only reused with the same *build_dir* and source paths.
 
         .. deprecated:: 2.0
 
@@ -418,6 +471,12 @@ class Runner(ABC):
             *defines* are no longer implicitly converted to HDL literals.
             Users must explicitly call :func:`~cocotb_tools.runner.as_vhdl_literal` or
             :func:`~cocotb_tools.runner.as_sv_literal` to convert Python values to HDL literals.
+
+        .. versionchanged:: 2.1
+            Added the *build_cache* argument.
+
+        .. versionchanged:: 2.1
+            Files included by the sources and libraries used by them are checked to decide whether to build again.
         """
         # We don't get anything by printing this if the build fails
         __tracebackhide__ = True
@@ -468,7 +527,270 @@ class Runner(ABC):
         self.build_dir.mkdir(parents=True, exist_ok=True)
 
         cmds: Sequence[_Command] = self._build_command()
-        self._execute(cmds, cwd=self.cwd)
+
+        if build_cache is None:
+            build_cache = _env.get_str("COCOTB_BUILD_CACHE") or None
+        cache: cocotb_tools._build_cache.BuildCache | None = None
+        before: dict[Path, tuple[int, int]] = {}
+        # The files written by earlier builds of the library, or None if they aren't known.
+        library_files: set[Path] | None = None
+        key: str | None = None
+        restored = False
+        if build_cache is not None:
+            cache = cocotb_tools._build_cache.BuildCache(get_abs_path(build_cache))
+            key, all_cmds = self._build_key()
+            if not self.always:
+                if cocotb_tools._build_cache.read_key(self._build_stamp()) == key:
+                    cmds = []
+                elif cache.restore(key, self.build_dir):
+                    cmds = []
+                    restored = True
+                    cocotb_tools._build_cache.write_files(
+                        self._library_files(),
+                        cocotb_tools._build_cache.snapshot(cache.path / key),
+                    )
+                else:
+                    # Sources may look older than the last build while defines or arguments changed.
+                    cmds = cmds or all_cmds
+
+        if cmds:
+            if cache is not None:
+                library_files = cocotb_tools._build_cache.read_files(
+                    self._library_files()
+                )
+                if library_files is None and not self._build_stamp().exists():
+                    library_files = set()
+                before = cocotb_tools._build_cache.snapshot(self.build_dir)
+            # Only a successful build may leave a stamp.
+            self._build_stamp().unlink(missing_ok=True)
+            if library_files is None:
+                # The files this build writes can't be added to a list which misses earlier ones.
+                self._library_files().unlink(missing_ok=True)
+
+        try:
+            self._execute(cmds, cwd=self.cwd)
+        finally:
+            if library_files is not None:
+                # Even a failed build may have compiled some units which later builds skip.
+                library_files |= cocotb_tools._build_cache.changed(
+                    self.build_dir, before
+                )
+                cocotb_tools._build_cache.write_files(
+                    self._library_files(), library_files
+                )
+
+        if cmds or restored:
+            # The design may have changed, so the hierarchy index of the last build is stale.
+            for index_file in self.build_dir.glob(_hierarchy_index_files):
+                with suppress(OSError):
+                    index_file.unlink()
+            # The stamp is newer than the sources of libraries which must be rebuilt against this one.
+            self._build_stamp().write_text(
+                key
+                or cocotb_tools._build_cache.commands_key(self._all_build_commands())
+            )
+
+        if cache is not None and key is not None and cmds:
+            if library_files is None:
+                self.log.info(
+                    "Not storing the build in %s, since %s was built before without it; "
+                    "build with clean=True to store it",
+                    cache.path,
+                    self.hdl_library,
+                )
+            else:
+                cache.store(
+                    key,
+                    self.build_dir,
+                    library_files,
+                    ignore=(_hierarchy_index_files, self._library_files().name),
+                )
+
+    def _build_stamp(self, hdl_library: str | None = None) -> Path:
+        """Return the file written by the last successful build of *hdl_library*, defaulting to the library being built.
+
+        It holds the key of the build if a build cache is used,
+        and otherwise a key of the commands which build the library from scratch.
+        """
+        if hdl_library is None:
+            hdl_library = self.hdl_library
+        return self.build_dir / f"cocotb_build_{hdl_library.lower()}"
+
+    def _library_files(self) -> Path:
+        """Return the file listing the files written by builds of the library being built, if a build cache is used."""
+        return self._build_stamp().with_name(f"{self._build_stamp().name}.files")
+
+    def _used_library_stamps(self, sources: Iterable[_ValueAndTag]) -> list[Path]:
+        """Return the build stamps of the other libraries used by the VHDL *sources*."""
+        libraries = cocotb_tools._dependencies.scan_libraries(
+            source.value for source in sources if source.tag is VHDL
+        )
+        libraries.discard(self.hdl_library.lower())
+        return [
+            stamp
+            for stamp in map(self._build_stamp, sorted(libraries))
+            if stamp.is_file()
+        ]
+
+    def _dependencies(self, sources: Iterable[_ValueAndTag]) -> list[Path]:
+        """Return *sources* with the files they include and the build stamps of the libraries they use."""
+        sources = list(sources)
+        return [
+            *(source.value for source in sources),
+            *cocotb_tools._dependencies.scan_includes(
+                (source.value for source in sources if source.tag is Verilog),
+                self.includes,
+            ),
+            *self._used_library_stamps(sources),
+        ]
+
+    def _outdated(self, output: Path, sources: Iterable[_ValueAndTag]) -> bool:
+        """Return ``True`` if *output* must be rebuilt from *sources*.
+
+        Unlike :func:`outdated`, this also looks at the files *sources* include,
+        the libraries they use, and :attr:`always`.
+        """
+        return self.always or outdated(output, self._dependencies(sources))
+
+    def _all_build_commands(self) -> Sequence[_Command]:
+        """Return the commands which build the library from scratch."""
+        always = self.always
+        self.always = True
+        try:
+            return self._build_command()
+        finally:
+            self.always = always
+
+    def _build_key(self) -> tuple[str, Sequence[_Command]]:
+        """Return the key of the build in the build cache, and the commands which build it from scratch."""
+        cmds = self._all_build_commands()
+        files = self._dependencies(
+            chain(self._sources, self._verilog_sources, self._vhdl_sources)
+        )
+        return cocotb_tools._build_cache.build_key(cmds, files), cmds
+
+    def build_libraries(
+        self,
+        builds: Sequence[Mapping[str, Any]],
+        dependencies: Mapping[str, Iterable[str]] = {},
+    ) -> None:
+        """Build several HDL libraries, at the same time where they don't depend on each other.
+
+        Each element of *builds* holds the arguments to one call of :meth:`build`, including *hdl_library*.
+        A library is built after the libraries its VHDL sources use in ``library`` or ``use`` clauses,
+        and after the libraries listed for it in *dependencies*,
+        which is needed for Verilog sources since they aren't scanned.
+
+        .. code-block:: python
+
+            runner.build_libraries(
+                [
+                    {"hdl_library": "util", "sources": ["util.vhdl"]},
+                    {"hdl_library": "periph", "sources": ["periph.vhdl"]},
+                    {
+                        "hdl_library": "top",
+                        "sources": ["top.vhdl"],
+                        "hdl_toplevel": "top",
+                    },
+                ],
+            )
+
+        Up to :data:`MAX_PARALLEL_BUILD_JOBS` libraries are built at the same time with Questa, GHDL and NVC,
+        which keep each library separate in the build directory.
+        Other simulators, and builds using a *build_cache*, build the libraries one after another.
+        Afterwards, the runner is set up as if :meth:`build` was called for each element of *builds* in order.
+
+        Raises:
+            ValueError: A library is built twice, or libraries depend on each other in a cycle.
+
+        .. versionadded:: 2.1
+        """
+        __tracebackhide__ = True  # Hide the traceback when using pytest
+
+        by_library: dict[str, dict[str, Any]] = {}
+        for kwargs in builds:
+            library = kwargs.get("hdl_library", "top")
+            if library in by_library:
+                raise ValueError(f"Library {library!r} is built more than once")
+            by_library[library] = dict(kwargs)
+        names = {library.lower(): library for library in by_library}
+
+        pending: dict[str, set[str]] = {}
+        for library, kwargs in by_library.items():
+            vhdl_sources: list[Path] = []
+            for source in chain(
+                kwargs.get("sources", ()), kwargs.get("vhdl_sources", ())
+            ):
+                if isinstance(source, VHDL):
+                    vhdl_sources.append(get_abs_path(source.value))
+                elif not isinstance(source, _Tag) and (
+                    Path(source).suffix in _vhdl_extensions
+                ):
+                    vhdl_sources.append(get_abs_path(source))
+            used = cocotb_tools._dependencies.scan_libraries(vhdl_sources)
+            pending[library] = {names[name] for name in used if name in names}
+            pending[library].update(
+                dependency
+                for dependency in dependencies.get(library, ())
+                if dependency in by_library
+            )
+            pending[library].discard(library)
+
+            # Cleaning the build directory must not remove libraries built before.
+            if kwargs.pop("clean", False):
+                self.rm_build_folder(get_abs_path(kwargs.get("build_dir", "sim_build")))
+                kwargs["always"] = True
+
+        # Builds stored in a cache must only hold the files of their own library.
+        parallel = (
+            self._parallel_library_builds
+            and not _env.get_str("COCOTB_BUILD_CACHE")
+            and not any(kwargs.get("build_cache") for kwargs in by_library.values())
+        )
+
+        def build(library: str) -> Runner:
+            runner = copy.copy(self)
+            runner.env = dict(self.env)
+            runner.build(**by_library[library])
+            return runner
+
+        runners: dict[str, Runner] = {}
+        running: dict[Future[Runner], str] = {}
+        error: BaseException | None = None
+        max_workers = _get_max_parallel_build_jobs() if parallel else 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                if error is None:
+                    for library in [
+                        library
+                        for library, deps in pending.items()
+                        if deps <= runners.keys()
+                    ]:
+                        del pending[library]
+                        running[executor.submit(build, library)] = library
+                if not running:
+                    if error is None:
+                        raise ValueError(
+                            f"Libraries {', '.join(map(repr, pending))} depend on each other"
+                        )
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    library = running.pop(future)
+                    try:
+                        runners[library] = future.result()
+                    except BaseException as e:  # noqa: BLE001
+                        # Finish the builds already running, but start no more.
+                        if error is None:
+                            error = e
+                        for other in running:
+                            other.cancel()
+        if error is not None:
+            raise error
+
+        if builds:
+            last = runners[builds[-1].get("hdl_library", "top")]
+            self.__dict__.update(vars(last))
 
     def test(
         self,
@@ -494,6 +816,10 @@ class Runner(ABC):
         timescale: tuple[str, str] | None = None,
         log_file: PathLike | None = None,
         test_filter: str | None = None,
+        hierarchy_index: bool = False,
+        discovery_cache: bool = False,
+        shards: int = 1,
+        reuse_simulator: bool = False,
     ) -> Path:
         """Run the tests.
 
@@ -530,10 +856,51 @@ class Runner(ABC):
             log_file: File to write the test log to.
             test_filter: Regular expression which matches test names.
                 Only matched tests are run if this argument if given.
+            hierarchy_index: Save the design hierarchy discovered by the tests in *build_dir*
+                and reuse it in later runs until the next :meth:`build`.
+                Each combination of *parameters*, *elab_args*, *test_args* and the other arguments which
+                change how the design is elaborated has its own index.
+                See :envvar:`COCOTB_HIERARCHY_INDEX`.
+            discovery_cache: Save the names of the tests in each test module in *build_dir*,
+                so later runs with *test_filter* or *testcase* don't import modules without a matching test,
+                and only generate the matching parametrized tests.
+                See :envvar:`COCOTB_DISCOVERY_CACHE`.
+            shards: Split the tests across this many simulator processes running at the same time.
+                Each process runs the next test no other process has claimed,
+                taking the tests which took longest in the previous run first, see :envvar:`COCOTB_TEST_QUEUE`.
+                All processes use the same random seed, so each test gets the same seed as when run unsharded,
+                and their results are merged into one results file.
+                Stages only order the tests within each process.
+                The previous results file is kept with the suffix ``.previous`` to order the next run.
+                If *log_file* is given, each process writes its own log file next to it.
+                Each process runs in its own subdirectory ``shard<N>`` of *test_dir*,
+                so the files simulators write to the directory they run in are kept apart.
+                Can't be used with *waves* or *gui*,
+                or with Questa, GHDL, Riviera-PRO and Active-HDL, which find the design in the directory the tests run in.
+            reuse_simulator: Keep the simulator process running after the tests finish,
+                and run the tests of later calls with the same commands and environment in it,
+                which only differ in *test_module*, *testcase*, *test_filter* and *results_xml*,
+                instead of starting and elaborating the design again.
+                The tests of later calls start at the simulation time the previous tests ended at,
+                run in the *test_dir* of the first call, and write to its *log_file*.
+                The processes are finished when Python exits.
+                Can't be used with *waves*, *gui* or *shards*.
 
         Returns:
             The absolute location of the results XML file which can be
             defined by the *results_xml* argument.
+
+        .. versionchanged:: 2.1
+            Added the *hierarchy_index* argument.
+
+        .. versionchanged:: 2.1
+            Added the *discovery_cache* argument.
+
+        .. versionchanged:: 2.1
+            Added the *shards* argument.
+
+        .. versionchanged:: 2.1
+            Added the *reuse_simulator* argument.
         """
         __tracebackhide__ = True  # Hide the traceback when using pytest
 
@@ -589,11 +956,51 @@ class Runner(ABC):
         if seed is not None:
             self.env["COCOTB_RANDOM_SEED"] = str(seed)
 
+        if hierarchy_index:
+            # Parameters and arguments may change the hierarchy elaborated from the build.
+            elaboration = repr(
+                (
+                    self.sim_hdl_toplevel,
+                    self.hdl_toplevel_library,
+                    self.gpi_interfaces,
+                    sorted(
+                        (str(name), repr(value))
+                        for name, value in self.parameters.items()
+                    ),
+                    self.elab_args,
+                    self.test_args,
+                    timescale,
+                )
+            )
+            digest = hashlib.sha256(elaboration.encode()).hexdigest()[:16]
+            self.env["COCOTB_HIERARCHY_INDEX"] = str(
+                self.build_dir / _hierarchy_index_files.replace("*", digest)
+            )
+
+        if discovery_cache:
+            self.env["COCOTB_DISCOVERY_CACHE"] = str(
+                self.build_dir / _discovery_cache_file
+            )
+
         self.log_file = log_file
         self.waves = _env.get_bool("WAVES", waves)
         self.gui = _env.get_bool("GUI", gui)
         self.timescale = timescale
 
+        if shards > 1 and (self.waves or self.gui):
+            raise ValueError("waves and gui can't be used with more than one shard")
+
+        if shards > 1 and self._design_in_test_dir:
+            raise ValueError(
+                f"{type(self).__qualname__} can't run more than one shard, "
+                "since it finds the design in the directory the tests run in"
+            )
+
+        if reuse_simulator and (self.waves or self.gui or shards > 1):
+            raise ValueError(
+                "reuse_simulator can't be used with waves, gui or more than one shard"
+            )
+
         waves_file: str | None = self._waves_file() if self.waves else None
 
         if "COCOTB_RESULTS_ATTACHMENTS" not in self.env:
@@ -644,8 +1051,15 @@ class Runner(ABC):
         else:
             results_xml_file = self.test_dir / "results.xml"
 
+        previous_results_file = results_xml_file.with_name(
+            f"{results_xml_file.stem}.previous{results_xml_file.suffix}"
+        )
         with suppress(OSError):
-            results_xml_file.unlink()
+            if shards > 1:
+                # the durations of the tests decide which tests are claimed first
+                results_xml_file.replace(previous_results_file)
+            else:
+                results_xml_file.unlink()
 
         # transport the settings to cocotb via environment variables
         self._set_env_test()
@@ -654,7 +1068,14 @@ class Runner(ABC):
         cmds: Sequence[_Command] = self._test_command()
         simulator_exit_code: int = 0
         try:
-            self._execute(cmds, cwd=self.test_dir)
+            if shards > 1:
+                self._execute_shards(
+                    cmds, shards, results_xml_file, previous_results_file
+                )
+            elif reuse_simulator:
+                self._execute_reused(cmds)
+            else:
+                self._execute(cmds, cwd=self.test_dir)
         except subprocess.CalledProcessError as e:
             # It is possible for the simulator to fail but still leave results.
             self.log.error("Simulation failed: %d", e.returncode)
@@ -725,26 +1146,193 @@ class Runner(ABC):
             with open(self.log_file, "w") as f:
                 self._execute_cmds(cmds, cwd, f)
 
+    def _execute_shards(
+        self,
+        cmds: Sequence[_Command],
+        shards: int,
+        results_xml_file: Path,
+        previous_results_file: Path,
+    ) -> None:
+        """Run *cmds* in *shards* processes at the same time, sharing the tests between them."""
+        __tracebackhide__ = True  # Hide the traceback when using PyTest.
+
+        # Every shard must seed its tests like a single process would.
+        if "COCOTB_RANDOM_SEED" not in self.env:
+            self.env["COCOTB_RANDOM_SEED"] = str(int(time.time()))
+
+        # Processes claim tests by creating files in this directory.
+        queue_dir = results_xml_file.with_name(f"{results_xml_file.stem}.queue")
+        shutil.rmtree(queue_dir, ignore_errors=True)
+        queue_dir.mkdir(parents=True)
+
+        results_files: list[Path] = []
+
+        def run_shard(index: int) -> None:
+            # Simulators write files with fixed names, like logs and coverage, to the directory they run in.
+            shard_dir = self.test_dir / f"shard{index}"
+            shard_dir.mkdir(exist_ok=True)
+            env = dict(self.env)
+            # Test modules in the test directory can still be imported.
+            env["PYTHONPATH"] = os.pathsep.join(
+                [str(self.test_dir), *filter(None, [env.get("PYTHONPATH")])]
+            )
+            env["COCOTB_TEST_QUEUE"] = str(queue_dir)
+            if "COCOTB_TEST_DURATIONS" not in env and previous_results_file.is_file():
+                env["COCOTB_TEST_DURATIONS"] = str(previous_results_file)
+            env["COCOTB_RESULTS_FILE"] = str(results_files[index])
+            if self.log_file is None:
+                self._execute_cmds(cmds, shard_dir, env=env)
+            else:
+                log_file = Path(self.log_file)
+                log_file = log_file.with_name(
+                    f"{log_file.stem}.shard{index}{log_file.suffix}"
+                )
+                with open(log_file, "w") as f:
+                    self._execute_cmds(cmds, shard_dir, f, env=env)
+
+        for index in range(shards):
+            results_file = results_xml_file.with_name(
+                f"{results_xml_file.stem}.shard{index}{results_xml_file.suffix}"
+            )
+            with suppress(OSError):
+                results_file.unlink()
+            results_files.append(results_file)
+
+        with ThreadPoolExecutor(max_workers=shards) as executor:
+            futures = [executor.submit(run_shard, index) for index in range(shards)]
+        shutil.rmtree(queue_dir, ignore_errors=True)
+
+        _merge_results(
+            (results_file for results_file in results_files if results_file.is_file()),
+            results_xml_file,
+        )
+        for results_file in results_files:
+            with suppress(OSError):
+                results_file.unlink()
+
+        for future in futures:
+            future.result()
+
+    def _execute_reused(self, cmds: Sequence[_Command]) -> None:
+        """Run the tests in the simulator process an earlier call started with the same commands and environment,
+        or start one which is kept running for later calls."""
+        __tracebackhide__ = True  # Hide the traceback when using PyTest.
+
+        key = (
+            tuple(map(tuple, cmds)),
+            frozenset(
+                (name, value)
+                for name, value in self.env.items()
+                if name not in _worker_env
+            ),
+        )
+        worker = _simulator_workers.get(key)
+        env: dict[str, str | None] | None = None
+        if worker is None:
+            # The first tests are given in the environment of the new process.
+            worker = _SimulatorWorker(
+                self, cmds, self.test_dir, self.env, self.log_file
+            )
+            _simulator_workers[key] = worker
+        else:
+            env = {name: self.env.get(name) for name in _worker_env}
+
+        try:
+            running = worker.wait(env)
+        except BaseException:
+            del _simulator_workers[key]
+            raise
+        if not running:
+            del _simulator_workers[key]
+
     def _execute_cmds(
-        self, cmds: Sequence[_Command], cwd: PathLike, stdout: TextIO | None = None
+        self,
+        cmds: Sequence[_Command],
+        cwd: PathLike,
+        stdout: TextIO | None = None,
+        env: Mapping[str, str] | None = None,
     ) -> None:
         __tracebackhide__ = True  # Hide the traceback when using PyTest.
 
         for cmd in cmds:
             self.log.info("Running command %s in directory %s", _shlex_join(cmd), cwd)
 
-            # TODO: create a thread to handle stderr and log as error?
-            # TODO: log forwarding
-
-            stderr = None if stdout is None else subprocess.STDOUT
-            result = subprocess.run(
-                cmd, cwd=cwd, env=self.env, check=False, stdout=stdout, stderr=stderr
-            )
-            if result.returncode != 0:
+            if stdout is None and self.output_filter is None:
+                # The simulator writes to the terminal itself, so its output isn't buffered,
+                # colored logs stay colored and prompts from a debugger show up.
+                process = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    env=self.env if env is None else env,
+                    check=False,
+                )
+                if process.returncode != 0:
+                    raise RuntimeError(
+                        f"Command failed with return code: {process.returncode}"
+                    )
+                continue
+
+            # Output is read line by line as it is written, so it is never held in memory.
+            # Both streams go through one pipe, so lines stay in the order they were written.
+            error_lines: list[str] = []
+            with subprocess.Popen(
+                cmd,
+                cwd=cwd,
+                env=self.env if env is None else env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+            ) as process:
+                assert process.stdout is not None
+                try:
+                    self._forward_output(
+                        process.stdout, stdout or sys.stdout, error_lines
+                    )
+                except BaseException:
+                    process.kill()
+                    raise
+            if process.returncode != 0:
                 raise RuntimeError(
-                    f"Command failed with return code: {result.returncode}"
+                    "\n".join(
+                        [
+                            f"Command failed with return code: {process.returncode}",
+                            *error_lines,
+                        ]
+                    )
                 )
 
+    def _forward_output(
+        self,
+        pipe: IO[str],
+        file: TextIO,
+        error_lines: list[str],
+    ) -> None:
+        """Write the lines read from *pipe* to *file*, and collect the first lines reporting errors in *error_lines*.
+
+        If *file* is a log file rather than the terminal, error lines are also logged,
+        and all lines are logged at debug level.
+        """
+        to_log_file = file is not sys.stdout
+        output_log = self.log.getChild("output")
+        debug = to_log_file and output_log.isEnabledFor(logging.DEBUG)
+        for line in pipe:
+            if self._error_re is not None and self._error_re.search(line):
+                if len(error_lines) < _MAX_ERROR_LINES:
+                    error_lines.append(line.rstrip())
+                if to_log_file:
+                    output_log.error("%s", line.rstrip())
+            elif debug:
+                output_log.debug("%s", line.rstrip())
+
+            output = line if self.output_filter is None else self.output_filter(line)
+            if output is None:
+                continue
+
+            file.write(output)
+            if not to_log_file:
+                file.flush()
+
     def rm_build_folder(self, build_dir: Path) -> None:
         if build_dir.is_dir():
             self.log.info("Removing: %s", build_dir)
@@ -890,6 +1478,118 @@ def get_abs_path(path: PathLike) -> Path:
         return Path(Path.cwd() / path).resolve()
 
 
+_worker_env = frozenset(
+    (
+        "COCOTB_TEST_MODULES",
+        "COCOTB_TEST_FILTER",
+        "COCOTB_RESULTS_FILE",
+        "COCOTB_RESULTS_ATTACHMENTS",
+        "COCOTB_PYTEST_NODEID",
+        "COCOTB_PYTEST_KEYWORDS",
+        "PYTEST_CURRENT_TEST",
+    )
+)
+"""Environment variables which may differ between the tests run by one reused simulator process."""
+
+
+class _SimulatorWorker:
+    """A simulator process which keeps running to run the tests of later :meth:`Runner.test` calls.
+
+    See :mod:`cocotb._worker` for the simulator side.
+    """
+
+    def __init__(
+        self,
+        runner: Runner,
+        cmds: Sequence[_Command],
+        cwd: Path,
+        env: Mapping[str, str],
+        log_file: PathLike | None,
+    ) -> None:
+        self._listener = Listener()
+        self._connection: Connection | None = None
+        self._error: BaseException | None = None
+        env = dict(env)
+        env["COCOTB_WORKER_ADDRESS"] = str(self._listener.address)
+        self._thread = threading.Thread(
+            target=self._run, args=(runner, cmds, cwd, env, log_file), daemon=True
+        )
+        self._thread.start()
+
+    def _run(
+        self,
+        runner: Runner,
+        cmds: Sequence[_Command],
+        cwd: Path,
+        env: Mapping[str, str],
+        log_file: PathLike | None,
+    ) -> None:
+        try:
+            if log_file is None:
+                runner._execute_cmds(cmds, cwd, env=env)
+            else:
+                with open(log_file, "w") as f:
+                    runner._execute_cmds(cmds, cwd, f, env=env)
+        except BaseException as e:  # noqa: BLE001
+            self._error = e
+        finally:
+            if self._connection is None:
+                # Wake up wait() if the simulator exited before connecting.
+                with suppress(OSError), Client(self._listener.address):
+                    pass
+
+    def wait(self, env: Mapping[str, str | None] | None = None) -> bool:
+        """Send the environment variables *env* of the next tests, if any, and wait until the tests finished.
+
+        Returns:
+            ``False`` if the simulator exited instead.
+
+        Raises:
+            RuntimeError: The simulator failed.
+        """
+        try:
+            if self._connection is None:
+                self._connection = self._listener.accept()
+            if env is not None:
+                self._connection.send(dict(env))
+            self._connection.recv()
+        except (OSError, EOFError):
+            self.close()
+            if self._error is not None:
+                raise self._error from None
+            return False
+        except BaseException:
+            # Let the simulator finish after these tests instead of waiting for more.
+            if self._connection is not None:
+                self._connection.close()
+            self._listener.close()
+            raise
+        return True
+
+    def close(self) -> None:
+        """Let the simulator finish, and wait for it to exit."""
+        if self._connection is not None:
+            with suppress(OSError):
+                self._connection.send(None)
+            self._connection.close()
+        self._thread.join()
+        self._listener.close()
+
+
+_simulator_workers: dict[tuple[object, ...], _SimulatorWorker] = {}
+"""Simulator processes kept running by :meth:`Runner.test` with *reuse_simulator*, by what they were started with."""
+
+
+def _stop_simulators() -> None:
+    """Let the simulator processes kept running by :meth:`Runner.test` finish."""
+    while _simulator_workers:
+        _, worker = _simulator_workers.popitem()
+        worker.close()
+
+
+atexit.register(_stop_simulators)
+
+
 class Icarus(Runner):
     """Implementation of :class:`Runner` for Icarus Verilog.
 
@@ -903,6 +1603,10 @@ class Icarus(Runner):
 
     supported_gpi_interfaces: ClassVar[dict[str, list[str]]] = {"verilog": ["vpi"]}
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"(?:^|: )(?:error|syntax error|ERROR)\b"
+    )
+
     def _simulator_in_path(self) -> None:
         if shutil.which("iverilog") is None:
             raise SystemExit("ERROR: iverilog executable not found!")
@@ -989,7 +1693,7 @@ class Icarus(Runner):
             build_args += ["-f", str(self.cmds_file)]
 
         cmds: list[_Command] = []
-        if outdated(self.sim_file, (source.value for source in sources)) or self.always:
+        if self._outdated(self.sim_file, sources):
             cmds = [
                 [
                     "iverilog",
@@ -1054,6 +1758,14 @@ class Questa(Runner):
         "vhdl": ["fli", "vhpi"],
     }
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"^(?:# )?\*\* (?:Error|Fatal)"
+    )
+
+    _parallel_library_builds: ClassVar[bool] = True
+
+    _design_in_test_dir: ClassVar[bool] = True
+
     def _simulator_in_path(self) -> None:
         if shutil.which("vsim") is None:
             raise SystemExit("ERROR: vsim executable not found!")
@@ -1070,6 +1782,16 @@ class Questa(Runner):
     def _build_command(self) -> list[_Command]:
         cmds = []
 
+        # Each library is only compiled again if its sources, the libraries they use,
+        # or the options it is compiled with changed.
+        sources = list(chain(self._sources, self._vhdl_sources, self._verilog_sources))
+        stamp = self._build_stamp()
+        if not self._outdated(stamp, sources) and cocotb_tools._build_cache.read_key(
+            stamp
+        ) == cocotb_tools._build_cache.commands_key(self._all_build_commands()):
+            self.log.warning("Skipping compilation of library %s", self.hdl_library)
+            return cmds
+
         cmds.append(["vlib", self.hdl_library])
 
         verbosity_opts = []
@@ -1084,7 +1806,7 @@ class Questa(Runner):
         defines = self._get_define_options(self.defines)
         includes = self._get_include_options(self.includes)
 
-        for source in chain(self._sources, self._vhdl_sources, self._verilog_sources):
+        for source in sources:
             if source.tag is VHDL:
                 cmds.append(
                     [
@@ -1212,6 +1934,10 @@ class QuestaQIS(Runner):
         "vhdl": ["fli", "vhpi"],
     }
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"^(?:# )?\*\* (?:Error|Fatal)"
+    )
+
     def _simulator_in_path(self) -> None:
         if shutil.which("qrun") is None:
             raise SystemExit("ERROR: qrun executable not found!")
@@ -1411,6 +2137,12 @@ class Ghdl(Runner):
 
     supported_gpi_interfaces: ClassVar[dict[str, list[str]]] = {"vhdl": ["vpi"]}
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(r"(?:^|:)\s*error:")
+
+    _parallel_library_builds: ClassVar[bool] = True
+
+    _design_in_test_dir: ClassVar[bool] = True
+
     def _set_env_test(self) -> None:
         super()._set_env_test()
         if "COCOTB_TRUST_INERTIAL_WRITES" not in self.env:
@@ -1542,6 +2274,12 @@ class Nvc(Runner):
 
     supported_gpi_interfaces: ClassVar[dict[str, list[str]]] = {"vhdl": ["vhpi"]}
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"^\*\* (?:Error|Fatal|Failure)"
+    )
+
+    _parallel_library_builds: ClassVar[bool] = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -1649,6 +2387,12 @@ class AldecBase(Runner):
         "vhdl": ["vhpi"],
     }
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"^(?:# )?(?:\w+: )?(?:Fatal )?Error:"
+    )
+
+    _design_in_test_dir: ClassVar[bool] = True
+
     def _simulator_in_path(self) -> None:
         if shutil.which("vsimsa") is None:
             raise SystemExit("ERROR: vsimsa executable not found!")
@@ -1669,7 +2413,7 @@ class AldecBase(Runner):
 
         sources = self._sources + self._vhdl_sources + self._verilog_sources
 
-        if outdated(out_file, (source.value for source in sources)) or self.always:
+        if self._outdated(out_file, sources):
             vhdl_args = [
                 arg.value for arg in self._build_args if arg.tag in (VHDL, None)
             ]
@@ -1872,10 +2616,45 @@ class Verilator(Runner):
 
        * ``waves=True`` *must* be given to :meth:`~Runner.build` if either ``waves`` or ``gui`` are to be used during :meth:`~Runner.test`.
        * Does not support the ``pre_cmd`` argument to :meth:`~Runner.test`.
+       * Takes the additional *threads*, *hierarchical* and *build_jobs* arguments to :meth:`build`
+         to build a multithreaded model, see :ref:`sim-verilator-threads`.
     """
 
     supported_gpi_interfaces: ClassVar[dict[str, list[str]]] = {"verilog": ["vpi"]}
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(
+        r"^%(?:Error|Fatal)|\berror:|^make: \*\*\*"
+    )
+
+    def build(
+        self,
+        *args: Any,
+        threads: int | None = None,
+        hierarchical: bool = False,
+        build_jobs: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Build the HDL sources.
+
+        Takes the arguments of :meth:`.Runner.build`, and the following.
+
+        Args:
+            threads: Number of threads the model evaluates the design with, passed to Verilator's ``--threads``.
+            hierarchical: Verilate the modules marked with a ``hier_block`` comment or control file entry separately,
+                passed to Verilator as ``--hierarchical``.
+            build_jobs: Number of jobs verilating and compiling the model at the same time, passed to Verilator's ``--build-jobs``.
+                By default the C++ compiler runs as many jobs as :data:`MAX_PARALLEL_BUILD_JOBS` allows.
+
+        .. versionchanged:: 2.1
+            Added the *threads*, *hierarchical* and *build_jobs* arguments.
+        """
+        __tracebackhide__ = True  # Hide the traceback when using pytest
+
+        self._threads = threads
+        self._hierarchical = hierarchical
+        self._build_jobs = build_jobs
+        super().build(*args, **kwargs)
+
     def _set_env_test(self) -> None:
         super()._set_env_test()
         if "COCOTB_TRUST_INERTIAL_WRITES" not in self.env:
@@ -1955,7 +2734,20 @@ class Verilator(Runner):
                 f"-Wl,-rpath,{cocotb_tools.config.libs_dir} -L{cocotb_tools.config.libs_dir} -lcocotbvpi_verilator",
             ]
             + (["--trace"] if self.waves else [])
+            + (["--threads", str(self._threads)] if self._threads is not None else [])
+            + (["--hierarchical"] if self._hierarchical else [])
+            + (
+                ["--build-jobs", str(self._build_jobs)]
+                if self._build_jobs is not None
+                else []
+            )
             + [arg.value for arg in self._build_args]
+            # lets verilator.cpp save and restore the state of the model
+            + (
+                ["-CFLAGS", "-DCOCOTB_VERILATOR_SAVABLE"]
+                if any(arg.value == "--savable" for arg in self._build_args)
+                else []
+            )
             + (
                 ["--timescale", "{}/{}".format(*self.timescale)]
                 if self.timescale is not None
@@ -1968,15 +2760,17 @@ class Verilator(Runner):
             + [str(source.value) for source in sources]
         )
 
+        build_jobs = self._build_jobs or _get_max_parallel_build_jobs()
         cmds.append(
             [
                 "make",
                 "-j",
-                f"{_get_max_parallel_build_jobs()}",
+                f"{build_jobs}",
                 "-C",
                 str(self.build_dir),
                 "-f",
-                "Vtop.mk",
+                # a hierarchical build verilates the hierarchical blocks first
+                "Vtop_hier.mk" if self._hierarchical else "Vtop.mk",
                 f"VM_TRACE={int(self.waves)}",
             ]
         )
@@ -2013,6 +2807,8 @@ class Xcelium(Runner):
         "vhdl": ["vhpi"],
     }
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(r"\*[EF],\w+")
+
     def _simulator_in_path(self) -> None:
         if shutil.which("xrun") is None:
             raise SystemExit("ERROR: xrun executable not found!")
@@ -2185,6 +2981,8 @@ class Vcs(Runner):
 
     supported_gpi_interfaces: ClassVar[dict[str, list[str]]] = {"verilog": ["vpi"]}
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(r"^(?:Error|Fatal)-\[")
+
     def _simulator_in_path(self) -> None:
         if shutil.which("vcs") is None:
             raise SystemExit("ERROR: vcs executable not found!")
@@ -2233,7 +3031,7 @@ class Vcs(Runner):
             if source.tag not in (VHDL, Verilog):
                 raise ValueError(f"Unsupported file type: {source.value}")
 
-        if outdated(self.sim_file, (source.value for source in sources)) or self.always:
+        if self._outdated(self.sim_file, sources):
             cmds = [
                 ["vcs"]
                 + self._build_opts
@@ -2285,6 +3083,8 @@ class Dsim(Runner):
 
     supported_gpi_interfaces: ClassVar[dict[str, list[str]]] = {"verilog": ["vpi"]}
 
+    _error_re: ClassVar[re.Pattern[str] | None] = re.compile(r"=[EF]:")
+
     def _simulator_in_path(self) -> None:
         if shutil.which("dsim") is None:
             raise SystemExit("ERROR: dsim executable not found!")
@@ -2350,7 +3150,7 @@ class Dsim(Runner):
                 )
 
         cmds: list[_Command] = []
-        if outdated(self.sim_file, (source.value for source in sources)) or self.always:
+        if self._outdated(self.sim_file, sources):
             cmds = [
                 [
                     *self._get_sim_cmd_prefix(),
@@ -0,0 +1,27 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+def import_in_new_interpreter(modules: str) -> None:
+    # Each import has to happen in a fresh interpreter, since modules are cached.
+    subprocess.run([sys.executable, "-c", f"import {modules}"], check=True)
+
+
+@pytest.mark.parametrize(
+    "modules",
+    [
+        # what tools like the runner and cocotb-config import
+        "cocotb",
+        # what is imported when a simulation starts, before the test modules
+        "cocotb._init, cocotb.regression",
+    ],
+)
+def test_import_time(benchmark, modules: str) -> None:
+    benchmark(import_in_new_interpreter, modules)
@@ -10,3 +10,9 @@ import cocotb
 @cocotb.parametrize(a=range(50), b=range(50), c=range(50))
 async def parametrize(dut, a, b, c):
     pass
+
+
+@cocotb.test(sample=10)
+@cocotb.parametrize(a=range(50), b=range(50), c=range(50))
+async def parametrize_sampled(dut, a, b, c):
+    pass
@@ -11,7 +11,7 @@ from cocotb_tools.runner import get_runner
 THIS_DIR = Path(__file__).resolve().parent
 
 
-def test_parameterize_perf_icarus(benchmark) -> None:
+def build_and_run(benchmark, test_filter: str) -> None:
     if str(THIS_DIR) not in sys.path:
         sys.path.append(str(THIS_DIR))
 
@@ -28,5 +28,13 @@ def test_parameterize_perf_icarus(benchmark) -> None:
         runner.test(
             hdl_toplevel="parametrize_perf_top",
             test_module="parametrize_performance_tests",
-            test_filter="parametrize/a=49/b=49/c=49",
+            test_filter=test_filter,
         )
+
+
+def test_parameterize_perf_icarus(benchmark) -> None:
+    build_and_run(benchmark, "parametrize/a=49/b=49/c=49")
+
+
+def test_parameterize_sample_perf_icarus(benchmark) -> None:
+    build_and_run(benchmark, "parametrize_sampled")
@@ -0,0 +1,99 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for the cache of build directories."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from cocotb_tools._build_cache import (
+    BuildCache,
+    build_key,
+    changed,
+    commands_key,
+    read_files,
+    snapshot,
+    write_files,
+)
+
+
+def test_build_key(tmp_path: Path) -> None:
+    source = tmp_path / "top.sv"
+    source.write_text("module top; endmodule\n")
+    cmds = [["iverilog", "-o", "sim.vvp", str(source)]]
+
+    key = build_key(cmds, [source])
+    assert build_key(cmds, [source]) == key
+    assert build_key([[*cmds[0], "-DX=1"]], [source]) != key
+
+    source.write_text("module top(); endmodule\n")
+    assert build_key(cmds, [source]) != key
+
+
+def test_commands_key() -> None:
+    cmds = [["vlib", "top"], ["vlog", "-work", "top", "top.sv"]]
+    assert commands_key(cmds) == commands_key([list(cmd) for cmd in cmds])
+    assert commands_key([*cmds[:1], ["vlog", "+define+X=1", *cmds[1][1:]]]) != (
+        commands_key(cmds)
+    )
+
+
+def test_build_cache(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache")
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    (build_dir / "sim.vvp").write_text("built")
+    (build_dir / "index.json").write_text("{}")
+
+    assert not cache.restore("key", build_dir)
+    cache.store("key", build_dir, ignore=("index.json",))
+    cache.store("key", build_dir)
+
+    other = tmp_path / "other"
+    assert cache.restore("key", other)
+    assert sorted(path.name for path in other.iterdir()) == ["sim.vvp"]
+    assert (other / "sim.vvp").read_text() == "built"
+    assert [path.name for path in cache.path.iterdir()] == ["key"]
+
+
+def test_build_cache_changed_files(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache")
+    build_dir = tmp_path / "build"
+    (build_dir / "other_lib").mkdir(parents=True)
+    (build_dir / "other_lib" / "_info").write_text("other")
+    before = snapshot(build_dir)
+    (build_dir / "lib").mkdir()
+    (build_dir / "lib" / "_info").write_text("lib")
+
+    cache.store("key", build_dir, changed(build_dir, before))
+
+    (build_dir / "other_lib" / "_info").write_text("rebuilt")
+    assert cache.restore("key", build_dir)
+    assert (build_dir / "other_lib" / "_info").read_text() == "rebuilt"
+    assert [path.as_posix() for path in snapshot(cache.path / "key")] == ["lib/_info"]
+
+
+def test_build_cache_incremental(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache")
+    build_dir = tmp_path / "build"
+    (build_dir / "lib").mkdir(parents=True)
+    (build_dir / "lib" / "unit_a.o").write_text("a")
+    (build_dir / "lib" / "unit_b.o").write_text("b")
+    library_files = changed(build_dir, {})
+    write_files(tmp_path / "files", library_files)
+
+    # An incremental build only rewrites the unit which changed.
+    before = snapshot(build_dir)
+    (build_dir / "lib" / "unit_a.o").write_text("a2")
+    library_files = read_files(tmp_path / "files") or set()
+    library_files |= changed(build_dir, before)
+    cache.store("key", build_dir, library_files)
+
+    other = tmp_path / "other"
+    assert cache.restore("key", other)
+    assert sorted(path.as_posix() for path in snapshot(other)) == [
+        "lib/unit_a.o",
+        "lib/unit_b.o",
+    ]
+    assert read_files(tmp_path / "missing") is None
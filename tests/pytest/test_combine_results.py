@@ -0,0 +1,41 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for merging the results of sharded simulator processes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from cocotb._xunit_reporter import XUnitReporter
+from cocotb_tools.check_results import get_results
+from cocotb_tools.combine_results import _merge_results
+
+
+def test_merge_results(tmp_path: Path) -> None:
+    shard0 = XUnitReporter()
+    shard0.add_testcase("test_reset", "test_mod", "passed", time=1)
+    shard0.add_testcase("test_a", "test_mod", "passed", time=2)
+    shard0.add_testcase("test_c", "test_mod", "failed", time=3)
+    shard0.write(tmp_path / "results.shard0.xml")
+
+    shard1 = XUnitReporter()
+    shard1.add_testcase("test_reset", "test_mod", "passed", time=1)
+    shard1.add_testcase("test_b", "test_mod", "skipped")
+    shard1.add_testcase("test_d", "other_mod", "error", time=4)
+    shard1.write(tmp_path / "results.shard1.xml")
+
+    merged = tmp_path / "results.xml"
+    _merge_results(sorted(tmp_path.glob("results.shard*.xml")), merged)
+
+    # the test run by both shards is only counted once
+    assert get_results(merged) == (5, 2)
+    text = merged.read_text()
+    assert text.count('name="test_reset"') == 1
+    assert 'time="6.000"' in text
+
+
+def test_merge_no_results(tmp_path: Path) -> None:
+    merged = tmp_path / "results.xml"
+    _merge_results([], merged)
+    assert not merged.exists()
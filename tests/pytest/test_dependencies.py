@@ -0,0 +1,42 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for finding the files and libraries HDL sources depend on."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from cocotb_tools._dependencies import scan_includes, scan_libraries
+
+
+def test_scan_includes(tmp_path: Path) -> None:
+    include_dir = tmp_path / "include"
+    include_dir.mkdir()
+    top = tmp_path / "top.sv"
+    top.write_text(
+        '`include "local.svh"\n`include "defs.svh"\n`include "uvm_macros.svh"\n'
+    )
+    (tmp_path / "local.svh").write_text("")
+    (include_dir / "defs.svh").write_text('`include "more.svh"\n')
+    (include_dir / "more.svh").write_text('`include "defs.svh"\n')
+
+    assert sorted(scan_includes([top], [include_dir])) == [
+        include_dir / "defs.svh",
+        include_dir / "more.svh",
+        tmp_path / "local.svh",
+    ]
+
+
+def test_scan_libraries(tmp_path: Path) -> None:
+    top = tmp_path / "top.vhd"
+    top.write_text(
+        "library IEEE, Lib_A;\n"
+        "use ieee.std_logic_1164.all;\n"
+        "use lib_a.pkg.all;\n"
+        "  USE lib_b.other_pkg.all;\n"
+        "use work.local_pkg.all;\n"
+        "entity top is end entity;\n"
+    )
+
+    assert scan_libraries([top, tmp_path / "missing.vhd"]) == {"lib_a", "lib_b"}
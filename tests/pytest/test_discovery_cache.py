@@ -0,0 +1,145 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for discovering only the tests which match the filters."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+import cocotb
+from cocotb._discovery_cache import DiscoveryCache
+from cocotb.regression import RegressionManager
+
+PARAMETRIZED = """
+import cocotb
+
+@cocotb.test
+@cocotb.parametrize(value=range({count}))
+async def test_value(dut, value):
+    pass
+
+@cocotb.test
+async def test_plain(dut):
+    pass
+"""
+
+OTHER = """
+import cocotb
+
+@cocotb.test
+async def test_other(dut):
+    pass
+"""
+
+SHARED = """
+import cocotb
+from discovery_helper import VALUES
+
+@cocotb.test
+@cocotb.parametrize(value=VALUES)
+async def test_shared(dut, value):
+    pass
+"""
+
+MODULES = (
+    "discovery_parametrized",
+    "discovery_other",
+    "discovery_shared_a",
+    "discovery_shared_b",
+    "discovery_helper",
+)
+
+
+@pytest.fixture
+def test_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "discovery_parametrized.py").write_text(PARAMETRIZED.format(count=100))
+    (tmp_path / "discovery_other.py").write_text(OTHER)
+    (tmp_path / "discovery_shared_a.py").write_text(SHARED)
+    (tmp_path / "discovery_shared_b.py").write_text(SHARED)
+    (tmp_path / "discovery_helper.py").write_text("VALUES = [1, 2]\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cocotb, "RANDOM_SEED", 0, raising=False)
+    monkeypatch.setenv("COCOTB_DISCOVERY_CACHE", str(tmp_path / "cache.json"))
+    yield tmp_path
+    for name in MODULES:
+        sys.modules.pop(name, None)
+
+
+def discover(*filters: str, modules: tuple[str, ...] | None = None) -> list[str]:
+    for name in MODULES:
+        sys.modules.pop(name, None)
+    manager = RegressionManager()
+    manager.add_filters(*filters)
+    manager.discover_tests(*(modules or ("discovery_parametrized", "discovery_other")))
+    return [test.fullname for test in manager._test_queue]
+
+
+def test_discovery_cache(test_modules: Path) -> None:
+    # the first run discovers every test to cache them
+    all_tests = discover(r"value=42$")
+    assert len(all_tests) == 102
+    cache = DiscoveryCache(test_modules / "cache.json")
+    cache.load()
+    cached = cache.get("discovery_parametrized")
+    assert cached is not None
+    assert cached[42].indexes == (42,)
+
+    # later runs only generate the matching test and don't import other modules
+    assert discover(r"value=42$") == ["discovery_parametrized.test_value/value=42"]
+    assert "discovery_other" not in sys.modules
+
+    # changing a module discovers every module again
+    (test_modules / "discovery_parametrized.py").write_text(
+        PARAMETRIZED.format(count=10)
+    )
+    cache = DiscoveryCache(test_modules / "cache.json")
+    cache.load()
+    assert cache.get("discovery_parametrized") is None
+    assert len(discover(r"value=42$")) == 12
+    assert discover(r"value=9$|test_other") == [
+        "discovery_parametrized.test_value/value=9",
+        "discovery_other.test_other",
+    ]
+
+
+def test_discovery_cache_shared_module(test_modules: Path) -> None:
+    modules = ("discovery_shared_a", "discovery_shared_b")
+    assert len(discover(r"value=1$", modules=modules)) == 4
+    assert discover(r"value=1$", modules=modules) == [
+        "discovery_shared_a.test_shared/value=1",
+        "discovery_shared_b.test_shared/value=1",
+    ]
+    assert discover(r"value=3$", modules=modules) == []
+
+    # a helper which the second module imports after the first one did
+    # still discovers both modules again when it changes
+    (test_modules / "discovery_helper.py").write_text("VALUES = [1, 2, 3]\n")
+    assert len(discover(r"value=3$", modules=modules)) == 6
+    assert discover(r"value=3$", modules=modules) == [
+        "discovery_shared_a.test_shared/value=3",
+        "discovery_shared_b.test_shared/value=3",
+    ]
+
+
+def test_discovery_filter_without_cache(
+    test_modules: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("COCOTB_DISCOVERY_CACHE")
+    assert discover(r"value=4") == [
+        "discovery_parametrized.test_value/value=4",
+        "discovery_parametrized.test_value/value=40",
+        "discovery_parametrized.test_value/value=41",
+        "discovery_parametrized.test_value/value=42",
+        "discovery_parametrized.test_value/value=43",
+        "discovery_parametrized.test_value/value=44",
+        "discovery_parametrized.test_value/value=45",
+        "discovery_parametrized.test_value/value=46",
+        "discovery_parametrized.test_value/value=47",
+        "discovery_parametrized.test_value/value=48",
+        "discovery_parametrized.test_value/value=49",
+    ]
+    assert not (test_modules / "cache.json").exists()
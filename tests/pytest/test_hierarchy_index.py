@@ -0,0 +1,83 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for the on-disk hierarchy index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import cocotb._hierarchy_index
+from cocotb._hierarchy_index import HierarchyIndex, IndexEntry
+
+KEY = {"toplevel": "top", "simulator": "sim", "version": "1.0"}
+
+ENTRIES = [
+    IndexEntry("clk", 16, "GPI_LOGIC", "", "", False, -1, -1, 0, 0),
+    IndexEntry("data", 17, "GPI_LOGIC_ARRAY", "logic", "top.sv", False, 7, 0, 2, 0),
+]
+
+
+def test_hierarchy_index_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+    index = HierarchyIndex(path, KEY)
+    index.load()
+    assert index.get("top") is None
+
+    index.add("top", ENTRIES)
+    index.save()
+
+    loaded = HierarchyIndex(path, KEY)
+    loaded.load()
+    assert loaded.get("top") == ENTRIES
+    assert loaded.get("top.sub") is None
+
+    # nothing is written if nothing was added
+    path.unlink()
+    loaded.save()
+    assert not path.exists()
+
+
+def test_hierarchy_index_other_build(tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+    index = HierarchyIndex(path, KEY)
+    index.add("top", ENTRIES)
+    index.save()
+
+    other = HierarchyIndex(path, {**KEY, "version": "2.0"})
+    other.load()
+    assert other.get("top") is None
+
+    path.write_text("not json")
+    broken = HierarchyIndex(path, KEY)
+    broken.load()
+    assert broken.get("top") is None
+
+
+def test_hierarchy_index_invalidate(tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+    index = HierarchyIndex(path, KEY)
+    index.add("top", ENTRIES)
+    index.save()
+
+    index.invalidate()
+    assert not path.exists()
+    assert index.get("top") is None
+    index.invalidate()
+
+
+def test_hierarchy_index_disable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "index.json"
+    index = HierarchyIndex(path, KEY)
+    index.add("top", ENTRIES)
+    index.save()
+    monkeypatch.setattr(cocotb._hierarchy_index, "_index", index)
+
+    cocotb._hierarchy_index.disable()
+    assert cocotb._hierarchy_index._index is None
+    assert not path.exists()
+    cocotb._hierarchy_index.disable()
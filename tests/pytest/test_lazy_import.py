@@ -0,0 +1,44 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests that importing cocotb doesn't import more than it needs."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def run_python(code: str) -> None:
+    # Modules are cached, so each check needs a fresh interpreter.
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_cocotb_is_lazy() -> None:
+    run_python(
+        "import sys, cocotb\n"
+        "for m in ('pytest', 'cocotb.handle', 'cocotb._decorators', 'importlib.metadata'):\n"
+        "    assert m not in sys.modules, m\n"
+    )
+
+
+def test_lazy_exports() -> None:
+    run_python(
+        "import cocotb\n"
+        "from cocotb import Sampler, start_soon, test\n"
+        "assert test.__module__ == 'cocotb'\n"
+        "assert Sampler.__module__ == 'cocotb'\n"
+        "assert cocotb.start_soon is start_soon\n"
+        "assert isinstance(cocotb.__version__, str)\n"
+        "assert {'test', 'drive_on', '__version__'} <= set(dir(cocotb))\n"
+        "try:\n"
+        "    cocotb.does_not_exist\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise AssertionError\n"
+    )
+
+
+def test_regression_does_not_import_pytest() -> None:
+    run_python("import sys, cocotb.regression\nassert 'pytest' not in sys.modules\n")
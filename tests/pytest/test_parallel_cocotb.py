@@ -61,3 +61,38 @@ def test_cocotb_parallel(seed):
         build_dir=sim_build,
         timescale=None if sim in ("xcelium",) else timescale,
     )
+
+
+def test_cocotb_shards():
+    runner = get_runner(sim)
+    if runner._design_in_test_dir:
+        with pytest.raises(ValueError):
+            runner.test(
+                shards=2,
+                hdl_toplevel=hdl_toplevel,
+                test_module=module_name,
+                build_dir=sim_build,
+            )
+        return
+
+    runner.build_args = compile_args
+    runner.sources = sources
+    runner.verilog_sources = []
+    runner.vhdl_sources = []
+
+    results_xml = runner.test(
+        shards=4,
+        hdl_toplevel_lang=hdl_toplevel_lang,
+        hdl_toplevel=hdl_toplevel,
+        gpi_interfaces=gpi_interfaces,
+        test_module=module_name,
+        test_args=sim_args,
+        build_dir=sim_build,
+        timescale=None if sim in ("xcelium",) else timescale,
+    )
+
+    assert not list(results_xml.parent.glob(f"{results_xml.stem}.shard*"))
+    # each process ran in its own directory
+    assert sorted(path.name for path in results_xml.parent.glob("shard*")) == [
+        f"shard{index}" for index in range(4)
+    ]
@@ -50,3 +50,48 @@ def test_parametrize_bad_args():
         cocotb.parametrize((("not valid", "valid"), [(1, 2), (3, 4)]))
     with pytest.raises(ValueError):
         cocotb.parametrize((("a", "b"), [(1, 2, "too", "many", "args"), (3, 4)]))
+
+
+def test_parametrize_sample() -> None:
+    @cocotb.test(name="my_test", sample=5)
+    @cocotb.parametrize(a=range(10), b=["x", "y"], c=range(10))
+    async def my_test(dut, a, b, c): ...
+
+    all_names = [
+        f"my_test/a={a}/b={b}/c={c}" for a in range(10) for b in "xy" for c in range(10)
+    ]
+    tests = list(my_test.generate_tests())
+    names = [test.name for test in tests]
+    assert len(names) == 5
+    # picked in the order they would be generated in, with the values in their names
+    assert names == sorted(names, key=all_names.index)
+    for test in tests:
+        a, b, c = test.kwargs["a"], test.kwargs["b"], test.kwargs["c"]
+        assert test.name == f"my_test/a={a}/b={b}/c={c}"
+
+    # the same seed picks the same tests
+    assert [test.name for test in my_test.generate_tests()] == names
+    other_seed = [test.name for _, test in my_test._generate_tests(seed=4321)]
+    assert other_seed != names
+
+    my_test.sample = 1000
+    assert [test.name for test in my_test.generate_tests()] == all_names
+
+    with pytest.raises(ValueError):
+        cocotb.test(sample=0)
+
+
+def test_parametrize_sample_huge() -> None:
+    # 100**12 combinations, more than random.sample() can pick from
+    options = {f"o{i}": range(100) for i in range(12)}
+
+    @cocotb.test(name="huge", sample=3)
+    @cocotb.parametrize(**options)
+    async def huge(dut, **kwargs): ...
+
+    tests = list(huge.generate_tests())
+    assert len({test.name for test in tests}) == 3
+    for test in tests:
+        assert test.name == "huge" + "".join(
+            f"/o{i}={test.kwargs[f'o{i}']}" for i in range(12)
+        )
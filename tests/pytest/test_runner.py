@@ -13,9 +13,11 @@ import pytest
 import cocotb
 from cocotb.triggers import Timer
 from cocotb.types import Logic, LogicArray
+from cocotb_tools.check_results import get_results
 from cocotb_tools.runner import (
     VHDL,
     _as_tcl_value,
+    _stop_simulators,
     as_sv_literal,
     as_vhdl_literal,
     get_runner,
@@ -105,6 +107,15 @@ async def cocotb_runner_test(dut):
     assert len(dut.data_out) == WIDTH_OUT
 
 
+@cocotb.test()
+async def cocotb_reuse_simulator_test(dut):
+    await Timer(1, "ns")
+
+    # tell test_reuse_simulator which process ran the test
+    results_file = Path(os.environ["COCOTB_RESULTS_FILE"])
+    results_file.with_suffix(".pid").write_text(str(os.getpid()))
+
+
 @pytest.mark.parametrize(
     "parameters", [{"WIDTH_IN": "8", "WIDTH_OUT": "16"}, {"WIDTH_IN": "16"}]
 )
@@ -171,6 +182,44 @@ def test_runner(parameters, pre_cmd, clean_build):
         assert (build_dir / "clean_test_file").is_file()
 
 
+def test_reuse_simulator(tmp_path):
+    hdl_toplevel_lang = os.getenv("TOPLEVEL_LANG", "verilog")
+    if hdl_toplevel_lang == "verilog":
+        sources = [runner_design_dir / "runner.sv"]
+        gpi_interfaces = ["vpi"]
+    else:
+        sources = [runner_design_dir / "runner.vhdl"]
+        gpi_interfaces = [os.getenv("VHDL_GPI_INTERFACE", None)]
+
+    runner = get_runner(sim)
+    runner.build(
+        sources=sources,
+        hdl_toplevel="runner",
+        defines={"DEFINE": 4, "DEFINE_STR": string_define_value},
+        includes=[basic_hierarchy_module_dir],
+        build_args=[VHDL("-v93")] if sim == "xcelium" else [],
+        build_dir=sim_build / "test_reuse_simulator",
+    )
+
+    pids = []
+    try:
+        for name in ("first", "second"):
+            results_file = runner.test(
+                hdl_toplevel="runner",
+                test_module="test_runner",
+                testcase="cocotb_reuse_simulator_test",
+                gpi_interfaces=gpi_interfaces,
+                results_xml=str(tmp_path / f"{name}.xml"),
+                reuse_simulator=True,
+            )
+            assert get_results(results_file) == (1, 0)
+            pids.append(results_file.with_suffix(".pid").read_text())
+    finally:
+        _stop_simulators()
+
+    assert pids[0] == pids[1]
+
+
 def test_missing_libpython(monkeypatch):
     hdl_toplevel_lang = os.getenv("TOPLEVEL_LANG", "verilog")
     if hdl_toplevel_lang == "verilog":
@@ -216,3 +265,41 @@ def test_missing_libpython(monkeypatch):
             gpi_interfaces=gpi_interfaces,
             extra_env=sim_params,
         )
+
+
+def test_build_error_lines(tmp_path):
+    hdl_toplevel_lang = os.getenv("TOPLEVEL_LANG", "verilog")
+    if hdl_toplevel_lang == "verilog":
+        source = tmp_path / "broken.sv"
+        source.write_text("module broken;\n  not_a_module inst ( ;\nendmodule\n")
+    else:
+        source = tmp_path / "broken.vhdl"
+        source.write_text("entity broken is\nend entity\n")
+
+    sim_runner = get_runner(sim)
+    if sim_runner._error_re is None:
+        pytest.skip(f"{sim} output isn't scanned for errors")
+
+    shown = []
+
+    def output_filter(line):
+        shown.append(line)
+        return line
+
+    sim_runner.output_filter = output_filter
+    log_file = tmp_path / "build.log"
+
+    with pytest.raises(RuntimeError) as excinfo:
+        sim_runner.build(
+            sources=[source],
+            hdl_toplevel="broken",
+            build_dir=tmp_path / "sim_build",
+            log_file=log_file,
+            always=True,
+        )
+
+    # the error lines reported by the simulator explain the failure
+    error_lines = str(excinfo.value).splitlines()[1:]
+    assert error_lines
+    assert all(line + "\n" in shown for line in error_lines)
+    assert sorted(log_file.read_text().splitlines(keepends=True)) == sorted(shown)
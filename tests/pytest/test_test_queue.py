@@ -0,0 +1,42 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for sharing tests between simulator processes."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+from cocotb._test_queue import TestQueue, load_durations
+
+RESULTS = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites name="results">
+  <testsuite name="all" package="all">
+    <testcase name="test_short" classname="test_module" time="0.5" />
+    <testcase name="test_long" classname="test_module" time="12.25" />
+  </testsuite>
+</testsuites>
+"""
+
+
+def test_claim(tmp_path: Path) -> None:
+    queue = TestQueue(tmp_path, {})
+    other = TestQueue(tmp_path, {})
+    assert queue.claim("test_module.test_a")
+    assert not other.claim("test_module.test_a")
+    assert not queue.claim("test_module.test_a")
+    assert other.claim("test_module.test_b")
+
+
+def test_durations(tmp_path: Path) -> None:
+    results_file = tmp_path / "results.xml"
+    results_file.write_text(RESULTS)
+    queue = TestQueue(tmp_path, load_durations(results_file))
+    assert queue.duration("test_module.test_short") == 0.5
+    assert queue.duration("test_module.test_long") == 12.25
+    assert queue.duration("test_module.test_new") == math.inf
+
+    assert load_durations(tmp_path / "missing.xml") == {}
+    results_file.write_text("not xml")
+    assert load_durations(results_file) == {}
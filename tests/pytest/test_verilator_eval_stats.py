@@ -0,0 +1,75 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests that Verilator skips evaluating the model at time steps where nothing changed."""
+
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+from test_cocotb import hdl_toplevel, sim, sim_build, sources, tests_dir
+
+import cocotb
+from cocotb.triggers import Timer
+from cocotb_tools.check_results import get_results
+from cocotb_tools.runner import get_runner
+
+sys.path.insert(0, str(tests_dir / "pytest"))
+test_module = Path(__file__).stem
+
+steps = 100
+
+
+@cocotb.test
+async def idle(dut):
+    for _ in range(steps):
+        await Timer(10, unit="ns")
+
+
+@cocotb.test
+async def writing(dut):
+    for value in range(steps):
+        dut.stream_in_data.value = value % 256
+        await Timer(10, unit="ns")
+
+
+@pytest.mark.simulator_required
+@pytest.mark.skipif(
+    sim != "verilator",
+    reason="Skipping test because it is only for the Verilator simulator",
+)
+def test_verilator_eval_stats(tmp_path):
+    build_dir = sim_build / "test_verilator_eval_stats"
+    runner = get_runner(sim)
+    runner.build(
+        sources=sources,
+        hdl_toplevel=hdl_toplevel,
+        build_dir=build_dir,
+    )
+
+    skipped = {}
+    for testcase in ("idle", "writing"):
+        log_file = tmp_path / f"{testcase}.log"
+        results_file = runner.test(
+            hdl_toplevel=hdl_toplevel,
+            test_module=test_module,
+            testcase=testcase,
+            build_dir=build_dir,
+            test_args=["--eval-stats"],
+            log_file=log_file,
+        )
+        assert get_results(results_file) == (1, 0)
+        match = re.search(
+            r"Verilator eval stats: \d+ evals in (\d+) time steps \((\d+) skipped",
+            log_file.read_text(),
+        )
+        assert match is not None
+        assert int(match.group(1)) > steps
+        skipped[testcase] = int(match.group(2))
+
+    # only the time steps of the regression itself, not of the test, write nothing
+    assert skipped["idle"] >= steps
+    assert skipped["writing"] < steps // 10
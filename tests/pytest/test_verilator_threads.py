@@ -0,0 +1,54 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for Verilator models built with several threads."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from test_cocotb import hdl_toplevel, sim, sim_build, sources, tests_dir
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import ClockCycles
+from cocotb_tools.check_results import get_results
+from cocotb_tools.runner import get_runner
+
+sys.path.insert(0, str(tests_dir / "pytest"))
+test_module = Path(__file__).stem
+
+
+@cocotb.test
+async def registered_stream(dut):
+    Clock(dut.clk, 10, unit="ns").start()
+    for value in (0x12, 0x34):
+        dut.stream_in_data.value = value
+        await ClockCycles(dut.clk, 2)
+        assert dut.stream_out_data_registered.value == value
+
+
+@pytest.mark.simulator_required
+@pytest.mark.skipif(
+    sim != "verilator",
+    reason="Skipping test because it is only for the Verilator simulator",
+)
+def test_verilator_threads():
+    build_dir = sim_build / "test_verilator_threads"
+    runner = get_runner(sim)
+    runner.build(
+        clean=True,
+        sources=sources,
+        hdl_toplevel=hdl_toplevel,
+        build_dir=build_dir,
+        threads=2,
+    )
+
+    results_file = runner.test(
+        hdl_toplevel=hdl_toplevel,
+        test_module=test_module,
+        build_dir=build_dir,
+    )
+    assert get_results(results_file) == (1, 0)
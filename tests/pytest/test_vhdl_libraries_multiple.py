@@ -65,3 +65,49 @@ def test_toplevel_library():
         test_module="test_abcde",
         gpi_interfaces=gpi_interfaces,
     )
+
+
+@pytest.mark.skipif(
+    os.getenv("TOPLEVEL_LANG", "vhdl") != "vhdl",
+    reason="Skipping test since only VHDL is supported",
+)
+@pytest.mark.skipif(
+    os.getenv("SIM", "ghdl") not in ["ghdl", "nvc", "questa", "riviera"],
+    reason="Skipping test since only GHDL, NVC, Questa/ModelSim, and Riviera are supported",
+)
+def test_build_libraries():
+    vhdl_gpi_interfaces = os.getenv("VHDL_GPI_INTERFACE", None)
+    gpi_interfaces = [vhdl_gpi_interfaces]
+
+    sim = os.getenv("SIM", "ghdl")
+    runner = get_runner(sim)
+
+    build_dir = str(src_path / "sim_build" / "pytest_build_libraries")
+
+    # Listed in an order which doesn't match the dependencies between the libraries
+    runner.build_libraries(
+        [
+            {
+                "hdl_library": f"{lib}lib",
+                "sources": [src_path / f"{lib}.vhdl"],
+                "build_dir": build_dir,
+                "clean": True,
+            }
+            for lib in ["b", "c", "d", "e"]
+        ]
+        + [
+            {
+                "hdl_library": "alib",
+                "sources": [src_path / "a.vhdl"],
+                "hdl_toplevel": "a",
+                "build_dir": build_dir,
+            }
+        ]
+    )
+
+    runner.test(
+        hdl_toplevel="a",
+        hdl_toplevel_library="alib",
+        test_module="test_abcde",
+        gpi_interfaces=gpi_interfaces,
+    )
@@ -0,0 +1,56 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests that all tests start from the state the checkpoint test leaves.
+
+With Verilator, the model is built with ``--savable``, so the state is restored before each test.
+Other simulators can't save their state, so the tests run one after another.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.simtime import get_sim_time
+from cocotb.triggers import ClockCycles, Timer
+
+savable = cocotb.SIM_NAME.lower().startswith("verilator")
+
+checkpoint_runs = 0
+checkpoint_time = 0
+
+
+# In an earlier stage than the checkpoint, to show the checkpoint runs first anyway.
+@cocotb.test(stage=-1)
+async def test_early(dut: Any) -> None:
+    assert checkpoint_runs == 1
+    assert dut.stream_out_data_registered.value == 0x5A
+    # later tests only start at the checkpoint time if it is restored
+    await Timer(50, unit="ns")
+
+
+@cocotb.test(checkpoint=True, stage=1)
+async def test_reset(dut: Any) -> None:
+    global checkpoint_runs, checkpoint_time
+    checkpoint_runs += 1
+    dut.stream_in_data.value = 0x5A
+    Clock(dut.clk, 10, unit="ns").start()
+    await ClockCycles(dut.clk, 2)
+    checkpoint_time = get_sim_time("ns")
+
+
+@cocotb.parametrize(value=[0x12, 0x34])
+@cocotb.test
+async def test_from_checkpoint(dut: Any, value: int) -> None:
+    # the checkpoint isn't repeated
+    assert checkpoint_runs == 1
+    if savable:
+        # the time and the state of the design are rolled back
+        assert get_sim_time("ns") < checkpoint_time + 10
+        assert dut.stream_out_data_registered.value == 0x5A
+    dut.stream_in_data.value = value
+    Clock(dut.clk, 10, unit="ns").start()
+    await ClockCycles(dut.clk, 2)
+    assert dut.stream_out_data_registered.value == value
@@ -0,0 +1,141 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Tests for cocotb.drive_on
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer
+from cocotb.types import LogicArray
+
+
+@cocotb.test
+async def test_driver_writes_rows(dut) -> None:
+    """Test that one row is written per edge, across chunk refills."""
+    Clock(dut.clk, 10, "ns").start()
+    dut.stream_in_data.value = 0
+    dut.stream_in_int.value = 0
+    await FallingEdge(dut.clk)
+
+    n_rows = 10
+    stimulus = ((i, -i) for i in range(n_rows))
+    driver = cocotb.drive_on(
+        RisingEdge(dut.clk),
+        [dut.stream_in_data, dut.stream_in_int],
+        stimulus,
+        chunk_size=3,
+    )
+    assert driver.signals == (dut.stream_in_data, dut.stream_in_int)
+    assert driver.pending == 3
+
+    seen: list[Any] = []
+    for _ in range(n_rows):
+        await RisingEdge(dut.clk)
+        await ReadOnly()
+        seen.append((dut.stream_in_data.value, dut.stream_in_int.value))
+    assert seen == [(i, -i) for i in range(n_rows)]
+
+    # the last row was written at the last edge
+    assert driver.done()
+    await driver.wait()
+
+    # the last value is held
+    await RisingEdge(dut.clk)
+    await ReadOnly()
+    assert dut.stream_in_data.value == n_rows - 1
+
+
+@cocotb.test
+async def test_driver_values(dut) -> None:
+    """Test that rows accept the same value types as the value setter."""
+    Clock(dut.clk, 10, "ns").start()
+    await FallingEdge(dut.clk)
+
+    stimulus = [("1010_0101", 1.5), (LogicArray("XXXX1111"), 2.0), (255, 0.25)]
+    driver = cocotb.drive_on(
+        FallingEdge(dut.clk), [dut.stream_in_data, dut.stream_in_real], stimulus
+    )
+    seen: list[Any] = []
+    for _ in stimulus:
+        await FallingEdge(dut.clk)
+        await ReadOnly()
+        seen.append((str(dut.stream_in_data.value), dut.stream_in_real.value))
+    await driver.wait()
+    assert seen == [("10100101", 1.5), ("XXXX1111", 2.0), ("11111111", 0.25)]
+
+
+@cocotb.test
+async def test_driver_stop(dut) -> None:
+    """Test that stopping a driver leaves the remaining stimulus unwritten."""
+    Clock(dut.clk, 10, "ns").start()
+    dut.stream_in_data.value = 0
+    await FallingEdge(dut.clk)
+
+    driver = cocotb.drive_on(RisingEdge(dut.clk), [dut.stream_in_data], [(1,), (2,)])
+    await FallingEdge(dut.clk)
+    driver.stop()
+    await Timer(20, "ns")
+    assert dut.stream_in_data.value == 1
+    assert not driver.done()
+
+
+@cocotb.test
+async def test_driver_stop_immediately(dut) -> None:
+    """Test that a driver stopped before its task runs writes nothing."""
+    Clock(dut.clk, 10, "ns").start()
+    dut.stream_in_data.value = 0
+    await FallingEdge(dut.clk)
+
+    driver = cocotb.drive_on(RisingEdge(dut.clk), [dut.stream_in_data], [(1,), (2,)])
+    driver.stop()
+    await Timer(30, "ns")
+    assert dut.stream_in_data.value == 0
+    assert driver.pending == 2
+    assert not driver.done()
+
+
+@cocotb.test
+async def test_driver_errors(dut) -> None:
+    """Test invalid uses of StimulusDriver."""
+    with pytest.raises(ValueError):
+        cocotb.StimulusDriver(
+            RisingEdge(dut.clk), [dut.stream_in_data], [], chunk_size=0
+        )
+
+    with pytest.raises(TypeError):
+        cocotb.StimulusDriver(RisingEdge(dut.clk), [dut], [])
+
+    driver = cocotb.StimulusDriver(RisingEdge(dut.clk), [dut.stream_in_data], [])
+    with pytest.raises(RuntimeError):
+        driver.stop()
+    driver.start()
+    assert driver.done()
+    with pytest.raises(RuntimeError):
+        driver.start()
+
+    # bad rows in the first chunk are reported by start()
+    with pytest.raises(ValueError):
+        cocotb.drive_on(RisingEdge(dut.clk), [dut.stream_in_data], [(256,)])
+    with pytest.raises(ValueError):
+        cocotb.drive_on(RisingEdge(dut.clk), [dut.stream_in_data], [(1, 2)])
+
+
+@cocotb.test(expect_error=ValueError)
+async def test_driver_error_in_refill(dut) -> None:
+    """Test that an error in a later chunk fails the test."""
+    Clock(dut.clk, 10, "ns").start()
+
+    def stimulus():
+        yield (1,)
+        raise ValueError("bad stimulus")
+
+    cocotb.drive_on(RisingEdge(dut.clk), [dut.stream_in_data], stimulus(), chunk_size=1)
+    await Timer(50, "ns")
@@ -11,14 +11,23 @@ import logging
 import os
 import pickle
 import random
+from array import array
 from typing import Any
 
 import pytest
 
 import cocotb
 import cocotb.clock
+import cocotb.handle
 import cocotb.triggers
-from cocotb.handle import Immediate, StringObject
+from cocotb.handle import (
+    HierarchyArrayObject,
+    HierarchyObject,
+    Immediate,
+    LogicArrayObject,
+    StringObject,
+)
+from cocotb.simulator import get_handle_stats
 from cocotb.triggers import FallingEdge, Timer, ValueChange
 from cocotb.types import Logic, LogicArray
 from cocotb_tools.sim_versions import RivieraVersion
@@ -484,3 +493,107 @@ async def test_edge_on_vectors(dut: Any) -> None:
     # Test that edges on 1-bit signal don't raise an error
     await cocotb.triggers.RisingEdge(dut.one_bit_vector)
     await cocotb.triggers.FallingEdge(dut.one_bit_vector)
+
+
+@cocotb.test
+async def test_discover_filtered(dut: Any) -> None:
+    """Test discovering only the children with matching names and types."""
+    found = dut._discover(pattern="stream_in_*")
+    assert "stream_in_data" in found
+    assert all(name.startswith("stream_in_") for name in found)
+    assert found["stream_in_data"] is dut.stream_in_data
+    assert not dut._discovered
+
+    found = dut._discover(pattern="stream_*", types={cocotb.simulator.LOGIC_ARRAY})
+    assert "stream_in_data" in found
+    assert "stream_out_data_registered" in found
+    assert all(isinstance(hdl, LogicArrayObject) for hdl in found.values())
+
+    assert dut._discover(pattern="no_such_signal_*") == {}
+
+
+@cocotb.test
+async def test_discover_tree(dut: Any) -> None:
+    """Test discovering the whole hierarchy below an object in one GPI call."""
+    things, packed_parents = dut._handle.scan()
+    parents = array("i", packed_parents)
+    assert len(parents) == len(things)
+    # parents come before their children
+    assert all(-1 <= parent < pos for pos, parent in enumerate(parents))
+
+    top = HierarchyObject(dut._handle, dut._path)
+    top._discover_tree()
+    assert set(top._keys()) == set(dut._keys())
+    assert dut.stream_in_data in top._values()
+
+    def check_discovered(hdl: HierarchyObject | HierarchyArrayObject[Any]) -> None:
+        assert hdl._discovered
+        for child in hdl._sub_handles.values():
+            if isinstance(child, (HierarchyObject, HierarchyArrayObject)):
+                check_discovered(child)
+
+    check_discovered(top)
+
+
+@cocotb.test
+async def test_handle_stats(dut: Any) -> None:
+    """Test that the GPI handle store deduplicates handles and interns names."""
+    before = get_handle_stats()
+    assert before["handles"] > 0
+
+    # Discovering the same object twice yields one unique handle.
+    dut._discover_all()
+    after_discover = get_handle_stats()
+    dut._sub_handles.clear()
+    dut._discovered = False
+    dut._discover_all()
+    assert get_handle_stats() == after_discover
+    assert after_discover["handles"] >= before["handles"]
+    assert after_discover["fullname_bytes"] > after_discover["name_bytes"]
+
+
+@cocotb.test
+async def test_handle_slots(dut: Any) -> None:
+    """Test that simulation objects don't have a __dict__ and can't get new attributes."""
+    sig = dut.stream_in_data
+    assert not hasattr(sig, "__dict__")
+    assert not hasattr(dut, "__dict__")
+    with pytest.raises(AttributeError):
+        sig.some_attribute = 1
+    # metadata is fetched together and cached
+    assert sig._get_info() is sig._get_info()
+    assert sig._get_info().name == sig._name
+    assert len(sig) == len(sig.range)
+
+
+@cocotb.test
+async def test_attribute_cache(dut: Any) -> None:
+    """Test that children accessed as attributes are cached."""
+    sig = dut.stream_in_data
+    assert dut._sub_handles["stream_in_data"] is sig
+    assert dut.stream_in_data is sig
+    with pytest.raises(AttributeError):
+        dut.stream_in_data = 1
+    with pytest.raises(AttributeError):
+        dut.does_not_exist  # noqa: B018
+    assert "does_not_exist" not in dut._sub_handles
+
+
+@cocotb.test
+async def test_lookup(dut: Any) -> None:
+    """Test looking up objects by path with _lookup()."""
+    assert dut._lookup("stream_in_data") is dut.stream_in_data
+    assert dut._lookup("array_7_downto_4[5]") is dut.array_7_downto_4[5]
+    assert dut._lookup("array_7_downto_4[5]") is dut._lookup("array_7_downto_4[5]")
+    with pytest.raises(KeyError):
+        dut._lookup("does_not_exist")
+    with pytest.raises(IndexError):
+        dut._lookup("array_7_downto_4[100]")
+    with pytest.raises(ValueError):
+        dut._lookup("stream_in_data..x")
+
+    # forgotten when a child created from the hierarchy index is dropped
+    assert "stream_in_data" in dut._lookups
+    cocotb.handle._clear_lookups()
+    assert not dut._lookups
+    assert dut._lookup("stream_in_data") is dut.stream_in_data
@@ -2,7 +2,8 @@
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
 """
-Tests relating to cocotb.queue.Queue, cocotb.queue.LifoQueue, cocotb.queue.PriorityQueue
+Tests relating to cocotb.queue.Queue, cocotb.queue.LifoQueue, cocotb.queue.PriorityQueue,
+cocotb.queue.Broadcast
 """
 
 from __future__ import annotations
@@ -10,7 +11,14 @@ from __future__ import annotations
 import pytest
 
 import cocotb
-from cocotb.queue import LifoQueue, PriorityQueue, Queue, QueueEmpty, QueueFull
+from cocotb.queue import (
+    Broadcast,
+    LifoQueue,
+    PriorityQueue,
+    Queue,
+    QueueEmpty,
+    QueueFull,
+)
 from cocotb.triggers import NullTrigger, gather
 
 
@@ -276,3 +284,100 @@ async def test_str_and_repr(_):
     s = repr(q)
     assert "_getters" not in s
     assert str(q)[:-1] in s
+
+
+@cocotb.test
+async def test_broadcast_nonblocking(_):
+    channel = Broadcast[int](maxsize=3)
+
+    # items put without receivers are dropped
+    channel.put_nowait(100)
+    assert channel.empty()
+
+    a = channel.subscribe()
+    b = channel.subscribe()
+    assert channel.receivers == 2
+
+    for k in range(3):
+        channel.put_nowait(k)
+    assert channel.full()
+    with pytest.raises(QueueFull):
+        channel.put_nowait(3)
+
+    # every receiver sees every item, in order
+    assert [a.get_nowait() for _ in range(3)] == [0, 1, 2]
+    assert a.empty()
+    with pytest.raises(QueueEmpty):
+        a.get_nowait()
+
+    # items are held until the slowest receiver has retrieved them
+    assert channel.qsize() == 3
+    assert b.get_nowait() == 0
+    assert channel.qsize() == 2
+
+    # late subscribers only see new items
+    c = channel.subscribe()
+    assert c.empty()
+    channel.put_nowait(3)
+    assert c.get_nowait() == 3
+    assert a.get_nowait() == 3
+    assert b.qsize() == 3
+
+    # unsubscribing releases the items the receiver hadn't retrieved
+    b.unsubscribe()
+    assert channel.receivers == 2
+    assert channel.empty()
+    with pytest.raises(RuntimeError):
+        b.get_nowait()
+
+
+@cocotb.test
+async def test_broadcast_blocking(_):
+    NUM_ITEMS = 20
+
+    channel = Broadcast[int](maxsize=2)
+    receivers = [channel.subscribe() for _ in range(4)]
+    results: list[list[int]] = [[] for _ in receivers]
+
+    async def getter(rx, lst):
+        for _ in range(NUM_ITEMS):
+            lst.append(await rx.get())
+
+    async def putter():
+        for k in range(NUM_ITEMS):
+            await channel.put(k)
+
+    getters = [cocotb.start_soon(getter(*a)) for a in zip(receivers, results)]
+    await putter()
+    await gather(*getters)
+
+    assert results == [list(range(NUM_ITEMS))] * len(receivers)
+    assert channel.empty()
+
+
+@cocotb.test
+async def test_broadcast_unsubscribe_wakes_getter(_):
+    channel = Broadcast[int]()
+    rx = channel.subscribe()
+
+    getter = cocotb.start_soon(rx.get())
+    await NullTrigger()
+    rx.unsubscribe()
+
+    with pytest.raises(RuntimeError):
+        await getter
+
+
+@cocotb.test
+async def test_broadcast_unsubscribe_wakes_all_putters(_):
+    channel = Broadcast[int](maxsize=1)
+    rx = channel.subscribe()
+    channel.put_nowait(0)
+
+    putters = [cocotb.start_soon(channel.put(k)) for k in (1, 2)]
+    await NullTrigger()
+    rx.unsubscribe()
+
+    # both items are dropped without receivers, and neither putter is left blocked
+    await gather(*putters)
+    assert channel.empty()
@@ -0,0 +1,123 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Tests for cocotb.sample_on
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import Event, FallingEdge, ReadOnly, RisingEdge, Timer
+from cocotb.utils import get_sim_time
+
+
+@cocotb.test
+async def test_sampler_matches_value(dut) -> None:
+    """Test that sampled values are what a ReadOnly monitor sees."""
+    Clock(dut.clk, 10, "ns").start()
+    dut.stream_in_data.value = 0
+    await FallingEdge(dut.clk)
+
+    batches: list[list[Any]] = []
+    expected: list[Any] = []
+
+    async def monitor() -> None:
+        while True:
+            await RisingEdge(dut.clk)
+            await ReadOnly()
+            expected.append(
+                (get_sim_time("step"), (dut.stream_in_data.value, dut.clk.value))
+            )
+
+    monitor_task = cocotb.start_soon(monitor())
+    sampler = cocotb.sample_on(
+        RisingEdge(dut.clk), [dut.stream_in_data, dut.clk], batches.append, batch_size=4
+    )
+    assert sampler.signals == (dut.stream_in_data, dut.clk)
+
+    for i in range(10):
+        dut.stream_in_data.value = i
+        await FallingEdge(dut.clk)
+
+    # 10 samples in batches of 4, with the last 2 still buffered
+    assert [len(b) for b in batches] == [4, 4]
+    assert sampler.pending == 2
+    sampler.stop()
+    monitor_task.cancel()
+    await Timer(1, "ns")
+
+    assert [len(b) for b in batches] == [4, 4, 2]
+    samples = [s for b in batches for s in b]
+    assert samples == expected
+    assert [data for _, (data, _) in samples] == list(range(10))
+
+
+@cocotb.test
+async def test_sampler_flush_on(dut) -> None:
+    """Test that setting the flush_on Event passes buffered samples to the sink."""
+    Clock(dut.clk, 10, "ns").start()
+    await FallingEdge(dut.clk)
+
+    samples: list[Any] = []
+    flush = Event()
+    sampler = cocotb.sample_on(
+        RisingEdge(dut.clk),
+        [dut.stream_in_int, dut.stream_in_real],
+        samples.extend,
+        flush_on=flush,
+        raw=True,
+    )
+
+    dut.stream_in_int.value = 7
+    dut.stream_in_real.value = 1.5
+    await FallingEdge(dut.clk)
+    await FallingEdge(dut.clk)
+    assert samples == []
+
+    flush.set()
+    await Timer(1, "ns")
+    assert not flush.is_set()
+    assert [values for _, values in samples] == [(7, 1.5), (7, 1.5)]
+
+    sampler.stop()
+
+
+@cocotb.test
+async def test_sampler_stop_immediately(dut) -> None:
+    """Test that a sampler stopped before its task runs samples nothing more."""
+    Clock(dut.clk, 10, "ns").start()
+    await FallingEdge(dut.clk)
+
+    samples: list[Any] = []
+    sampler = cocotb.sample_on(
+        RisingEdge(dut.clk), [dut.stream_in_data], samples.extend, batch_size=1
+    )
+    sampler.stop()
+    for _ in range(3):
+        await FallingEdge(dut.clk)
+    assert samples == []
+    assert sampler.pending == 0
+
+
+@cocotb.test
+async def test_sampler_errors(dut) -> None:
+    """Test invalid uses of Sampler."""
+    with pytest.raises(ValueError):
+        cocotb.Sampler(RisingEdge(dut.clk), [dut.stream_in_data], print, batch_size=0)
+
+    with pytest.raises(TypeError):
+        cocotb.Sampler(RisingEdge(dut.clk), [dut], print)
+
+    sampler = cocotb.Sampler(RisingEdge(dut.clk), [dut.stream_in_data], print)
+    with pytest.raises(RuntimeError):
+        sampler.stop()
+    sampler.start()
+    with pytest.raises(RuntimeError):
+        sampler.start()
+    sampler.stop()
@@ -2,7 +2,7 @@
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
 """
-Tests for synchronization primitives like Lock and Event
+Tests for synchronization primitives like Lock, Semaphore, and Event
 """
 
 from __future__ import annotations
@@ -18,10 +18,12 @@ import cocotb
 from cocotb._base_triggers import Trigger, _InternalEvent
 from cocotb.task import Task
 from cocotb.triggers import (
+    BoundedSemaphore,
     Event,
     Lock,
     NullTrigger,
     ReadOnly,
+    Semaphore,
     Timer,
     with_timeout,
 )
@@ -267,3 +269,111 @@ async def test_Event_wait_after_set(_: Any) -> None:
 
     # Should not block
     await with_timeout(trigger, 1, "step")
+
+
+@cocotb.test
+async def test_Lock_direct_handoff(_) -> None:
+    """Test that release() hands the Lock to the next waiter, skipping cancelled ones."""
+    lock = Lock()
+    order: list[int] = []
+
+    async def waiter(n: int) -> None:
+        async with lock:
+            order.append(n)
+            await NullTrigger()
+
+    # uncontended acquisition does not yield
+    async with lock:
+        assert lock.locked()
+        tasks = [cocotb.start_soon(waiter(i)) for i in range(5)]
+        await NullTrigger()
+        assert re.match(r"<Lock \[5 waiting\] at \w+>", repr(lock))
+        tasks[1].cancel()
+        tasks[3].cancel()
+        assert re.match(r"<Lock \[3 waiting\] at \w+>", repr(lock))
+
+    # ownership went straight to the first waiter
+    assert lock.locked()
+    for t in tasks:
+        if not t.cancelled():
+            await t
+
+    assert order == [0, 2, 4]
+    assert not lock.locked()
+
+
+@cocotb.test
+async def test_Semaphore(_) -> None:
+    """Test that Semaphore limits concurrency and hands off permits in FIFO order."""
+    sem = Semaphore(2)
+    active = 0
+    max_active = 0
+    order: list[int] = []
+
+    async def worker(n: int) -> None:
+        nonlocal active, max_active
+        async with sem:
+            order.append(n)
+            active += 1
+            max_active = max(max_active, active)
+            await NullTrigger()
+            await NullTrigger()
+            active -= 1
+
+    tasks = [cocotb.start_soon(worker(i)) for i in range(10)]
+    for t in tasks:
+        await t
+
+    assert max_active == 2
+    assert order == list(range(10))
+    assert not sem.locked()
+    assert re.match(r"<Semaphore \[value=2, 0 waiting\] at \w+>", repr(sem))
+
+
+@cocotb.test
+async def test_Semaphore_acquire_trigger(_) -> None:
+    """Test Semaphore.acquire() and release() used directly."""
+    sem = Semaphore(0)
+    assert sem.locked()
+
+    acquired = False
+
+    async def waiter() -> None:
+        nonlocal acquired
+        await sem.acquire()
+        acquired = True
+
+    task = cocotb.start_soon(waiter())
+    await NullTrigger()
+    assert not acquired
+
+    sem.release()
+    await task
+    assert acquired
+    # the permit was handed directly to the waiter
+    assert sem.locked()
+
+    sem.release()
+    sem.release()
+    assert not sem.locked()
+    await sem.acquire()
+    await sem.acquire()
+    assert sem.locked()
+
+    with pytest.raises(ValueError):
+        Semaphore(-1)
+
+
+@cocotb.test
+async def test_BoundedSemaphore(_) -> None:
+    """Test that BoundedSemaphore errors when released more than acquired."""
+    sem = BoundedSemaphore(2)
+    async with sem:
+        pass
+    with pytest.raises(ValueError):
+        sem.release()
+
+    await sem.acquire()
+    sem.release()
+    with pytest.raises(ValueError):
+        sem.release()
@@ -0,0 +1,103 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Tests for cocotb.trace
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import cocotb
+import cocotb.trace
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
+
+
+@cocotb.test
+async def test_trace_records_changes(dut) -> None:
+    """Test that every value change is recorded with its time."""
+    dut.stream_in_data.value = 0
+    await Timer(1, "ns")
+
+    start = get_sim_time("step")
+    trace = cocotb.trace.record([dut.stream_in_data, dut.stream_out_data_comb])
+    assert trace.signals == (dut.stream_in_data, dut.stream_out_data_comb)
+
+    expected = [(start, 0)]
+    for i in range(1, 4):
+        dut.stream_in_data.value = i
+        expected.append((get_sim_time("step"), i))
+        await Timer(1, "ns")
+    trace.stop()
+
+    # no changes are recorded after stopping
+    dut.stream_in_data.value = 10
+    await Timer(1, "ns")
+
+    for signal in trace.signals:
+        assert [(t, v) for t, _, v in trace.changes(signal)] == expected
+    assert len(trace) == 2 * len(expected)
+    assert list(trace.indices[:2]) == [0, 1]
+    assert trace.values[:2] == ["00000000", "00000000"]
+    assert all(t >= start for t in trace.times)
+
+
+@cocotb.test
+async def test_trace_write_vcd(dut) -> None:
+    """Test writing a trace to a VCD file."""
+    dut.stream_in_data.value = 0
+    dut.stream_in_int.value = 0
+    await Timer(1, "ns")
+
+    trace = cocotb.trace.record([dut.stream_in_data, dut.stream_in_int])
+    dut.stream_in_data.value = 5
+    dut.stream_in_int.value = -1
+    await Timer(1, "ns")
+    trace.stop()
+
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "trace.vcd"
+        trace.write_vcd(path)
+        vcd = path.read_text()
+
+    assert "$enddefinitions $end" in vcd
+    assert f"$scope module {dut._name} $end" in vcd
+    assert "$var wire 8 ! stream_in_data $end" in vcd
+    assert '$var integer 32 " stream_in_int $end' in vcd
+    assert "b00000101 !" in vcd
+    assert f'b{"1" * 32} "' in vcd
+
+
+@cocotb.test
+async def test_trace_stop_immediately(dut) -> None:
+    """Test that a trace stopped before its task runs records nothing more."""
+    dut.stream_in_data.value = 0
+    await Timer(1, "ns")
+
+    trace = cocotb.trace.record([dut.stream_in_data])
+    trace.stop()
+    recorded = len(trace)
+    for i in range(1, 4):
+        dut.stream_in_data.value = i
+        await Timer(1, "ns")
+    assert len(trace) == recorded
+
+
+@cocotb.test
+async def test_trace_errors(dut) -> None:
+    """Test invalid uses of Trace."""
+    with pytest.raises(TypeError):
+        cocotb.trace.Trace([dut])
+
+    trace = cocotb.trace.Trace([dut.stream_in_data])
+    with pytest.raises(RuntimeError):
+        trace.stop()
+    trace.start()
+    with pytest.raises(RuntimeError):
+        trace.start()
+    trace.stop()
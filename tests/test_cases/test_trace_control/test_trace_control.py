@@ -0,0 +1,37 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for starting and stopping traces from Python."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import cocotb
+from cocotb import simulator
+from cocotb.clock import Clock
+from cocotb.simtime import convert
+from cocotb.triggers import ClockCycles
+
+is_verilator = cocotb.SIM_NAME.lower().startswith("verilator")
+
+
+@cocotb.test(skip=not is_verilator)
+async def test_trace_window(dut: Any) -> None:
+    Clock(dut.clk, 10, unit="ns").start()
+    await ClockCycles(dut.clk, 2)
+
+    simulator.trace_start("window.vcd", 0, "", convert(20, "ns", to="step"))
+    await ClockCycles(dut.clk, 6)
+    simulator.trace_stop()
+
+    assert len(list(Path.cwd().glob("window.*.vcd"))) >= 2
+
+
+@cocotb.test(skip=is_verilator)
+async def test_trace_not_implemented(dut: Any) -> None:
+    with pytest.raises(NotImplementedError):
+        simulator.trace_start("window.vcd")